@@ -12,19 +12,31 @@ from mutagen.easyid3 import EasyID3
 
 # --- internal modules ---
 from utils.constants import HISTORY_FILE, USED_CACHE_FILE, ASSETS_DIR, ARTISTS_FILE, VENUES_FILE, CITIES_FILE
-from utils.asset_loader import ensure_asset_files_exist, load_asset_lists
+from utils.asset_loader import ensure_asset_files_exist
+from utils.asset_store import AssetStore
+from utils.usage_stats import UsageStats
+from utils.alias_table import ALIASES
 from utils import theme_manager
-from utils.logger import logger, log_message
+from utils.logger import logger, log_message, start_log_cleanup, stop_logging
 from utils.gui_logger import GuiLogger
+from utils.log_sink import DEFAULT_MAX_LINES, sink_for
+from utils.log_config import apply_levels as apply_log_levels
 from utils.process_thread import process_thread
 from utils.queue_manager import QueueManager
+from utils.queue_journal import QueueJournal
+from utils.folder_scanner import scan_and_infer
+from utils.library_index import LibraryIndex
 from utils.cache_manager import CacheController
 from utils.combobox_utils import update_combobox_values
 from utils.scheme_evaluator import load_schemes_from_ini, apply_schemes_to_processor, SchemeEvaluator
 from gui.build_gui import build_main_gui
 from scheme_editor.scheme_editor import SchemeEditor
-from gui.metadata_gui import handle_tree_selection, populate_tree, on_tree_open
+from gui.metadata_gui import (
+    handle_tree_selection, populate_tree, on_tree_open, reveal_path, refresh_tree_paths, tree_typeahead,
+    PLACEHOLDERS,
+)
 from gui.build_menu import build_menu
+from gui.event_log_viewer import EventLogViewer
 from utils.audio_player import AudioPlayer
 
 # Import sash persistence functions
@@ -59,6 +71,9 @@ class TkTagForge:
         self.gui_logger = GuiLogger()
         self.log_message = self.gui_logger.log  # shorthand log function to GUI logger
 
+        # Delete month-old log files without holding up startup
+        start_log_cleanup()
+
         # Placeholder for log Text widget (will be set by build_main_gui)
         self.log = None
 
@@ -102,6 +117,9 @@ class TkTagForge:
         self.cfg = configparser.ConfigParser(interpolation=None)
         self.cfg.read(self.config_file)
 
+        # Per-module log levels ([LogLevels] in config.ini, adjustable from View > Log Levels)
+        apply_log_levels(self.cfg, log_func=self.gui_logger.buffer)
+
         # Prepare themes folder
         os.makedirs("themes", exist_ok=True)
         self.gui_logger.log("Verified themes folder at: themes", level="debug")
@@ -120,7 +138,24 @@ class TkTagForge:
 
         # Ensure assets
         ensure_asset_files_exist(self.gui_logger.buffer)
-        self.artists_list, self.venues_list, self.cities_list = load_asset_lists(log_callback=self.gui_logger.buffer)
+        self.aliases = ALIASES
+        self.aliases.log = self.gui_logger.log
+        for fname in self.aliases.ensure_files_exist():
+            self.gui_logger.buffer(f"✅ Created empty alias file {fname}.")
+        self.asset_store = AssetStore(log_func=self.gui_logger.log).load()
+        self.artists_list, self.venues_list, self.cities_list = self.asset_store.lists()
+        self.gui_logger.buffer(
+            f"Loaded {len(self.artists_list)} artists, {len(self.venues_list)} venues, "
+            f"{len(self.cities_list)} cities from TXT files."
+        )
+
+        # Folder index behind the search box above the tree
+        self.library_index = LibraryIndex(log_func=self.gui_logger.log)
+        self._library_results = {}
+        self._library_search_job = None
+
+        # Selection counts/recency used to rank dropdown suggestions
+        self.usage_stats = UsageStats(log_func=self.gui_logger.log).load()
 
         # Default scheme evaluator for processor initialization
         def default_evaluate_schemes(metadata):
@@ -137,6 +172,8 @@ class TkTagForge:
             genre_cache=self.genre_cache,
             used_cache=self.used_cache,
             histories=self.histories,
+            asset_store=self.asset_store,
+            aliases=self.aliases,
         )
 
         self.load_schemes_from_config()
@@ -147,11 +184,21 @@ class TkTagForge:
 
         # Attach GUI logger to main log widget and configure color tags for logging
         if self.log:
-            self.gui_logger.attach(self.log)
+            self.gui_logger.attach(
+                self.log, max_lines=self.cfg.getint("Logging", "max_gui_lines", fallback=DEFAULT_MAX_LINES)
+            )
             self._configure_log_tags()
 
+        # Rank autocomplete suggestions by usage; map aliases typed into them
+        for field, cb in self._comboboxes().items():
+            if cb is not None and hasattr(cb, "set_usage_stats"):
+                cb.set_usage_stats(self.usage_stats, field)
+                cb.set_aliases(self.aliases, field)
+
         # Initialize queue manager after GUI is ready
-        self.queue_manager = QueueManager(getattr(self, "queue", None), self.log)
+        self.queue_manager = QueueManager(
+            getattr(self, "queue", None), self.log, journal=QueueJournal(log_func=self.gui_logger.log)
+        )
         self.queue_manager.set_scheme_evaluator(self.processor._evaluate_schemes)
 
         # Debug keypress logging for comboboxes
@@ -179,7 +226,8 @@ class TkTagForge:
         self.cache_controller.load_history()
         self.cache_controller.load_used_cache()
 
-        # Refresh queue UI and combobox dropdowns
+        # Restore the queue from the last session, then refresh queue UI and combobox dropdowns
+        self.queue_manager.restore()
         self.queue_manager.refresh_ui()
         self._update_combobox_values()
 
@@ -193,6 +241,8 @@ class TkTagForge:
         if hasattr(self, "tree") and self.tree:
             self.tree.bind("<<TreeviewOpen>>", lambda e: on_tree_open(self.tree, self.log, e))
             self.tree.bind("<<TreeviewSelect>>", lambda e: handle_tree_selection(self, e))
+            # Type-ahead over every child of a folder, including rows not inserted yet
+            self.tree.bind("<KeyPress>", lambda e: tree_typeahead(self.tree, e))
 
         # Window close event handler
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
@@ -259,8 +309,10 @@ class TkTagForge:
 
     # --- Combobox update ---
     def _update_combobox_values(self):
-        # Reload fresh asset lists from .txt files
-        self.artists_list, self.venues_list, self.cities_list = load_asset_lists()
+        # Pull current snapshots from the in-memory asset store; files are only
+        # re-read if they changed on disk since the store last read or wrote them
+        self.asset_store.refresh()
+        self.artists_list, self.venues_list, self.cities_list = self.asset_store.lists()
 
         update_combobox_values(
             artists_list=self.artists_list,
@@ -273,17 +325,22 @@ class TkTagForge:
             last_format=self.last_format,
             last_genre=self.last_genre,
             last_add=self.last_add,
-            comboboxes_dict={
-                "artist": getattr(self, "c_art", None),
-                "venue": getattr(self, "c_ven", None),
-                "city": getattr(self, "c_city", None),
-                "add": getattr(self, "c_add", None),
-                "source": getattr(self, "c_src", None),
-                "format": getattr(self, "c_fmt", None),
-                "genre": getattr(self, "c_gen", None),
-            },
+            comboboxes_dict=self._comboboxes(),
+            aliases=self.aliases,
         )
 
+    def _comboboxes(self):
+        """Map history/usage field names to their metadata comboboxes."""
+        return {
+            "artist": getattr(self, "c_art", None),
+            "venue": getattr(self, "c_ven", None),
+            "city": getattr(self, "c_city", None),
+            "add": getattr(self, "c_add", None),
+            "source": getattr(self, "c_src", None),
+            "format": getattr(self, "c_fmt", None),
+            "genre": getattr(self, "c_gen", None),
+        }
+
     def load_schemes_from_config(self, log_loaded=True):
         """Load schemes from config.ini, or Default preset if no schemes exist."""
         # First try to load from existing config
@@ -428,16 +485,14 @@ class TkTagForge:
             logger.info(f"Live Preview Output: {live_preview}")
             return
 
-        self.log.config(state="normal")
-
-        # Entire line in orange and bold
-        self.log.insert("end", f"Updated Folder Scheme: {folder_scheme}\n", "folder_scheme_line")
-
-        # Entire line in blue and bold
-        self.log.insert("end", f"Updated Saving Scheme: {saving_scheme}\n", "saving_scheme_line")
-
-        # Label in teal (or another unique color), bold
-        self.log.insert("end", "Live Preview Output: ", "preview_label_teal")
+        parts = [
+            # Entire line in orange and bold
+            (f"Updated Folder Scheme: {folder_scheme}\n", "folder_scheme_line"),
+            # Entire line in blue and bold
+            (f"Updated Saving Scheme: {saving_scheme}\n", "saving_scheme_line"),
+            # Label in teal (or another unique color), bold
+            ("Live Preview Output: ", "preview_label_teal"),
+        ]
 
         # Path coloring (blue + orange split), also bold
         if "/" in live_preview:
@@ -447,15 +502,30 @@ class TkTagForge:
             base_path = live_preview
             current_folder = ""
 
-        self.log.insert("end", base_path, "preview_path_blue")
+        parts.append((base_path, "preview_path_blue"))
         if current_folder:
-            self.log.insert("end", current_folder + "\n", "preview_path_orange")
+            parts.append((current_folder + "\n", "preview_path_orange"))
+        else:
+            parts.append(("\n", None))
+
+        # Queued as one entry so other log lines cannot land in the middle
+        sink = sink_for(self.log)
+        if sink is not None:
+            sink.write_parts(parts)
         else:
-            self.log.insert("end", "\n")
+            for text, tag in parts:
+                self.log.insert("end", text, tag or ())
+            self.log.see("end")
 
-        self.log.config(state="disabled")
-        self.log.see("end")
 
+    def _open_event_log_viewer(self):
+        """Open (or raise) the processing history window over the structured event log."""
+        viewer = getattr(self, "event_log_viewer", None)
+        if viewer is not None and viewer.winfo_exists():
+            viewer.lift()
+            viewer.focus_force()
+            return
+        self.event_log_viewer = EventLogViewer(self.root, log_func=self.gui_logger.log)
 
     def _open_scheme_editor(self):
         def on_scheme_saved(saving_scheme=None, folder_scheme=None, preview_path=None):
@@ -511,11 +581,52 @@ class TkTagForge:
         if path:
             self.root_var.set(path)
             populate_tree(getattr(self, "tree", None), self.log, path)
+            self.library_index.start_scan([path])
 
     def _refresh(self):
         root = self.root_var.get()
         if root and os.path.isdir(root):
             populate_tree(getattr(self, "tree", None), self.log, root)
+            self.library_index.start_scan([root])
+
+    def _refresh_after_batch(self, moves):
+        """Update just the tree levels a processing batch touched, then re-index."""
+        root = self.root_var.get()
+        if not root or not os.path.isdir(root):
+            return
+        tree = getattr(self, "tree", None)
+        if tree is not None and tree.get_children():
+            refresh_tree_paths(tree, self.log, moves)
+        else:
+            populate_tree(tree, self.log, root)
+        self.library_index.start_scan([root])
+
+    # --- Library search ---
+    def _on_library_search_key(self, event=None):
+        if event is not None and event.keysym in ("Return", "Up", "Down", "Escape", "Tab"):
+            return
+        if self._library_search_job is not None:
+            self.root.after_cancel(self._library_search_job)
+        self._library_search_job = self.root.after(150, self._run_library_search)
+
+    def _run_library_search(self):
+        self._library_search_job = None
+        root = self.root_var.get()
+        rows = self.library_index.search(self.library_search.get(), roots=[root] if root else None)
+        self._library_results = {f"{name}  —  {path}": path for name, path, _ in rows}
+        self.library_search["values"] = list(self._library_results)
+
+    def _jump_to_library_result(self, event=None):
+        text = self.library_search.get()
+        path = self._library_results.get(text)
+        if path is None:
+            # Enter on typed text: jump to the best match
+            self._run_library_search()
+            if not self._library_results:
+                self.gui_logger.log(f"No folder matches '{text}'.", level="warn")
+                return
+            path = next(iter(self._library_results.values()))
+        reveal_path(self.tree, self.log, path)
 
     def clear_queue(self):
         self.queue_manager.clear()
@@ -529,12 +640,15 @@ class TkTagForge:
         if not selected_items:
             return
 
+        items = []
         for iid in selected_items:
             values = self.tree.item(iid, "values")
             if not values:
                 continue
 
             folder_path = values[0]
+            if folder_path in PLACEHOLDERS:
+                continue  # "loading" / "more" rows are not folders
             normalized_path = folder_path.replace("\\", "/")
             if normalized_path in self.queue_manager.saved:
                 continue
@@ -558,7 +672,55 @@ class TkTagForge:
                 except Exception as e:
                     logger.error(f"Scheme evaluation error: {e}")
 
-            self.queue_manager.add(normalized_path, proposed_name, meta)
+            items.append((normalized_path, proposed_name, meta))
+
+        self.queue_manager.add_many(items)
+
+    def _scan_and_queue(self):
+        """Find every show folder under the root, infer each one's metadata and queue them all."""
+        root = self.root_var.get()
+        if not root or not os.path.isdir(root):
+            self.gui_logger.log(f"Root folder invalid or missing: {root}", level="error")
+            return
+        if getattr(self, "_scan_running", False):
+            self.gui_logger.log("A scan is already running.", level="warn")
+            return
+        self._scan_running = True
+        self.gui_logger.log(f"Scanning {root} for show folders...")
+
+        # Snapshot the lists on the Tk thread; workers only read them
+        artists, venues, cities = self.asset_store.lists()
+
+        def worker():
+            try:
+                results = scan_and_infer(root, artists, venues, cities, log_func=self.gui_logger.log)
+            except Exception as e:
+                self.gui_logger.log(f"Scan failed: {e}", level="error")
+                results = []
+            self.root.after(0, lambda: self._queue_scanned(results))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _queue_scanned(self, results):
+        self._scan_running = False
+        items = []
+        for folder, md in results:
+            normalized_path = self.normalize_path_slashes(folder)
+            if normalized_path in self.queue_manager.saved:
+                continue
+            meta = dict(md)
+            meta["currentfoldername"] = os.path.basename(normalized_path)
+
+            proposed_name = ""
+            if self.queue_manager.evaluate_schemes_func:
+                try:
+                    proposed_name = self.queue_manager.evaluate_schemes_func(meta)
+                except Exception as e:
+                    logger.error(f"Scheme evaluation error: {e}")
+            items.append((normalized_path, proposed_name, meta))
+
+        added = self.queue_manager.add_many(items)
+        self.gui_logger.log(f"Scan & Queue: queued {len(added)} of {len(results)} show folder(s).")
 
     def _dequeue(self):
         self.queue_manager.remove_selected()
@@ -594,7 +756,7 @@ class TkTagForge:
         ]:
             var = getattr(self, var_name, None)
             if var:
-                val = var.get().strip()
+                val = self.aliases.canonical(key, var.get().strip())
                 if val:
                     self.histories[key].add(val)
 
@@ -616,13 +778,19 @@ class TkTagForge:
         ]:
             var = getattr(self, var_name, None)
             if var:
-                val = var.get().strip()
+                val = self.aliases.canonical(key, var.get().strip())
                 if val:
                     self.histories[key].add(val)
 
         self._save_history()
         self._save_used_cache()
+        self.usage_stats.save()
+        self.queue_manager.compact_journal()
+        if self.asset_store.compact():
+            self.asset_store.save_snapshot()
         self.root.destroy()
+        # Flush queued log records to disk before the interpreter exits
+        stop_logging()
 
 
 def main():
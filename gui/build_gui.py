@@ -7,7 +7,7 @@ import json
 from utils.constants import DEFAULTS, HISTORY_FILE
 from gui.metadata_gui import handle_tree_selection, on_tree_open
 from utils.audio_player import AudioPlayer
-from utils.autocomplete import AutocompleteCombobox
+from utils.autocomplete import AutocompleteCombobox, VirtualAutocompleteCombobox
 from utils.logger import log_message  # Make sure this is imported
 
 
@@ -118,7 +118,7 @@ def build_main_gui(app):
 
     # Row 0: Artist and Date
     tk.Label(meta, text="Artist:").grid(row=0, column=0, sticky="w")
-    self.c_art = AutocompleteCombobox(meta, textvariable=self.artist, width=30, state="normal")
+    self.c_art = VirtualAutocompleteCombobox(meta, textvariable=self.artist, width=30, state="normal")
     self.c_art.set_completion_list(getattr(self, 'artists_list', []))
     self.c_art.grid(row=0, column=1, sticky="w", padx=4)
 
@@ -132,7 +132,7 @@ def build_main_gui(app):
 
     # Row 1: Venue, Genre, Format
     tk.Label(meta, text="Venue:").grid(row=1, column=0, sticky="w")
-    self.c_ven = AutocompleteCombobox(meta, textvariable=self.venue, width=30, state="normal")
+    self.c_ven = VirtualAutocompleteCombobox(meta, textvariable=self.venue, width=30, state="normal")
     self.c_ven.set_completion_list(getattr(self, 'venues_list', []))
     self.c_ven.grid(row=1, column=1, sticky="w", padx=4)
 
@@ -148,7 +148,7 @@ def build_main_gui(app):
 
     # Row 2: City, Source, Additional
     tk.Label(meta, text="City:").grid(row=2, column=0, sticky="w")
-    self.c_city = AutocompleteCombobox(meta, textvariable=self.city, width=25, state="normal")
+    self.c_city = VirtualAutocompleteCombobox(meta, textvariable=self.city, width=25, state="normal")
     self.c_city.set_completion_list(getattr(self, 'cities_list', []))
     self.c_city.grid(row=2, column=1, sticky="w", padx=4)
 
@@ -165,7 +165,16 @@ def build_main_gui(app):
     # --- Folder Tree ---
     tree_fr = tk.Frame(top_left_frame)
     tree_fr.pack(fill=tk.BOTH, expand=True, pady=(6, 0))
-    tk.Label(tree_fr, text="Folders:").grid(row=0, column=0, sticky="w", columnspan=2)
+    tree_header = tk.Frame(tree_fr)
+    tree_header.grid(row=0, column=0, sticky="ew", columnspan=2)
+    tk.Label(tree_header, text="Folders:").pack(side=tk.LEFT)
+    # Library search: queries the folder index and jumps to the chosen result
+    self.library_search = ttk.Combobox(tree_header, width=50)
+    self.library_search.pack(side=tk.RIGHT, padx=(4, 0))
+    self.library_search.bind("<KeyRelease>", self._on_library_search_key)
+    self.library_search.bind("<Return>", self._jump_to_library_result)
+    self.library_search.bind("<<ComboboxSelected>>", self._jump_to_library_result)
+    tk.Label(tree_header, text="Search:").pack(side=tk.RIGHT)
 
     self.tree = ttk.Treeview(tree_fr, columns=("folder_path",))
     self.tree.grid(row=1, column=0, sticky="nsew")
@@ -193,6 +202,7 @@ def build_main_gui(app):
     btn_fr = tk.Frame(bottom_left_frame, pady=6)
     btn_fr.pack(fill=tk.X)
     ttk.Button(btn_fr, text="Save Selected Folder", command=self._queue).pack(side=tk.LEFT, padx=4)
+    ttk.Button(btn_fr, text="Scan & Queue", command=self._scan_and_queue).pack(side=tk.LEFT, padx=4)
     ttk.Button(btn_fr, text="Remove Selected Folder", command=self._dequeue).pack(side=tk.LEFT, padx=4)
     ttk.Button(btn_fr, text="Process All Saved Folders", command=self._process).pack(side=tk.LEFT, padx=4)
     ttk.Button(btn_fr, text="Clear Fields", command=self._clear).pack(side=tk.LEFT, padx=4)
@@ -3,6 +3,7 @@ import sys
 import subprocess
 import tkinter as tk
 from utils import theme_manager
+from utils import log_config
 
 def build_menu(gui_instance):
     menubar = tk.Menu(gui_instance.root)
@@ -63,3 +64,29 @@ def build_menu(gui_instance):
 
     view_menu.add_command(label="Select Theme...", command=select_theme)
     view_menu.add_command(label="Use Default Theme", command=reset_theme)
+
+    view_menu.add_separator()
+    view_menu.add_command(label="Processing History...", command=gui_instance._open_event_log_viewer)
+
+    # Log levels per module, applied immediately and saved to config.ini
+    levels_menu = tk.Menu(view_menu, tearoff=0)
+    view_menu.add_cascade(label="Log Levels", menu=levels_menu)
+    gui_instance.log_level_vars = {}
+
+    def set_log_level(name):
+        level = gui_instance.log_level_vars[name].get()
+        try:
+            log_config.set_level(name, level, cfg=gui_instance.cfg, config_file=gui_instance.config_file)
+            gui_instance.log_message(f"Log level for {name} set to {level}.", "info")
+        except Exception as e:
+            gui_instance.log_message(f"[ERROR] Failed to set log level for {name}: {e}", "error")
+
+    for name in log_config.LOG_MODULES:
+        var = tk.StringVar(value=log_config.get_level(name))
+        gui_instance.log_level_vars[name] = var
+        module_menu = tk.Menu(levels_menu, tearoff=0)
+        levels_menu.add_cascade(label=name, menu=module_menu)
+        for level in log_config.LEVELS:
+            module_menu.add_radiobutton(
+                label=level, value=level, variable=var, command=lambda n=name: set_log_level(n)
+            )
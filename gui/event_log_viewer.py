@@ -0,0 +1,180 @@
+import time
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk
+
+from utils.event_log import EVENT_TYPES
+from utils.event_index import EventIndex
+
+# Rows shown per search
+RESULT_LIMIT = 2000
+# How often the window picks up results from the background query
+POLL_MS = 50
+
+PERIODS = {"Last day": 1, "Last 7 days": 7, "Last 30 days": 30, "All": None}
+
+
+def _format_bytes(n):
+    if not n or not isinstance(n, (int, float)):
+        return ""
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+class EventLogViewer(tk.Toplevel):
+    """
+    Processing history: filters the structured event log (utils.event_log) through
+    its SQLite index. Indexing new lines and querying run on a worker thread.
+    """
+
+    COLUMNS = ("time", "event", "folder", "artist", "file", "ms", "size", "detail")
+
+    def __init__(self, master=None, log_func=None, index=None):
+        super().__init__(master)
+        self.title("Processing History")
+        self.geometry("1100x600")
+        self.log = log_func or (lambda msg, level="info": None)
+        self.index = index or EventIndex(log_func=self.log)
+        self._results = queue.Queue()
+        self._searching = False
+
+        self._build_ui()
+        self.search()
+
+    def _build_ui(self):
+        filters = tk.Frame(self, padx=6, pady=6)
+        filters.pack(fill=tk.X)
+
+        self.folder_var = tk.StringVar()
+        self.artist_var = tk.StringVar()
+        self.event_var = tk.StringVar()
+        self.error_var = tk.StringVar()
+        self.min_ms_var = tk.StringVar()
+        self.period_var = tk.StringVar(value="Last 30 days")
+
+        tk.Label(filters, text="Folder:").grid(row=0, column=0, sticky="w")
+        folder_entry = ttk.Entry(filters, textvariable=self.folder_var, width=30)
+        folder_entry.grid(row=0, column=1, padx=(2, 10))
+        tk.Label(filters, text="Artist:").grid(row=0, column=2, sticky="w")
+        self.artist_combo = ttk.Combobox(filters, textvariable=self.artist_var, width=22)
+        self.artist_combo.grid(row=0, column=3, padx=(2, 10))
+        tk.Label(filters, text="Event:").grid(row=0, column=4, sticky="w")
+        ttk.Combobox(
+            filters, textvariable=self.event_var, values=("",) + EVENT_TYPES, width=12, state="readonly"
+        ).grid(row=0, column=5, padx=(2, 10))
+
+        tk.Label(filters, text="Error type:").grid(row=1, column=0, sticky="w")
+        self.error_combo = ttk.Combobox(filters, textvariable=self.error_var, width=28)
+        self.error_combo.grid(row=1, column=1, padx=(2, 10), pady=(4, 0))
+        tk.Label(filters, text="Slower than (ms):").grid(row=1, column=2, sticky="w")
+        ttk.Entry(filters, textvariable=self.min_ms_var, width=10).grid(row=1, column=3, sticky="w", padx=(2, 10))
+        tk.Label(filters, text="Period:").grid(row=1, column=4, sticky="w")
+        ttk.Combobox(
+            filters, textvariable=self.period_var, values=tuple(PERIODS), width=12, state="readonly"
+        ).grid(row=1, column=5, padx=(2, 10))
+
+        self.search_button = ttk.Button(filters, text="Search", command=self.search)
+        self.search_button.grid(row=0, column=6, rowspan=2, padx=6)
+        self.status = tk.Label(filters, text="")
+        self.status.grid(row=0, column=7, rowspan=2, sticky="w")
+
+        folder_entry.bind("<Return>", lambda e: self.search())
+
+        table = tk.Frame(self)
+        table.pack(fill=tk.BOTH, expand=True, padx=6, pady=(0, 6))
+        self.tree = ttk.Treeview(table, columns=self.COLUMNS, show="headings")
+        widths = {"time": 140, "event": 90, "folder": 300, "artist": 140, "file": 180, "ms": 70, "size": 80, "detail": 260}
+        for col in self.COLUMNS:
+            self.tree.heading(col, text=col.capitalize() if col != "ms" else "Duration (ms)")
+            self.tree.column(col, width=widths[col], anchor="e" if col in ("ms", "size") else "w")
+        vbar = ttk.Scrollbar(table, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=vbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        vbar.pack(side=tk.LEFT, fill=tk.Y)
+        self.tree.tag_configure("error", foreground="red")
+
+    def _filters(self):
+        min_ms = self.min_ms_var.get().strip()
+        try:
+            min_ms = float(min_ms) if min_ms else None
+        except ValueError:
+            min_ms = None
+        days = PERIODS.get(self.period_var.get())
+        return {
+            "folder": self.folder_var.get().strip() or None,
+            "artist": self.artist_var.get().strip() or None,
+            "event": self.event_var.get() or None,
+            "error_type": self.error_var.get().strip() or None,
+            "min_ms": min_ms,
+            "since": time.time() - days * 86400 if days else None,
+            "limit": RESULT_LIMIT,
+        }
+
+    def search(self):
+        if self._searching:
+            return
+        self._searching = True
+        self.search_button.config(state=tk.DISABLED)
+        self.status.config(text="Searching...")
+        filters = self._filters()
+
+        def work():
+            try:
+                added = self.index.update()
+                rows = self.index.query(**filters)
+                choices = (self.index.distinct("artist"), self.index.distinct("error_type"))
+                self._results.put((rows, added, choices, None))
+            except Exception as e:
+                self._results.put(([], 0, None, e))
+
+        threading.Thread(target=work, daemon=True).start()
+        self.after(POLL_MS, self._poll)
+
+    def _poll(self):
+        if not self.winfo_exists():
+            return
+        try:
+            rows, added, choices, error = self._results.get_nowait()
+        except queue.Empty:
+            self.after(POLL_MS, self._poll)
+            return
+
+        self._searching = False
+        self.search_button.config(state=tk.NORMAL)
+        if error is not None:
+            self.status.config(text="Search failed")
+            self.log(f"[ERROR] Processing history search failed: {error}", level="error")
+            return
+        if choices is not None:
+            self.artist_combo["values"] = choices[0]
+            self.error_combo["values"] = choices[1]
+        self._show(rows)
+        more = " (limit reached)" if len(rows) >= RESULT_LIMIT else ""
+        self.status.config(text=f"{len(rows)} event(s){more}")
+
+    def _show(self, rows):
+        self.tree.delete(*self.tree.get_children())
+        for rec in rows:
+            detail = rec.get("message") or rec.get("out_folder") or rec.get("dest") or ""
+            if rec.get("event") == "error" and rec.get("error_type"):
+                detail = f"{rec.get('stage', '')} {rec['error_type']}: {detail}".strip()
+            elif rec.get("event") in ("batch_start", "batch_end"):
+                detail = ", ".join(f"{k}={rec[k]}" for k in ("folders", "processed", "failed") if k in rec)
+            ms = rec.get("ms")
+            self.tree.insert(
+                "", tk.END,
+                values=(
+                    time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(rec.get("ts", 0))),
+                    rec.get("event", ""),
+                    rec.get("folder") or "",
+                    rec.get("artist") or "",
+                    rec.get("file") or "",
+                    f"{ms:.0f}" if isinstance(ms, (int, float)) else "",
+                    _format_bytes(rec.get("bytes")),
+                    detail,
+                ),
+                tags=("error",) if rec.get("event") == "error" or rec.get("ok") is False else (),
+            )
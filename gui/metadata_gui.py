@@ -1,11 +1,15 @@
 import os
 import re
+import queue
+import threading
+from bisect import bisect_left
 from datetime import datetime
 import tkinter as tk
 from tkinter import ttk
 from utils.match_folder import match_folder
 from utils.txt_parser import TxtMetadataParser
 from utils.constants import DEFAULTS
+from utils.log_sink import write_log
 from utils.metadata_parser import (
     parse_album_flexible,
     parse_tags_from_folder,
@@ -31,6 +35,13 @@ def handle_tree_selection(self, event=None):
 
     node = selected[0]
     folder_path = self.tree.item(node, "values")[0]
+    if folder_path == MORE:
+        listing = _listings(self.tree).get(self.tree.parent(node))
+        if listing is not None:
+            listing.load_more()
+        return
+    if folder_path in PLACEHOLDERS:
+        return
     folder_name = os.path.basename(folder_path)
     self.current = folder_path
 
@@ -172,33 +183,434 @@ def handle_tree_selection(self, event=None):
             self.audio_player.set_track_titles(txt_md["tracks"])
 
 
+# Rows inserted per after() tick while filling a tree level
+TREE_CHUNK_ROWS = 200
+# How often the Tk thread picks up results from the background scan
+TREE_POLL_MS = 20
+# Rows materialized per folder before a "load more" row is shown
+TREE_PAGE_ROWS = 1000
+# Typing pause after which type-ahead starts a new prefix
+TYPEAHEAD_RESET_MS = 1000
+
+# values[0] of rows that are not folders
+DUMMY, LOADING, MORE = "dummy", "loading", "more"
+PLACEHOLDERS = (DUMMY, LOADING, MORE)
+
+
 def populate_tree(tree: ttk.Treeview, log: tk.Text, root_path: str):
+    # Bump the generation so scans started for a previous root are dropped
+    tree._tree_generation = getattr(tree, "_tree_generation", 0) + 1
+    tree._listings = {}
     tree.delete(*tree.get_children())
     top = tree.insert("", tk.END, text=os.path.basename(root_path), open=True, values=(root_path,))
     add_children(tree, log, top, root_path)
 
 
+def _listings(tree):
+    """Per-node ChildListing objects, keyed by tree item id."""
+    listings = getattr(tree, "_listings", None)
+    if listings is None:
+        listings = tree._listings = {}
+    return listings
+
+
+def _is_dir(entry):
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _scan_subdirs(path):
+    """Return (name, full_path) pairs for the sub-directories of `path`, sorted casefolded."""
+    # DirEntry.is_dir() answers from the directory listing on most platforms, no stat needed
+    with os.scandir(path) as it:
+        dirs = [(entry.name, entry.path) for entry in it if _is_dir(entry)]
+    dirs.sort(key=lambda d: d[0].casefold())
+    return dirs
+
+
+def _has_subdir(path):
+    """True if `path` has at least one sub-directory (stops at the first one found)."""
+    try:
+        with os.scandir(path) as it:
+            return any(_is_dir(entry) for entry in it)
+    except OSError:
+        return False
+
+
+class ChildListing:
+    """
+    Every sub-folder of one tree node, of which only a prefix is materialized.
+
+    A background thread lists the folder with os.scandir, then makes a second pass
+    to find which children have sub-folders of their own (the expander hint). The
+    Tk thread polls for results and inserts rows TREE_CHUNK_ROWS at a time, up to
+    `limit` rows; the rest are represented by a "load more" row. The full sorted
+    name list stays in memory so type-ahead and reveal_path cover all children.
+    """
+
+    def __init__(self, tree: ttk.Treeview, log: tk.Text, node, path: str):
+        self.tree = tree
+        self.log = log
+        self.node = node
+        self.path = path
+        self.generation = getattr(tree, "_tree_generation", 0)
+        self.rows = []            # (name, full_path), sorted
+        self.keys = []            # casefolded names parallel to rows, for bisect
+        self.nodes = {}           # full_path -> iid for materialized rows
+        self.has_children = set()
+        self.inserted = 0         # rows[:inserted] are materialized
+        self.limit = TREE_PAGE_ROWS
+        self.done = False
+        self.listed = False
+        self._results = queue.Queue()
+        self._loading = None
+        self._more = None
+        self._polling = False
+        # Set from the Tk thread once the node is gone; the worker only ever reads this
+        self._cancelled = threading.Event()
+
+    def start(self):
+        self._loading = self.tree.insert(self.node, tk.END, text="Loading...", values=(LOADING,))
+        threading.Thread(target=self._worker, daemon=True).start()
+        self._schedule()
+
+    def stale(self):
+        """True once the tree was repopulated or the node deleted. Tk thread only."""
+        return getattr(self.tree, "_tree_generation", 0) != self.generation or not self.tree.exists(self.node)
+
+    def _worker(self):
+        # No Tk calls here: cancellation comes through self._cancelled, and "done" is
+        # always posted so _poll stops rescheduling itself
+        try:
+            try:
+                dirs = _scan_subdirs(self.path)
+            except Exception as e:
+                self._results.put(("error", e))
+                return
+            self._results.put(("dirs", dirs))
+            hints = []
+            for _, full_path in dirs:
+                if self._cancelled.is_set():
+                    return
+                if _has_subdir(full_path):
+                    hints.append(full_path)
+                    if len(hints) >= TREE_CHUNK_ROWS:
+                        self._results.put(("hints", hints))
+                        hints = []
+            self._results.put(("hints", hints))
+        finally:
+            self._results.put(("done", None))
+
+    def _schedule(self):
+        if not self._polling:
+            self._polling = True
+            self.tree.after(TREE_POLL_MS, self._poll)
+
+    def _poll(self):
+        self._polling = False
+        if self.stale():
+            self._cancelled.set()
+            _listings(self.tree).pop(self.node, None)
+            return
+        try:
+            while True:
+                kind, payload = self._results.get_nowait()
+                if kind == "dirs":
+                    self._set_rows(payload)
+                    self.listed = True
+                    self._drop_loading()
+                elif kind == "hints":
+                    for full_path in payload:
+                        self.has_children.add(full_path)
+                        iid = self.nodes.get(full_path)
+                        if iid is not None and self.tree.exists(iid) and not self.tree.get_children(iid):
+                            self._add_expander(iid)
+                elif kind == "error":
+                    self.done = True
+                    self._drop_loading()
+                    write_log(self.log, f"Error building tree: {payload}\n")
+                else:
+                    self.done = True
+        except queue.Empty:
+            pass
+
+        self._insert_some()
+        if not self.done or self.inserted < min(self.limit, len(self.rows)):
+            self._schedule()
+
+    def _drop_loading(self):
+        if self._loading is not None and self.tree.exists(self._loading):
+            self.tree.delete(self._loading)
+        self._loading = None
+
+    def _set_rows(self, rows):
+        self.rows = rows
+        self.keys = [name.casefold() for name, _ in rows]
+
+    def _add_expander(self, iid):
+        self.tree.insert(iid, tk.END, text="...", values=(DUMMY,))
+
+    def _insert_row(self, index):
+        name, full_path = self.rows[index]
+        # Rows before `index` are materialized and in order, so this lands in place
+        iid = self.tree.insert(self.node, index, text=name, values=(full_path,))
+        self.nodes[full_path] = iid
+        if full_path in self.has_children:
+            self._add_expander(iid)
+        return iid
+
+    def _insert_some(self, stop=None):
+        if stop is None:
+            stop = min(self.limit, len(self.rows), self.inserted + TREE_CHUNK_ROWS)
+        for index in range(self.inserted, stop):
+            self._insert_row(index)
+        self.inserted = max(self.inserted, stop)
+        self._update_more_row()
+
+    def _update_more_row(self):
+        remaining = len(self.rows) - self.inserted
+        capped = remaining > 0 and self.inserted >= self.limit
+        if self._more is not None and not self.tree.exists(self._more):
+            self._more = None
+        if capped:
+            text = f"… {remaining} more folder(s), open to load"
+            if self._more is None:
+                self._more = self.tree.insert(self.node, tk.END, text=text, values=(MORE,))
+                # A child gives the row an expander, so opening it loads the next page
+                self._add_expander(self._more)
+            else:
+                self.tree.item(self._more, text=text)
+                self.tree.move(self._more, self.node, tk.END)
+        elif self._more is not None:
+            self.tree.delete(self._more)
+            self._more = None
+
+    def load_more(self):
+        """Materialize the next TREE_PAGE_ROWS rows (in chunks)."""
+        self.limit = self.inserted + TREE_PAGE_ROWS
+        self._schedule()
+
+    def materialize(self, index):
+        """Make sure rows[index] has a tree row (inserting the rows before it) and return its iid."""
+        if index >= self.inserted:
+            self.limit = max(self.limit, index + 1)
+            self._insert_some(stop=index + 1)
+        return self.nodes[self.rows[index][1]]
+
+    def find_prefix(self, prefix):
+        """Index of the first child whose name starts with `prefix` (case-insensitive), or None."""
+        key = prefix.casefold()
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index].startswith(key):
+            return index
+        return None
+
+    def sync(self, rows):
+        """
+        Reconcile with a fresh listing: delete rows for folders that are gone and
+        insert new ones that sort inside the materialized prefix. Untouched rows (and
+        their expansion and selection) are left alone.
+        """
+        wanted = {full_path for _, full_path in rows}
+        gone = [self.nodes.pop(full_path) for full_path in list(self.nodes) if full_path not in wanted]
+        gone = [iid for iid in gone if self.tree.exists(iid)]
+        if gone:
+            self.tree.delete(*gone)
+        fully_shown = self.inserted >= len(self.rows)
+        self._set_rows(rows)
+
+        last_shown = max((i for i, (_, p) in enumerate(rows) if p in self.nodes), default=-1)
+        position = 0
+        for index, (_, full_path) in enumerate(rows):
+            if full_path not in self.nodes:
+                if not fully_shown and index > last_shown:
+                    break
+                if _has_subdir(full_path):
+                    self.has_children.add(full_path)
+                self._insert_row(index)
+            position = index + 1
+        self.inserted = position
+        self._update_more_row()
+
+
 def add_children(tree: ttk.Treeview, log: tk.Text, parent, path: str):
+    """Fill `parent` with the sub-folders of `path` without blocking the Tk thread."""
+    listing = ChildListing(tree, log, parent, path)
+    _listings(tree)[parent] = listing
+    listing.start()
+
+
+def tree_typeahead(tree: ttk.Treeview, event):
+    """
+    Jump to the first folder (among the focused row's siblings) whose name starts
+    with the typed prefix. Uses the full sorted listing, so rows that are not
+    materialized yet are found too.
+    """
+    char = event.char
+    if not char or not char.isprintable() or event.state & 0x4:  # ignore Ctrl combinations
+        return None
+    prefix, last_time = getattr(tree, "_typeahead", ("", 0))
+    prefix = prefix + char if event.time - last_time < TYPEAHEAD_RESET_MS else char
+    tree._typeahead = (prefix, event.time)
+
+    listings = _listings(tree)
+    focus = tree.focus()
+    listing = listings.get(tree.parent(focus)) if focus else None
+    if listing is None and focus:
+        listing = listings.get(focus)
+    if listing is None:
+        return None
+    index = listing.find_prefix(prefix)
+    if index is None:
+        return "break"
+    iid = listing.materialize(index)
+    tree.selection_set(iid)
+    tree.focus(iid)
+    tree.see(iid)
+    return "break"
+
+
+def _path_key(path):
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _child_toward(tree: ttk.Treeview, node, target_key):
+    """Return the child of `node` that is, or contains, the path `target_key`, or None."""
+    listing = _listings(tree).get(node) if node else None
+    if listing is not None and listing.rows:
+        for index, (_, full_path) in enumerate(listing.rows):
+            key = _path_key(full_path)
+            if key == target_key or target_key.startswith(key.rstrip(os.sep) + os.sep):
+                return listing.materialize(index)
+        return None
+    for child in tree.get_children(node):
+        values = tree.item(child, "values")
+        child_path = values[0] if values else ""
+        if child_path in PLACEHOLDERS:
+            continue
+        key = _path_key(child_path)
+        if key == target_key or target_key.startswith(key.rstrip(os.sep) + os.sep):
+            return child
+    return None
+
+
+def reveal_path(tree: ttk.Treeview, log: tk.Text, target: str, attempts: int = 200):
+    """
+    Expand the tree down to `target`, loading folders on the way, then select it.
+    Folder levels load asynchronously (see add_children), so this retries every
+    TREE_POLL_MS until the next level is there, giving up after `attempts` polls.
+    """
+    target_key = _path_key(target)
+
+    def step(remaining):
+        node = ""
+        while True:
+            match = _child_toward(tree, node, target_key)
+            if match is None:
+                listing = _listings(tree).get(node) if node else None
+                children = tree.get_children(node)
+                waiting = listing is not None and not listing.listed
+                if node and listing is None and children and tree.item(children[0], "values")[0] == DUMMY:
+                    tree.delete(children[0])
+                    add_children(tree, log, node, tree.item(node, "values")[0])
+                    waiting = True
+                if waiting and remaining > 0:
+                    # The level is still loading; look again shortly
+                    tree.after(TREE_POLL_MS, lambda: step(remaining - 1))
+                else:
+                    write_log(log, f"Folder not found in tree: {target}\n")
+                return
+            tree.item(match, open=True)
+            if _path_key(tree.item(match, "values")[0]) == target_key:
+                tree.selection_set(match)
+                tree.focus(match)
+                tree.see(match)
+                return
+            node = match
+
+    step(attempts)
+
+
+def _deepest_loaded_node(tree: ttk.Treeview, path: str):
+    """Return (iid, node path) of the deepest loaded node that is `path` or an ancestor of it."""
+    target = _path_key(path)
+    node, node_path = None, None
+    parent = ""
+    while True:
+        for child in tree.get_children(parent):
+            values = tree.item(child, "values")
+            child_path = values[0] if values else ""
+            if child_path in PLACEHOLDERS:
+                continue
+            child_key = _path_key(child_path)
+            if child_key == target or target.startswith(child_key.rstrip(os.sep) + os.sep):
+                node, node_path = child, child_path
+                break
+        else:
+            return node, node_path
+        if _path_key(node_path) == target:
+            return node, node_path
+        parent = node
+
+
+def _sync_children(tree: ttk.Treeview, node, path: str):
+    """Re-list one loaded tree level; levels not loaded yet (or still loading) are skipped."""
+    listing = _listings(tree).get(node)
+    if listing is None or not listing.done:
+        return
     try:
-        for name in sorted(os.listdir(path), key=str.lower):
-            full_path = os.path.join(path, name)
-            if os.path.isdir(full_path):
-                node = tree.insert(parent, tk.END, text=name, values=(full_path,))
-                try:
-                    if any(os.path.isdir(os.path.join(full_path, d)) for d in os.listdir(full_path)):
-                        tree.insert(node, tk.END, text="...", values=("dummy",))
-                except Exception:
-                    pass
-    except Exception as e:
-        if log:
-            log.insert(tk.END, f"Error building tree: {e}\n")
-            log.see(tk.END)
+        on_disk = _scan_subdirs(path)
+    except OSError:
+        return
+    listing.sync(on_disk)
+
+
+def refresh_tree_paths(tree: ttk.Treeview, log: tk.Text, moves):
+    """
+    Update the tree after a processing batch without repopulating it.
+
+    `moves` is a list of (source folder, output folder). Source folders that no
+    longer exist are removed along with emptied parents that were deleted, and the
+    levels receiving output folders are re-listed. Only the affected levels are
+    touched, so cost follows the batch size and expansion/selection are kept.
+    """
+    dirs = set()
+    for src, dst in moves:
+        dirs.add(os.path.dirname(os.path.normpath(src)))
+        dirs.add(os.path.dirname(os.path.normpath(dst)))
+
+    synced = set()
+    for path in sorted(dirs, key=len):
+        # Deleted parents: climb to the nearest folder that still exists
+        while path and not os.path.isdir(path):
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+        node, node_path = _deepest_loaded_node(tree, path)
+        if node is None or node in synced:
+            continue
+        synced.add(node)
+        try:
+            _sync_children(tree, node, node_path)
+        except Exception as e:
+            write_log(log, f"Error updating tree: {e}\n")
 
 
 def on_tree_open(tree: ttk.Treeview, log: tk.Text, event=None):
     nid = tree.focus()
+    values = tree.item(nid, "values") if nid else ()
+    if values and values[0] == MORE:
+        # "Load more" row: materialize the next page of its parent
+        tree.item(nid, open=False)
+        listing = _listings(tree).get(tree.parent(nid))
+        if listing is not None:
+            listing.load_more()
+        return
     children = tree.get_children(nid)
-    if children and tree.item(children[0], "values")[0] == "dummy":
+    if children and tree.item(children[0], "values")[0] == DUMMY:
         tree.delete(children[0])
         path = tree.item(nid, "values")[0]
         add_children(tree, log, nid, path)
@@ -2,7 +2,6 @@ import logging
 import re
 from pathlib import Path
 
-logging.basicConfig(level=logging.DEBUG, format='[%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
 
 SUPPRESS_LOGGING = False
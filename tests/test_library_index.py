@@ -0,0 +1,49 @@
+# tests/test_library_index.py
+import os
+
+from utils import library_index
+from utils.library_index import LibraryIndex, _subtree_bounds
+
+
+def _in_bounds(path, bounds):
+    lo, hi = bounds
+    return lo <= path < hi
+
+
+def test_subtree_bounds_plain_path():
+    root = os.sep.join(["", "music"])
+    bounds = _subtree_bounds(root)
+    assert _in_bounds(os.sep.join([root, "Album"]), bounds)
+    assert not _in_bounds(root, bounds)
+    assert not _in_bounds(root + "2", bounds)
+
+
+def test_subtree_bounds_posix_root(monkeypatch):
+    monkeypatch.setattr(library_index.os, "sep", "/")
+    assert _subtree_bounds("/") == ("/", "0")
+    assert _in_bounds("/music", _subtree_bounds("/"))
+
+
+def test_subtree_bounds_drive_root(monkeypatch):
+    monkeypatch.setattr(library_index.os, "sep", "\\")
+    bounds = _subtree_bounds("C:\\")
+    assert bounds == ("C:\\", "C:]")
+    assert _in_bounds("C:\\Music", bounds)
+    assert not _in_bounds("D:\\Music", bounds)
+    assert _subtree_bounds("C:\\Music") == ("C:\\Music\\", "C:\\Music]")
+
+
+def test_search_restricted_to_filesystem_root(tmp_path):
+    index = LibraryIndex(db_path=tmp_path / "index.db")
+    conn = index._connect()
+    album = os.sep.join(["", "music", "Blue Album"])
+    conn.execute(
+        "INSERT INTO dirs (path, parent, name, name_folded, mtime_ns, audio_count) VALUES (?, ?, ?, ?, 0, 3)",
+        (album, os.path.dirname(album), "Blue Album", "blue album"),
+    )
+    conn.commit()
+    conn.close()
+    try:
+        assert index.search("blue", roots=[os.sep]) == [("Blue Album", album, 3)]
+    finally:
+        index.close()
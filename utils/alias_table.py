@@ -0,0 +1,120 @@
+# utils/alias_table.py
+import time
+import threading
+from pathlib import Path
+
+from utils.constants import ALIAS_FILES
+from utils.asset_loader import file_signature
+
+ALIAS_FILE_HEADER = (
+    "# One mapping per line: alias [| alias ...] = Canonical Name\n"
+    "# e.g.  GD | The Grateful Dead = Grateful Dead\n"
+    "# Matching is case-insensitive. Lines starting with # are ignored.\n"
+)
+
+
+def parse_alias_lines(lines):
+    """
+    Compile alias lines into {casefolded alias: canonical}. Each canonical name also
+    maps to itself, so differently-cased spellings of it are normalized too.
+    """
+    table = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        aliases, canonical = line.rsplit("=", 1)
+        canonical = canonical.strip()
+        if not canonical:
+            continue
+        table[canonical.casefold()] = canonical
+        for alias in aliases.split("|"):
+            alias = alias.strip()
+            if alias:
+                table[alias.casefold()] = canonical
+    return table
+
+
+class AliasTable:
+    """
+    Per-field alias maps compiled from the alias files into case-folded dicts.
+
+    `canonical(field, value)` is a single dict lookup. Alias files are stat'ed at
+    most once every CHECK_INTERVAL seconds and a field's map is only recompiled
+    when its file's (mtime, size) changes.
+    """
+
+    CHECK_INTERVAL = 2.0
+
+    def __init__(self, files=None, log_func=None):
+        self.files = {field: Path(path) for field, path in (files or ALIAS_FILES).items()}
+        self.log = log_func or (lambda msg, level="info": None)
+        self._lock = threading.Lock()
+        self._maps = {field: {} for field in self.files}
+        self._signatures = {}
+        self._last_check = None
+
+    def ensure_files_exist(self):
+        """Create empty alias files (with a format header) for fields that have none."""
+        created = []
+        for field, path in self.files.items():
+            if path.exists():
+                continue
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(ALIAS_FILE_HEADER, encoding="utf-8")
+                created.append(path.name)
+            except Exception as e:
+                self.log(f"[ERROR] Failed to create {path}: {e}", level="error")
+        return created
+
+    def refresh(self, force=False):
+        """Recompile the maps whose alias file changed. Returns the changed fields."""
+        now = time.monotonic()
+        with self._lock:
+            if not force and self._last_check is not None and now - self._last_check < self.CHECK_INTERVAL:
+                return []
+            self._last_check = now
+            changed = []
+            for field, path in self.files.items():
+                sig = file_signature(path)
+                if field in self._signatures and sig == self._signatures[field]:
+                    continue
+                self._signatures[field] = sig
+                if sig is None:
+                    self._maps[field] = {}
+                else:
+                    try:
+                        with path.open(encoding="utf-8") as f:
+                            self._maps[field] = parse_alias_lines(f)
+                    except Exception as e:
+                        self.log(f"[ERROR] Failed to load aliases from {path}: {e}", level="error")
+                        self._maps[field] = {}
+                changed.append(field)
+        if changed and any(self._maps[f] for f in changed):
+            self.log(f"Loaded aliases for {', '.join(changed)}.", level="debug")
+        return changed
+
+    def aliases(self, field):
+        """Return the compiled {casefolded alias: canonical} map for `field`."""
+        self.refresh()
+        return self._maps.get(field, {})
+
+    def canonical(self, field, value):
+        """Return the canonical spelling of `value` for `field` (or `value` unchanged)."""
+        if not value:
+            return value
+        self.refresh()
+        table = self._maps.get(field)
+        if not table:
+            return value
+        return table.get(value.strip().casefold(), value)
+
+
+# Shared table used by the parsers, Processor and the comboboxes
+ALIASES = AliasTable()
+
+
+def canonicalize(field, value):
+    """Shortcut for ALIASES.canonical(field, value)."""
+    return ALIASES.canonical(field, value)
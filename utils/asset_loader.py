@@ -1,10 +1,12 @@
 import os
-import json
+import marshal
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
 ASSETS_DIR = Path("assets")
-CACHE_FILE = Path("cache/asset_lists.json")
+CACHE_FILE = Path("cache/asset_snapshot.bin")
+# Bump when the snapshot layout changes so stale caches are ignored
+SNAPSHOT_FORMAT = 2
 
 ARTISTS_FILE = ASSETS_DIR / "artists.txt"
 VENUES_FILE = ASSETS_DIR / "venues.txt"
@@ -31,13 +33,39 @@ def ensure_asset_files_exist(log_callback=None):
 
     return created
 
+# path -> (signature, parsed lines); a file is only re-parsed when its signature changes
+_list_cache = {}
+
+
+def file_signature(path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for `path`, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def load_list(path: Path) -> List[str]:
-    """Load a list of non-empty lines from a text file."""
+    """
+    Load a list of non-empty lines from a text file.
+    Results are memoized per file and reused until its mtime or size changes.
+    """
+    path = Path(path)
+    sig = file_signature(path)
+    if sig is None:
+        _list_cache.pop(path, None)
+        return []
+    cached = _list_cache.get(path)
+    if cached is not None and cached[0] == sig:
+        return list(cached[1])
     try:
         with path.open(encoding="utf-8") as f:
-            return [line.strip() for line in f if line.strip()]
+            values = [line.strip() for line in f if line.strip()]
     except Exception:
         return []
+    _list_cache[path] = (sig, tuple(values))
+    return values
 
 def load_asset_lists(log_callback=None):
     artists = load_list(ARTISTS_FILE)
@@ -49,13 +77,71 @@ def load_asset_lists(log_callback=None):
 
     return artists, venues, cities
 
-def save_asset_cache(artists, venues, cities):
-    """Save asset lists to cache for faster future loads."""
-    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with CACHE_FILE.open("w", encoding="utf-8") as f:
-        json.dump({"artists": artists, "venues": venues, "cities": cities}, f, indent=2)
+def _valid_snapshot_record(rec) -> bool:
+    """Shape check for one field of a loaded snapshot; the automaton is checked where it is rebuilt."""
+    if not isinstance(rec, dict):
+        return False
+    keys, values, sig = rec.get("keys"), rec.get("values"), rec.get("signature")
+    if not isinstance(keys, tuple) or not isinstance(values, tuple) or len(keys) != len(values):
+        return False
+    if not all(isinstance(v, str) for v in keys) or not all(isinstance(v, str) for v in values):
+        return False
+    if not (isinstance(sig, tuple) and len(sig) == 2 and all(isinstance(n, int) for n in sig)):
+        return False
+    for name in ("sorted_keys", "extra_keys"):
+        seq = rec.get(name)
+        if seq is not None and not (isinstance(seq, tuple) and all(isinstance(v, str) for v in seq)):
+            return False
+    return rec.get("automaton") is None or isinstance(rec["automaton"], dict)
+
+
+def load_asset_snapshot(path: Path = CACHE_FILE) -> dict:
+    """
+    Load the binary asset snapshot written by save_asset_snapshot.
+    Returns {field: record} (each record stamped with its source file's signature),
+    or {} if the cache is missing, unreadable or from another format version.
+    The snapshot is marshal data (plain tuples, dicts and strings only), so loading
+    it never runs code; records that fail the shape check are dropped.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = marshal.load(f)
+    except Exception:
+        return {}
+    if not isinstance(data, dict) or data.get("format") != SNAPSHOT_FORMAT:
+        return {}
+    fields = data.get("fields")
+    if not isinstance(fields, dict):
+        return {}
+    return {field: rec for field, rec in fields.items() if _valid_snapshot_record(rec)}
+
+
+def save_asset_snapshot(fields: dict, path: Path = CACHE_FILE):
+    """
+    Persist parsed asset lists and their prebuilt lookup indexes in a compact binary
+    snapshot so the next startup can skip parsing and indexing.
+    `fields` maps field name -> record of plain tuples/dicts/strings; each record must
+    carry the source file's (mtime_ns, size) under "signature" so stale entries can be
+    detected on load.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        marshal.dump({"format": SNAPSHOT_FORMAT, "fields": fields}, f)
+    os.replace(tmp_path, path)
+
+
+_LAZY_LISTS = {
+    "artists_list": ARTISTS_FILE,
+    "venues_list": VENUES_FILE,
+    "cities_list": CITIES_FILE,
+}
 
 
-# Load the lists once on import for convenience
-artists_list, venues_list, cities_list = load_asset_lists()
-artist_aliases = {}  # You can load or define this here if needed
+def __getattr__(name):
+    # Lazy module attributes: importing this module does no disk I/O,
+    # and each list is read on first access (then memoized by load_list).
+    if name in _LAZY_LISTS:
+        return load_list(_LAZY_LISTS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,405 @@
+# utils/asset_store.py
+import os
+import json
+import threading
+from bisect import insort
+from collections import OrderedDict
+from functools import cached_property
+from pathlib import Path
+
+from utils.constants import ARTISTS_FILE, VENUES_FILE, CITIES_FILE, ASSET_JOURNAL_FILE
+from utils.asset_loader import (
+    CACHE_FILE,
+    load_list,
+    file_signature,
+    load_asset_snapshot,
+    save_asset_snapshot,
+)
+from utils.match_automaton import MatchAutomaton
+
+ASSET_FILES = {
+    "artists": ARTISTS_FILE,
+    "venues": VENUES_FILE,
+    "cities": CITIES_FILE,
+}
+
+# Keys added since the last automaton build are matched linearly; past this many
+# the automaton is rebuilt in the background.
+AUTOMATON_REBUILD_THRESHOLD = 256
+
+
+class AssetSnapshot(tuple):
+    """
+    Immutable, versioned view of one asset list in MRU order (most recent first).
+
+    Behaves like a plain tuple of strings so existing list consumers keep working,
+    and carries derived lookup data that is built once per version:
+        version: store version the snapshot was taken at
+        casefold_map: dict mapping casefolded value -> stored value
+        positions:    dict mapping casefolded value -> index of its first entry
+        folded:       tuple of (casefolded value, stored value) pairs, in list order
+        automaton:    MatchAutomaton over the keys (None until built), for substring matching
+        extra_keys:   keys not covered by `automaton` yet, to be matched linearly
+        sorted_index: (sorted casefolded keys, values) for bisect prefix lookups
+    """
+
+    def __new__(cls, values=(), version=0, folded=None, automaton=None, extra_keys=(), sorted_keys=None):
+        snap = super().__new__(cls, values)
+        snap.version = version
+        snap.folded = tuple(folded) if folded is not None else tuple((v.casefold(), v) for v in snap)
+        snap.casefold_map = {}
+        snap.positions = {}
+        for i, (key, value) in enumerate(snap.folded):
+            if key not in snap.casefold_map:
+                snap.casefold_map[key] = value
+                snap.positions[key] = i
+        snap.automaton = automaton
+        snap.extra_keys = tuple(extra_keys)
+        snap._base_sorted_keys = sorted_keys
+        return snap
+
+    @cached_property
+    def sorted_index(self):
+        casefold_map = self.casefold_map
+        if self._base_sorted_keys is None:
+            keys = sorted(casefold_map)
+        else:
+            keys = [k for k in self._base_sorted_keys if k in casefold_map]
+            for key in self.extra_keys:
+                insort(keys, key)
+        return keys, [casefold_map[k] for k in keys]
+
+    def lookup(self, value):
+        """Return the stored spelling of `value` (case-insensitive) or None."""
+        if not value:
+            return None
+        return self.casefold_map.get(value.strip().casefold())
+
+
+class AssetStore:
+    """
+    In-memory owner of the artists/venues/cities asset lists.
+
+    Each list is held in an OrderedDict keyed by casefolded value, with the most
+    recently used entry at the end so MRU promotion is O(1). Changes are appended
+    to a journal file instead of rewriting the .txt files; `compact()` folds the
+    journal back into the .txt files (call it at idle or on exit).
+
+    Parsed lists and their lookup indexes are persisted in a binary snapshot
+    (see asset_loader.save_asset_snapshot) and loaded on startup in place of
+    re-parsing; indexes are (re)built on a background thread when sources change.
+    """
+
+    def __init__(self, files=None, journal_file=ASSET_JOURNAL_FILE, log_func=None, snapshot_file=CACHE_FILE):
+        self.files = {field: Path(path) for field, path in (files or ASSET_FILES).items()}
+        self.journal_file = journal_file
+        self.snapshot_file = snapshot_file
+        self.log = log_func or (lambda msg, level="info": None)
+
+        self._lock = threading.RLock()
+        self._entries = {field: OrderedDict() for field in self.files}
+        self._versions = {field: 0 for field in self.files}
+        self._signatures = {}  # field -> (mtime_ns, size) of the .txt as last read or written
+        self._snapshots = {}
+        self._dirty = set()
+        self._compact_pending = False
+
+        # Derived indexes, shared by every snapshot until rebuilt
+        self._automata = {}                                # field -> MatchAutomaton
+        self._sorted_keys = {}                             # field -> keys sorted at automaton build
+        self._extra_keys = {field: [] for field in self.files}  # keys added since the build
+        self._index_thread = None
+
+    # ------------------------------------------------------------------
+    # loading
+    # ------------------------------------------------------------------
+    def load(self):
+        """
+        Load every list from the binary snapshot when its stamp matches the .txt file,
+        else parse the .txt; then replay any journal left over from a previous run.
+        Missing indexes are built in the background.
+        """
+        cached = load_asset_snapshot(self.snapshot_file) if self.snapshot_file else {}
+        from_cache = []
+        with self._lock:
+            for field, path in self.files.items():
+                sig = file_signature(path)
+                self._signatures[field] = sig
+                rec = cached.get(field)
+                if sig is not None and rec and rec.get("signature") == sig:
+                    self._install_cached(field, rec)
+                    from_cache.append(field)
+                else:
+                    self._set_entries(field, load_list(path))
+            replayed = self._replay_journal()
+        if from_cache:
+            self.log(f"Loaded asset snapshot for {', '.join(from_cache)}.", level="debug")
+        if replayed:
+            self.log(f"Replayed {replayed} pending asset change(s) from journal.", level="debug")
+            self.compact()
+        if self._needs_index_build():
+            self.start_index_build()
+        return self
+
+    def _install_cached(self, field, rec):
+        self._entries[field] = OrderedDict(zip(reversed(rec["keys"]), reversed(rec["values"])))
+        state = rec.get("automaton")
+        if state is not None and rec.get("sorted_keys") is not None:
+            try:
+                self._automata[field] = MatchAutomaton.from_state(state)
+                self._sorted_keys[field] = rec["sorted_keys"]
+            except ValueError as e:
+                # Rebuilt in the background by start_index_build
+                self.log(f"Ignoring cached {field} index: {e}", level="warning")
+        self._extra_keys[field] = list(rec.get("extra_keys", ()))
+        self._bump(field)
+
+    def refresh(self):
+        """
+        Reload only the fields whose .txt changed on disk since it was last read or
+        written (e.g. edited via Edit > Open Artists.txt). Costs one stat per file
+        when nothing changed. Returns the list of reloaded fields.
+        """
+        changed = []
+        with self._lock:
+            for field, path in self.files.items():
+                sig = file_signature(path)
+                if sig == self._signatures.get(field):
+                    continue
+                self._signatures[field] = sig
+                self._set_entries(field, load_list(path))
+                changed.append(field)
+            if changed:
+                # Re-apply changes that are still waiting in the journal
+                self._replay_journal(fields=set(changed))
+        if changed:
+            self.log(f"Reloaded changed asset file(s): {', '.join(changed)}", level="debug")
+            if self._needs_index_build():
+                self.start_index_build()
+        return changed
+
+    def _set_entries(self, field, values):
+        entries = OrderedDict()
+        # File order is most-recent-first; store oldest-first so the MRU end is last
+        for value in reversed(values):
+            key = value.casefold()
+            entries[key] = value
+            entries.move_to_end(key)
+        self._entries[field] = entries
+        automaton = self._automata.get(field)
+        self._extra_keys[field] = [k for k in entries if k not in automaton] if automaton is not None else []
+        self._bump(field)
+
+    def _replay_journal(self, fields=None):
+        if not os.path.exists(self.journal_file):
+            return 0
+        count = 0
+        try:
+            with open(self.journal_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue  # torn write from a crash, skip it
+                    field = rec.get("field")
+                    if fields is not None and field not in fields:
+                        continue
+                    if self._apply(field, rec.get("value", "")):
+                        count += 1
+        except Exception as e:
+            self.log(f"Failed reading asset journal {self.journal_file}: {e}", level="error")
+        return count
+
+    # ------------------------------------------------------------------
+    # readers
+    # ------------------------------------------------------------------
+    def version(self, field):
+        return self._versions[field]
+
+    def snapshot(self, field):
+        """Return an AssetSnapshot for `field`, reused until the list changes."""
+        with self._lock:
+            version = self._versions[field]
+            snap = self._snapshots.get(field)
+            if snap is None or snap.version != version:
+                folded = tuple(reversed(self._entries[field].items()))
+                snap = AssetSnapshot(
+                    (value for _, value in folded),
+                    version,
+                    folded=folded,
+                    automaton=self._automata.get(field),
+                    extra_keys=self._extra_keys[field],
+                    sorted_keys=self._sorted_keys.get(field),
+                )
+                self._snapshots[field] = snap
+            return snap
+
+    def lists(self):
+        """Return (artists, venues, cities) snapshots."""
+        return self.snapshot("artists"), self.snapshot("venues"), self.snapshot("cities")
+
+    def lookup(self, field, value):
+        """Return the stored spelling of `value` in `field` (case-insensitive) or None."""
+        if not value:
+            return None
+        with self._lock:
+            return self._entries[field].get(value.strip().casefold())
+
+    # ------------------------------------------------------------------
+    # writers
+    # ------------------------------------------------------------------
+    def touch(self, field, value):
+        """
+        Record use of `value`: add it if new, otherwise move it to the MRU position
+        (replacing the stored spelling). The change is journaled, not written to the .txt.
+        Returns True if the list changed.
+        """
+        value = (value or "").strip()
+        if not value:
+            return False
+        with self._lock:
+            if not self._apply(field, value):
+                return False
+            try:
+                os.makedirs(os.path.dirname(self.journal_file) or ".", exist_ok=True)
+                with open(self.journal_file, "a", encoding="utf-8") as f:
+                    f.write(json.dumps({"field": field, "value": value}, ensure_ascii=False) + "\n")
+            except Exception as e:
+                self.log(f"Failed appending to asset journal: {e}", level="error")
+        return True
+
+    def _apply(self, field, value):
+        entries = self._entries.get(field)
+        if entries is None or not value:
+            return False
+        key = value.casefold()
+        if entries.get(key) == value and next(reversed(entries), None) == key:
+            return False  # already the most recent entry, nothing to do
+        if key not in entries:
+            automaton = self._automata.get(field)
+            if automaton is not None and key not in automaton:
+                self._extra_keys[field].append(key)
+        entries[key] = value
+        entries.move_to_end(key)
+        self._dirty.add(field)
+        self._bump(field)
+        return True
+
+    def _bump(self, field):
+        self._versions[field] += 1
+
+    # ------------------------------------------------------------------
+    # compaction
+    # ------------------------------------------------------------------
+    def compact(self):
+        """Rewrite changed .txt files from memory and truncate the journal."""
+        with self._lock:
+            self._compact_pending = False
+            for field in sorted(self._dirty):
+                path = self.files[field]
+                values = list(reversed(self._entries[field].values()))
+                try:
+                    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                    tmp_path = f"{path}.tmp"
+                    with open(tmp_path, "w", encoding="utf-8") as f:
+                        f.write("\n".join(values) + "\n")
+                    os.replace(tmp_path, path)
+                    self._signatures[field] = file_signature(path)
+                except Exception as e:
+                    self.log(f"Failed writing {path}: {e}", level="error")
+                    return False
+            if self._dirty:
+                self.log(f"Compacted asset journal into {', '.join(sorted(self._dirty))}.", level="debug")
+            self._dirty.clear()
+            try:
+                if os.path.exists(self.journal_file):
+                    os.remove(self.journal_file)
+            except Exception as e:
+                self.log(f"Failed truncating asset journal: {e}", level="error")
+        return True
+
+    def schedule_compaction(self, widget):
+        """
+        Compact once the Tk event loop is idle, then refresh the binary snapshot in
+        the background. Safe to call repeatedly.
+        """
+        with self._lock:
+            if self._compact_pending or not self._dirty:
+                return
+            self._compact_pending = True
+
+        def compact_and_snapshot():
+            if self.compact():
+                self.start_index_build()
+
+        try:
+            widget.after_idle(compact_and_snapshot)
+        except Exception:
+            compact_and_snapshot()
+
+    # ------------------------------------------------------------------
+    # derived indexes and binary snapshot
+    # ------------------------------------------------------------------
+    def _needs_index_build(self):
+        return any(
+            self._automata.get(field) is None or len(self._extra_keys[field]) > AUTOMATON_REBUILD_THRESHOLD
+            for field in self.files
+        )
+
+    def build_indexes(self):
+        """
+        Build match automata and prefix indexes for fields that lack them (or have
+        too many keys added since), then persist the binary snapshot.
+        """
+        for field in self.files:
+            with self._lock:
+                automaton = self._automata.get(field)
+                if automaton is not None and len(self._extra_keys[field]) <= AUTOMATON_REBUILD_THRESHOLD:
+                    continue
+                keys = list(self._entries[field])
+            # The expensive part runs without holding the lock
+            automaton = MatchAutomaton(keys)
+            sorted_keys = sorted(automaton.keys)
+            with self._lock:
+                self._automata[field] = automaton
+                self._sorted_keys[field] = sorted_keys
+                self._extra_keys[field] = [k for k in self._entries[field] if k not in automaton]
+                self._snapshots.pop(field, None)
+        self.save_snapshot()
+
+    def start_index_build(self):
+        """Run build_indexes on a background thread (no-op if one is already running)."""
+        with self._lock:
+            if self._index_thread is not None and self._index_thread.is_alive():
+                return
+            self._index_thread = threading.Thread(target=self._index_worker, daemon=True)
+            self._index_thread.start()
+
+    def _index_worker(self):
+        try:
+            self.build_indexes()
+        except Exception as e:
+            self.log(f"Failed building asset indexes: {e}", level="error")
+
+    def save_snapshot(self):
+        """Write lists and indexes, stamped with each source file's (mtime, size)."""
+        if not self.snapshot_file:
+            return
+        with self._lock:
+            fields = {}
+            for field in self.files:
+                folded = tuple(reversed(self._entries[field].items()))
+                automaton = self._automata.get(field)
+                fields[field] = {
+                    "signature": self._signatures.get(field),
+                    "keys": tuple(k for k, _ in folded),
+                    "values": tuple(v for _, v in folded),
+                    "automaton": automaton.to_state() if automaton is not None else None,
+                    "sorted_keys": tuple(self._sorted_keys[field]) if automaton is not None else None,
+                    "extra_keys": tuple(self._extra_keys[field]),
+                }
+        try:
+            save_asset_snapshot(fields, self.snapshot_file)
+            self.log("Asset snapshot saved.", level="debug")
+        except Exception as e:
+            self.log(f"Failed saving asset snapshot: {e}", level="error")
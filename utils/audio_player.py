@@ -2,12 +2,23 @@ import tkinter as tk
 from tkinter import ttk
 import vlc
 import threading
-import time
-import mutagen
 import os
 import sys
 import ctypes
+import queue
 from utils.rename_manager import RenameManager
+from utils.track_info import TRACK_INFO_CACHE
+from utils.log_sink import write_log
+
+
+# How often the Tk thread picks up results from the track-list worker
+TRACK_POLL_MS = 30
+# Playback position refresh while a track is playing
+PLAYBACK_TICK_MS = 250
+# Start the preloaded next track this long before the current one ends, covering its start-up latency
+GAPLESS_LEAD_MS = 150
+# How often the previous track's player is checked after an auto-advance, until it can be stopped
+OUTGOING_POLL_MS = 20
 
 
 class AudioPlayer(tk.Frame):
@@ -30,14 +41,21 @@ class AudioPlayer(tk.Frame):
 
         self.audio_files = []
         self._audio_length_ms = 0
-        self._stop_flag = False
+        self._tick_id = None
+        self._advance_id = None
+        self._current_index = None
+        self._next_index = None   # track loaded into self._next_player, if any
+        self._outgoing = None     # player still playing out the previous track after an auto-advance
+        self._outgoing_id = None
         self.track_titles_txt = []
         self.show_metadata = {}
         self._user_seeking = False
         self.rename_manager = None
+        self.track_info = []          # per-track {"title", "length", "bitrate"} once read
+        self._load_generation = 0
 
         # Inline log insert function (safe if no log widget)
-        self.log_insert = lambda msg: self.log.insert(tk.END, msg + "\n") if self.log else None
+        self.log_insert = lambda msg: write_log(self.log, msg + "\n")
 
         # VLC Setup - Load DLLs if bundled
         base = getattr(sys, '_MEIPASS', os.path.abspath("."))
@@ -53,25 +71,37 @@ class AudioPlayer(tk.Frame):
 
         self.vlc_instance = vlc.Instance()
         self.player = self.vlc_instance.media_player_new()
+        # Second player holding the next track, opened ahead of time for gapless advance
+        self._next_player = self.vlc_instance.media_player_new()
+        for player in (self.player, self._next_player):
+            self._watch_playing(player)
 
         self._build_ui()
 
     def _build_ui(self):
-        tk.Label(self, text="Audio File List & Playback", font=("Segoe UI", 10, "bold")).pack(anchor="w", padx=6)
+        header = tk.Frame(self)
+        header.pack(fill=tk.X, padx=6)
+        tk.Label(header, text="Audio File List & Playback", font=("Segoe UI", 10, "bold")).pack(side=tk.LEFT)
+        self.runtime_label = tk.Label(header, text="")
+        self.runtime_label.pack(side=tk.RIGHT)
 
         playback_frame = tk.Frame(self)
         playback_frame.pack(fill=tk.BOTH, expand=True, padx=6, pady=2)
 
-        columns = ("track", "title", "filename")
+        columns = ("track", "title", "filename", "length", "bitrate")
         self.audio_list = ttk.Treeview(playback_frame, columns=columns, show="headings", height=6)
         self.audio_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         self.audio_list.heading("track", text="Track #")
         self.audio_list.heading("title", text="Title")
         self.audio_list.heading("filename", text="Filename")
+        self.audio_list.heading("length", text="Length")
+        self.audio_list.heading("bitrate", text="Bitrate")
         self.audio_list.column("track", width=50, anchor="center")
         self.audio_list.column("title", width=250, anchor="w")
         self.audio_list.column("filename", width=350, anchor="w")
+        self.audio_list.column("length", width=60, anchor="e")
+        self.audio_list.column("bitrate", width=80, anchor="e")
 
         scrollbar_audio = ttk.Scrollbar(playback_frame, orient=tk.VERTICAL, command=self.audio_list.yview)
         scrollbar_audio.pack(side=tk.LEFT, fill=tk.Y)
@@ -85,6 +115,10 @@ class AudioPlayer(tk.Frame):
 
         ttk.Button(controls_frame, text="Play", command=self._play_audio).pack(side=tk.LEFT, padx=4)
         ttk.Button(controls_frame, text="Stop", command=self._stop_audio).pack(side=tk.LEFT, padx=4)
+        self.auto_advance = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            controls_frame, text="Auto-advance", variable=self.auto_advance, command=self._on_auto_advance_toggle
+        ).pack(side=tk.LEFT, padx=4)
         ttk.Button(controls_frame, text="Add to Audio Player", command=self._add_audio_folder).pack(side=tk.LEFT, padx=4)
         ttk.Button(controls_frame, text="Clear Audio Player", command=self._clear_audio_player).pack(side=tk.LEFT, padx=4)
         ttk.Button(controls_frame, text="Rename Track Names", command=self._open_rename_window).pack(side=tk.LEFT, padx=4)
@@ -124,27 +158,54 @@ class AudioPlayer(tk.Frame):
 
     def _clear_audio_player(self):
         self._stop_audio()
+        self._load_generation += 1
         self.audio_list.delete(*self.audio_list.get_children())
         self.audio_files = []
+        self.track_info = []
+        self._current_index = None
         self._audio_length_ms = 0
         self.track_titles_txt = []
+        self.runtime_label.config(text="")
         self.show_metadata = {}
         self.rename_manager = None
         self.log_insert("[INFO] Audio player cleared")
 
     def load_audio_files(self, folder_path):
+        """
+        Show the folder's tracks without blocking the Tk thread. A worker lists the
+        folder and reads the tracklist .txt, then reads tags and stream info file by
+        file (through TRACK_INFO_CACHE, so revisiting a show is a stat per file);
+        rows appear with their filenames first and fill in as results arrive.
+        """
+        self._load_generation += 1
+        generation = self._load_generation
         self.audio_list.delete(*self.audio_list.get_children())
         self.audio_files = []
+        self.track_info = []
         self.track_titles_txt = []
         self.show_metadata = {}
-
+        self._audio_length_ms = 0
+        # A track already playing keeps playing, but it no longer has a place in the new list
+        self._cancel_advance()
+        self._current_index = None
+        self._clear_preload()
+        self.runtime_label.config(text="Loading...")
+
+        results = queue.Queue()
+        threading.Thread(
+            target=self._load_worker, args=(folder_path, generation, results), daemon=True
+        ).start()
+        self.after(TRACK_POLL_MS, lambda: self._poll_load(generation, results))
+
+    def _load_worker(self, folder_path, generation, results):
         try:
-            files = sorted(os.listdir(folder_path))
+            files = TRACK_INFO_CACHE.list_audio_files(folder_path)
         except Exception as e:
-            self.log_insert(f"[ERROR] Could not list directory {folder_path}: {e}")
+            results.put(("error", f"[ERROR] Could not list directory {folder_path}: {e}"))
             return
 
         # Try to find a tracklist txt file
+        titles_txt = []
         txt_path = next(
             (
                 os.path.join(folder_path, f)
@@ -154,39 +215,94 @@ class AudioPlayer(tk.Frame):
             None,
         )
         if txt_path:
-            self._load_txt_tracklist(txt_path)
+            try:
+                titles_txt = self._read_txt_tracklist(txt_path)
+            except Exception as e:
+                results.put(("log", f"[ERROR] Failed to read tracklist: {e}"))
+        results.put(("files", ([os.path.join(folder_path, f) for f in files], titles_txt)))
 
-        self._update_show_metadata_ui()
-        track_num = 1
-        for f in files:
-            if f.lower().endswith(('.mp3', '.flac', '.wav', '.ogg')):
-                full = os.path.join(folder_path, f)
-                self.audio_files.append(full)
-                title = self.track_titles_txt[track_num - 1] if len(self.track_titles_txt) >= track_num else ''
-                try:
-                    if not title:
-                        tags = mutagen.File(full)
-                        title = tags.get("title", [""])[0] if tags and tags.get("title") else ""
-                except Exception:
-                    pass
-                self.audio_list.insert("", "end", values=(f"D1T{track_num}", title, f))
-                track_num += 1
-
-        if self.audio_files:
+        for index, f in enumerate(files):
+            if generation != self._load_generation:
+                return  # another folder was loaded meanwhile
             try:
-                self._audio_length_ms = int(mutagen.File(self.audio_files[0]).info.length * 1000)
+                info = TRACK_INFO_CACHE.get(os.path.join(folder_path, f))
             except Exception:
-                self._audio_length_ms = 0
+                info = {"title": "", "length": 0.0, "bitrate": 0}
+            results.put(("info", (index, info)))
+        results.put(("done", None))
 
+    def _poll_load(self, generation, results):
+        if generation != self._load_generation:
+            return
+        done = False
+        try:
+            while True:
+                kind, payload = results.get_nowait()
+                if kind == "files":
+                    self._show_track_rows(*payload)
+                elif kind == "info":
+                    self._apply_track_info(*payload)
+                elif kind == "log":
+                    self.log_insert(payload)
+                elif kind == "error":
+                    self.log_insert(payload)
+                    self.runtime_label.config(text="")
+                    done = True
+                else:
+                    done = True
+        except queue.Empty:
+            pass
+        if done:
+            self._update_runtime_label()
+        else:
+            self.after(TRACK_POLL_MS, lambda: self._poll_load(generation, results))
+
+    def _show_track_rows(self, paths, titles_txt):
+        self.audio_files = paths
+        self.track_titles_txt = titles_txt
+        self.track_info = [None] * len(paths)
+        self._update_show_metadata_ui()
+        for track_num, full in enumerate(paths, start=1):
+            title = titles_txt[track_num - 1] if len(titles_txt) >= track_num else ''
+            self.audio_list.insert("", "end", values=(f"D1T{track_num}", title, os.path.basename(full), "", ""))
         self.initialize_rename_manager()
 
-    def _load_txt_tracklist(self, path):
-        try:
-            with open(path, encoding='utf-8') as f:
-                lines = f.readlines()
-            self.track_titles_txt = [line.strip() for line in lines if line.strip() and not line.startswith("#")]
-        except Exception as e:
-            self.log_insert(f"[ERROR] Failed to read tracklist: {e}")
+    def _apply_track_info(self, index, info):
+        if index >= len(self.track_info):
+            return
+        self.track_info[index] = info
+        children = self.audio_list.get_children()
+        if index >= len(children):
+            return
+        row = children[index]
+        values = list(self.audio_list.item(row, "values"))
+        # A title from the tracklist .txt wins over the file's tag
+        if not values[1] and info["title"]:
+            values[1] = info["title"]
+        values[3] = self._format_time(info["length"]) if info["length"] else ""
+        values[4] = f"{round(info['bitrate'] / 1000)} kbps" if info["bitrate"] else ""
+        self.audio_list.item(row, values=values)
+        if index == 0 and not self._audio_length_ms:
+            self._audio_length_ms = int(info["length"] * 1000)
+        if index % 10 == 0:
+            self._update_runtime_label()
+
+    def _update_runtime_label(self):
+        known = [info for info in self.track_info if info is not None]
+        if not self.track_info:
+            self.runtime_label.config(text="")
+            return
+        total = sum(info["length"] for info in known)
+        text = f"{len(self.track_info)} tracks, total {self._format_runtime(total)}"
+        if len(known) < len(self.track_info):
+            text += f" (reading {len(known)}/{len(self.track_info)})"
+        self.runtime_label.config(text=text)
+
+    @staticmethod
+    def _read_txt_tracklist(path):
+        with open(path, encoding='utf-8') as f:
+            lines = f.readlines()
+        return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
 
     def _update_show_metadata_ui(self):
         if self.set_artist:
@@ -218,18 +334,149 @@ class AudioPlayer(tk.Frame):
         index = self.audio_list.index(selection[0])
         self._play_audio_at_index(index)
 
-    def _play_audio_at_index(self, index):
+    def _play_audio_at_index(self, index, segue=False):
+        """
+        Play track `index`. With `segue` (auto-advance), the previous track keeps playing
+        until the new one reports Playing, so its last GAPLESS_LEAD_MS cover the start-up
+        latency; it is muted at that moment (never overlapping the new track), then
+        stopped and reused for the next preload.
+        """
         if 0 <= index < len(self.audio_files):
             filepath = self.audio_files[index]
-            media = self.vlc_instance.media_new(filepath)
-            self.player.set_media(media)
-            self.player.play()
-            self._stop_flag = False
+            info = self.track_info[index] if index < len(self.track_info) else None
+            if info is not None and info["length"]:
+                self._audio_length_ms = int(info["length"] * 1000)
+            self._cancel_advance()
+            self._release_outgoing()
+            previous = self.player
+            if index == self._next_index:
+                # Already opened and parsed: start it first, then let go of the old track
+                self.player, self._next_player = self._next_player, self.player
+                self._next_index = None
+                if segue:
+                    # Set before play() so _on_playing sees it however soon Playing fires
+                    self._outgoing = previous
+                    self.player.play()
+                    self._outgoing_id = self.after(OUTGOING_POLL_MS, self._outgoing_tick)
+                else:
+                    self.player.play()
+                    previous.stop()
+            else:
+                media = self.vlc_instance.media_new(filepath)
+                self.player.set_media(media)
+                self.player.play()
+            self._current_index = index
             self._start_playback_updater()
+            if self._outgoing is None:
+                self._preload(index + 1)
             self.log_insert(f"[INFO] Playing: {filepath}")
 
+    def _watch_playing(self, player):
+        """Get told the moment `player` starts playing, to silence the track it replaces."""
+        try:
+            player.event_manager().event_attach(
+                vlc.EventType.MediaPlayerPlaying, lambda event, p=player: self._on_playing(p)
+            )
+        except Exception as e:
+            self.log_insert(f"[WARN] Could not watch player events: {e}")
+
+    def _on_playing(self, player):
+        """
+        VLC event thread: mute the outgoing track as soon as its replacement plays. Only
+        the mute happens here; stopping the player is left to _outgoing_tick on the Tk thread.
+        """
+        outgoing = self._outgoing
+        if outgoing is not None and outgoing is not player:
+            try:
+                outgoing.audio_set_mute(True)
+            except Exception:
+                pass
+
+    def _outgoing_tick(self):
+        """Stop the previous track's player once the new one plays (or it ended), then preload into it."""
+        self._outgoing_id = None
+        player = self._outgoing
+        if player is None:
+            return
+        try:
+            waiting = (
+                self.player.get_state() != vlc.State.Playing
+                and self._is_active(player.get_state())
+            )
+        except Exception:
+            waiting = False
+        if waiting:
+            self._outgoing_id = self.after(OUTGOING_POLL_MS, self._outgoing_tick)
+            return
+        self._outgoing = None
+        player.stop()
+        player.audio_set_mute(False)
+        if self._current_index is not None:
+            self._preload(self._current_index + 1)
+
+    def _release_outgoing(self):
+        """Cut off a still-finishing previous track (manual play or stop)."""
+        if self._outgoing_id is not None:
+            self.after_cancel(self._outgoing_id)
+            self._outgoing_id = None
+        if self._outgoing is not None:
+            self._outgoing.stop()
+            self._outgoing.audio_set_mute(False)
+            self._outgoing = None
+
+    def _preload(self, index):
+        """Open and parse track `index` in the second player so auto-advance starts without a gap."""
+        self._clear_preload()
+        if self._outgoing is not None:
+            return  # second player still finishing the previous track; _outgoing_tick preloads
+        if not self.auto_advance.get() or not (0 <= index < len(self.audio_files)):
+            return
+        try:
+            media = self.vlc_instance.media_new(self.audio_files[index])
+            try:
+                # Asynchronous, so a slow network share does not block the Tk thread
+                media.parse_with_options(vlc.MediaParseFlag.network, 0)
+            except AttributeError:
+                media.parse_async()
+            self._next_player.set_media(media)
+            self._next_player.audio_set_volume(int(float(self.volume_scale.get())))
+            self._next_index = index
+        except Exception as e:
+            self.log_insert(f"[WARN] Could not preload next track: {e}")
+
+    def _clear_preload(self):
+        if self._next_index is not None:
+            self._next_player.stop()
+            self._next_index = None
+
+    def _on_auto_advance_toggle(self):
+        if not self.auto_advance.get():
+            self._cancel_advance()
+            self._clear_preload()
+        elif self._current_index is not None:
+            self._preload(self._current_index + 1)
+
+    def _cancel_advance(self):
+        if self._advance_id is not None:
+            self.after_cancel(self._advance_id)
+            self._advance_id = None
+
+    def _advance(self):
+        self._advance_id = None
+        index = self._next_index
+        if index is None:
+            return
+        self._play_audio_at_index(index, segue=True)
+        children = self.audio_list.get_children()
+        if index < len(children):
+            self.audio_list.selection_set(children[index])
+            self.audio_list.see(children[index])
+
     def _stop_audio(self):
-        self._stop_flag = True
+        self._cancel_playback_updater()
+        self._cancel_advance()
+        self._clear_preload()
+        self._release_outgoing()
         self.player.stop()
         self.seek_scale.set(0)
         self.playback_time_label.config(text="00:00 / 00:00")
@@ -240,38 +487,71 @@ class AudioPlayer(tk.Frame):
 
     def _seek_end(self, event):
         self._user_seeking = False
-        pos_ms = self.seek_scale.get() / 100 * self._audio_length_ms
+        length_ms = self.player.get_length()
+        if length_ms <= 0:
+            length_ms = self._audio_length_ms
+        pos_ms = self.seek_scale.get() / 100 * length_ms
         self.player.set_time(int(pos_ms))
+        if self._tick_id is None and self._is_active(self.player.get_state()):
+            self._start_playback_updater()
 
     def _set_volume(self, value):
         try:
             self.player.audio_set_volume(int(float(value)))
+            self._next_player.audio_set_volume(int(float(value)))
         except Exception:
             pass
 
     def _start_playback_updater(self):
-        def loop():
-            while not self._stop_flag:
-                try:
-                    current = self.player.get_time()
-                    total = self.player.get_length()
-                    if total > 0:
-                        percent = (current / total) * 100
-                        if not self._user_seeking:
-                            self.seek_scale.set(percent)
-                        self.playback_time_label.config(
-                            text=f"{self._format_time(current / 1000)} / {self._format_time(total / 1000)}"
-                        )
-                except Exception:
-                    pass
-                time.sleep(0.25)
-
-        threading.Thread(target=loop, daemon=True).start()
+        """(Re)start the position tick. There is only ever one, on the Tk thread."""
+        self._cancel_playback_updater()
+        self._tick_id = self.after(PLAYBACK_TICK_MS, self._playback_tick)
+
+    def _cancel_playback_updater(self):
+        if self._tick_id is not None:
+            self.after_cancel(self._tick_id)
+            self._tick_id = None
+
+    @staticmethod
+    def _is_active(state):
+        """True for player states in which the position keeps moving (or is about to)."""
+        return state in (vlc.State.Opening, vlc.State.Buffering, vlc.State.Playing)
+
+    def _playback_tick(self):
+        self._tick_id = None
+        try:
+            state = self.player.get_state()
+            current = self.player.get_time()
+            total = self.player.get_length()
+        except Exception:
+            return
+        if total > 0:
+            if not self._user_seeking:
+                self.seek_scale.set((current / total) * 100)
+            self.playback_time_label.config(
+                text=f"{self._format_time(current / 1000)} / {self._format_time(total / 1000)}"
+            )
+        if self._next_index is not None and self._advance_id is None:
+            if state == vlc.State.Ended:
+                self._advance()
+                return
+            remaining = total - current
+            if total > 0 and remaining <= PLAYBACK_TICK_MS + GAPLESS_LEAD_MS:
+                # Switch at the end of the track rather than at the next (up to 250 ms late) tick
+                self._advance_id = self.after(max(0, remaining - GAPLESS_LEAD_MS), self._advance)
+        # Paused, stopped, ended or failed: nothing moves, so stop ticking until the next play
+        if self._is_active(state):
+            self._tick_id = self.after(PLAYBACK_TICK_MS, self._playback_tick)
 
     def _format_time(self, seconds):
         m, s = divmod(int(seconds), 60)
         return f"{m:02d}:{s:02d}"
 
+    def _format_runtime(self, seconds):
+        h, rest = divmod(int(seconds), 3600)
+        m, s = divmod(rest, 60)
+        return f"{h}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
+
     def _open_rename_window(self):
         if self.rename_manager:
             self.rename_manager._open_rename_window()
@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
 import json
+from bisect import bisect_left
 from pathlib import Path
 from utils.constants import DEFAULTS, CONFIG_DIR  # Adjust this import path if needed
 
@@ -25,20 +26,111 @@ def merge_defaults_with_history(default_list, history_list):
     return merged
 
 class AutocompleteCombobox(ttk.Combobox):
+    # Only this many prefix hits are pushed into the dropdown per lookup
+    MAX_HITS = 50
+    # Delay before running a lookup, so fast typing triggers a single search
+    DEBOUNCE_MS = 60
+
     def __init__(self, master=None, **kwargs):
         super().__init__(master, **kwargs)
 
-        self._completion_list = []
+        self._base_list = []        # entries in the order they were given (or sorted)
+        self._completion_list = []  # entries in display order (shown for empty input)
+        self._sorted_list = []      # entries sorted casefolded, for prefix lookups
+        self._folded_keys = []      # casefolded entries, parallel to _sorted_list
         self._hits = []
         self._hit_index = 0
         self._ignore_autocomplete = False
+        self._showing_all = False
+        self._pending_lookup = None
+        self._last_keysym = ""
+        self._usage_stats = None    # optional UsageStats used to rank suggestions
+        self._usage_field = None
+        self._ranked_version = None
+        self._aliases = None        # optional AliasTable applied when focus leaves
+        self._alias_field = None
 
         self.bind('<KeyRelease>', self._on_keyrelease)
-        self.bind('<FocusOut>', self._reset_state)
+        self.bind('<FocusOut>', self._on_focus_out)
+
+    def set_completion_list(self, completion_list, keep_order=False):
+        """
+        Set the entries and build the casefolded prefix index once; lookups then bisect into it.
+        With keep_order=True the dropdown keeps the given order instead of sorting it.
+        """
+        sorted_index = getattr(completion_list, "sorted_index", None)
+        if sorted_index is not None:
+            # Asset snapshots carry a prebuilt index
+            self._folded_keys, self._sorted_list = sorted_index
+        else:
+            self._sorted_list = sorted(completion_list, key=str.casefold)
+            self._folded_keys = [item.casefold() for item in self._sorted_list]
+        self._base_list = list(completion_list) if keep_order else self._sorted_list
+        self._completion_list = self._base_list
+        self._ranked_version = None
+        self._refresh_ranking()
+        self._show_values(self._completion_list)
+        self._showing_all = True
+
+    def set_usage_stats(self, usage_stats, field):
+        """Rank prefix hits and the empty-input list by `usage_stats` scores for `field`."""
+        self._usage_stats = usage_stats
+        self._usage_field = field
+        self._ranked_version = None
+        if self._refresh_ranking():
+            self._show_values(self._completion_list)
+            self._showing_all = True
+
+    def set_aliases(self, aliases, field):
+        """Replace an alias typed into the entry with its canonical value on focus out."""
+        self._aliases = aliases
+        self._alias_field = field
+
+    def _refresh_ranking(self):
+        """Reorder the empty-input list if the usage stats changed since the last build."""
+        stats = self._usage_stats
+        if stats is None:
+            return False
+        version = stats.version(self._usage_field)
+        if version == self._ranked_version:
+            return False
+        self._completion_list = stats.order(self._usage_field, self._base_list)
+        self._ranked_version = version
+        self._showing_all = False
+        return True
+
+    def prefix_hits(self, text, limit=None):
+        """Return up to `limit` entries starting with `text` (case-insensitive) in O(log n + k)."""
+        key = text.casefold()
+        keys = self._folded_keys
+        start = bisect_left(keys, key)
+        stop = len(keys) if limit is None else min(len(keys), start + limit)
+        hits = []
+        for i in range(start, stop):
+            if not keys[i].startswith(key):
+                break
+            hits.append(self._sorted_list[i])
+        return hits
 
-    def set_completion_list(self, completion_list):
-        self._completion_list = sorted(completion_list, key=str.lower)
-        self['values'] = self._completion_list
+    def _lookup(self, folded):
+        """Entry whose casefolded form is `folded`, or None if it is not in the list."""
+        keys = self._folded_keys
+        i = bisect_left(keys, folded)
+        if i < len(keys) and keys[i] == folded:
+            return self._sorted_list[i]
+        return None
+
+    def _ranked_hits(self, text):
+        """Used entries for `text` best-first, topped up with unused ones in list order."""
+        hits = self._usage_stats.prefix_hits(self._usage_field, text, self._lookup, self.MAX_HITS)
+        if len(hits) < self.MAX_HITS:
+            seen = {h.casefold() for h in hits}
+            for h in self.prefix_hits(text, self.MAX_HITS + len(hits)):
+                if h.casefold() not in seen:
+                    hits.append(h)
+                    if len(hits) >= self.MAX_HITS:
+                        break
+        return hits
 
     def _on_keyrelease(self, event):
         if self._ignore_autocomplete:
@@ -47,19 +139,34 @@ class AutocompleteCombobox(ttk.Combobox):
         if event.keysym in ("Left", "Right", "Escape", "Return", "Tab", "Up", "Down"):
             return
 
+        self._last_keysym = event.keysym
+        if self._pending_lookup is not None:
+            self.after_cancel(self._pending_lookup)
+        self._pending_lookup = self.after(self.DEBOUNCE_MS, self._autocomplete)
+
+    def _autocomplete(self):
+        self._pending_lookup = None
         text = self.get()
 
         if text == "":
             self._hit_index = 0
-            self['values'] = self._completion_list
+            self._hits = []
+            self._refresh_ranking()
+            if not self._showing_all:
+                self._show_values(self._completion_list)
+                self._showing_all = True
             return
 
-        self._hits = [item for item in self._completion_list if item.lower().startswith(text.lower())]
+        if self._usage_stats is not None:
+            self._hits = self._ranked_hits(text)
+        else:
+            self._hits = self.prefix_hits(text, self.MAX_HITS)
+        self._showing_all = False
 
         if self._hits:
             first_hit = self._hits[0]
 
-            if event.keysym not in ("BackSpace", "Delete") and first_hit.lower() != text.lower():
+            if self._last_keysym not in ("BackSpace", "Delete") and first_hit.casefold() != text.casefold():
                 self._ignore_autocomplete = True
                 self.delete(0, tk.END)
                 self.insert(0, first_hit)
@@ -67,15 +174,98 @@ class AutocompleteCombobox(ttk.Combobox):
                 self.icursor(len(text))
                 self._ignore_autocomplete = False
 
-            self['values'] = self._hits
+            self._show_values(self._hits)
         else:
-            self['values'] = ()
+            self._show_values(())
+
+    def _on_focus_out(self, event=None):
+        if self._aliases is not None:
+            text = self.get()
+            canonical = self._aliases.canonical(self._alias_field, text)
+            if canonical != text:
+                self.set(canonical)
+        self._reset_state(event)
 
     def _reset_state(self, event=None):
+        if self._pending_lookup is not None:
+            self.after_cancel(self._pending_lookup)
+            self._pending_lookup = None
         self._hit_index = 0
         self._hits = []
         self._ignore_autocomplete = False
 
+    def _show_values(self, values):
+        """Put `values` into the dropdown."""
+        self['values'] = values
+
+
+class VirtualAutocompleteCombobox(AutocompleteCombobox):
+    """
+    AutocompleteCombobox for very large lists. The popdown only holds a window of
+    rows over the current entries and is extended a page at a time as the user
+    scrolls to its end, so opening it costs the same for 100 or 100k entries.
+    """
+    # Rows handed to Tk when the dropdown opens
+    WINDOW_ROWS = 200
+    # Rows appended each time the listbox is scrolled to its end
+    PAGE_ROWS = 200
+
+    def __init__(self, master=None, **kwargs):
+        self._user_postcommand = kwargs.pop("postcommand", None)
+        super().__init__(master, **kwargs)
+        self._view = ()       # entries the dropdown is a window over
+        self._loaded = 0      # how many of them Tk currently holds
+        self._listbox = None
+        self._scrollbar = None
+        self._pending_page = None
+        self.configure(postcommand=self._on_post)
+
+    def _show_values(self, values):
+        self._view = values
+        self._loaded = min(len(values), self.WINDOW_ROWS)
+        self['values'] = values[:self._loaded]
+
+    def _on_post(self):
+        if self._user_postcommand:
+            self._user_postcommand()
+        # Shrink back to the first window in case the last opening was scrolled far
+        if self._loaded > self.WINDOW_ROWS:
+            self._show_values(self._view)
+        self._hook_listbox()
+
+    def _hook_listbox(self):
+        """Route the popdown listbox's scroll updates through us (once per widget)."""
+        if self._listbox is not None:
+            return
+        try:
+            popdown = self.tk.call("ttk::combobox::PopdownWindow", self)
+            self._listbox = f"{popdown}.f.l"
+            self._scrollbar = f"{popdown}.f.sb"
+            self.tk.call(self._listbox, "configure", "-yscrollcommand", self.register(self._on_listbox_scroll))
+        except tk.TclError:
+            self._listbox = None
+
+    def _on_listbox_scroll(self, first, last):
+        try:
+            self.tk.call(self._scrollbar, "set", first, last)
+        except tk.TclError:
+            pass
+        if float(last) >= 1.0 and self._loaded < len(self._view) and self._pending_page is None:
+            self._pending_page = self.after_idle(self._load_page)
+
+    def _load_page(self):
+        self._pending_page = None
+        more = self._view[self._loaded:self._loaded + self.PAGE_ROWS]
+        if not more:
+            return
+        self._loaded += len(more)
+        try:
+            self.tk.call(self._listbox, "insert", "end", *more)
+        except tk.TclError:
+            pass
+        # Keep -values in step so selecting a row resolves to the right entry
+        self['values'] = self._view[:self._loaded]
+
 def create_labeled_autocomplete(parent, label_text, default_list, history_list):
     frame = ttk.Frame(parent)
     label = ttk.Label(frame, text=label_text, width=12, anchor="w")
@@ -12,13 +12,14 @@ def update_combobox_values(
     last_genre,
     last_add,  # Added this parameter
     comboboxes_dict,
+    aliases=None,
 ):
     """
     Update combobox values for artist, venue, city, add, source, format, genre.
     Args:
-        artists_list (list): List of artists from assets.
-        venues_list (list): List of venues from assets.
-        cities_list (list): List of cities from assets.
+        artists_list (Sequence): Artists from assets (list or AssetSnapshot).
+        venues_list (Sequence): Venues from assets (list or AssetSnapshot).
+        cities_list (Sequence): Cities from assets (list or AssetSnapshot).
         artist_cache (set): Cached artist entries.
         genre_cache (set): Cached genre entries.
         histories (dict): Dict of sets containing history entries keyed by category.
@@ -36,6 +37,8 @@ def update_combobox_values(
                 "format": ttk.Combobox,
                 "genre": ttk.Combobox,
             }
+        aliases (AliasTable, optional): When given, artist/venue/city values are
+            canonicalized so aliases collapse into a single entry.
     Returns:
         None. Modifies comboboxes in place.
     """
@@ -46,11 +49,11 @@ def update_combobox_values(
        
         # Load base list from .txt file or DEFAULTS
         if key == "artist":
-            base_defaults = artists_list.copy()
+            base_defaults = list(artists_list)
         elif key == "venue":
-            base_defaults = venues_list.copy()
+            base_defaults = list(venues_list)
         elif key == "city":
-            base_defaults = cities_list.copy()
+            base_defaults = list(cities_list)
         else:
             base_defaults = DEFAULTS.get(key, []).copy()
        
@@ -91,6 +94,13 @@ def update_combobox_values(
                 final_list.append(val)
                 seen.add(val)
        
-        # Set combobox values if exists
+        # Collapse aliases into their canonical spelling (keeping first-seen order)
+        if aliases is not None and key in ("artist", "venue", "city"):
+            final_list = list(dict.fromkeys(aliases.canonical(key, val) for val in final_list))
+
+        # Set combobox values if exists (rebuilding the autocomplete index when supported)
         if combobox:
-            combobox["values"] = final_list
\ No newline at end of file
+            if hasattr(combobox, "set_completion_list"):
+                combobox.set_completion_list(final_list, keep_order=True)
+            else:
+                combobox["values"] = final_list
\ No newline at end of file
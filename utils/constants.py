@@ -7,11 +7,32 @@ CACHE_DIR = Path("cache")
 
 HISTORY_FILE = CONFIG_DIR / "history_cache.json"
 USED_CACHE_FILE = CONFIG_DIR / "used_cache.json"
+USAGE_STATS_FILE = CONFIG_DIR / "usage_stats.json"
+# Append-only journal of the processing queue, replayed on startup
+QUEUE_JOURNAL_FILE = CONFIG_DIR / "queue_journal.log"
 
 ARTISTS_FILE = ASSETS_DIR / "artists.txt"
 VENUES_FILE = ASSETS_DIR / "venues.txt"
 CITIES_FILE = ASSETS_DIR / "cities.txt"
 
+# User-editable alias tables, one per field ("GD | The Grateful Dead = Grateful Dead")
+ALIAS_FILES = {
+    "artist": ASSETS_DIR / "artist_aliases.txt",
+    "venue": ASSETS_DIR / "venue_aliases.txt",
+    "city": ASSETS_DIR / "city_aliases.txt",
+}
+
+# Append-only journal of asset list changes, compacted back into the .txt files
+ASSET_JOURNAL_FILE = CACHE_DIR / "asset_journal.log"
+# SQLite index of every folder under the library roots, for search
+LIBRARY_INDEX_FILE = CACHE_DIR / "library_index.sqlite3"
+# Structured processing events (one JSON object per line, one file per day)
+EVENT_LOG_DIR = Path("logs") / "events"
+# Daily event files older than this are deleted (the history viewer searches up to 30 days)
+EVENT_LOG_RETENTION_DAYS = 45
+# SQLite index over the event files, for the processing history viewer
+EVENT_INDEX_FILE = CACHE_DIR / "event_index.sqlite3"
+
 # --- Default dropdown values ---
 DEFAULTS = {
     "source": ["SBD", "AUD", "MTX", "FM", "DAT"],
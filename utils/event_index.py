@@ -0,0 +1,221 @@
+# utils/event_index.py
+import os
+import json
+import math
+import sqlite3
+import threading
+
+from utils.constants import EVENT_INDEX_FILE, EVENT_LOG_DIR
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL,
+    ts REAL NOT NULL,
+    event TEXT NOT NULL,
+    batch TEXT,
+    folder TEXT,
+    folder_folded TEXT,
+    artist TEXT,
+    artist_folded TEXT,
+    error_type TEXT,
+    ms REAL,
+    bytes INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_ts ON events(ts);
+CREATE INDEX IF NOT EXISTS events_event_ts ON events(event, ts);
+CREATE INDEX IF NOT EXISTS events_artist ON events(artist_folded);
+CREATE INDEX IF NOT EXISTS events_error ON events(error_type);
+CREATE INDEX IF NOT EXISTS events_ms ON events(ms);
+CREATE INDEX IF NOT EXISTS events_file ON events(file);
+"""
+
+# Commit the ingest transaction every this many events
+COMMIT_EVERY = 5000
+
+
+def _text(value):
+    return value if isinstance(value, str) else ("" if value is None else str(value))
+
+
+def _number(value):
+    """Numeric column value, or None for anything that is not a number."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return value
+
+
+class EventIndex:
+    """
+    SQLite index over the JSON-lines event files in EVENT_LOG_DIR.
+
+    Files are append-only, so `update()` remembers how far each one was read and
+    only parses new lines; files that were deleted drop their rows. `query()`
+    filters on the indexed columns (time, event type, artist, error type,
+    duration) plus a substring match on the folder path.
+    """
+
+    def __init__(self, db_path=EVENT_INDEX_FILE, directory=EVENT_LOG_DIR, log_func=None):
+        self.db_path = db_path
+        self.directory = directory
+        self.log = log_func or (lambda msg, level="info": None)
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(str(self.db_path)) or ".", exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    # ------------------------------------------------------------------
+    # ingest
+    # ------------------------------------------------------------------
+    def update(self):
+        """Index lines appended since the last update. Returns the number of new events."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                return self._update(conn)
+            finally:
+                conn.close()
+
+    def _update(self, conn):
+        try:
+            names = sorted(n for n in os.listdir(self.directory) if n.endswith(".jsonl"))
+        except OSError:
+            names = []
+        known = dict(conn.execute("SELECT name, offset FROM files"))
+
+        for gone in set(known) - set(names):
+            conn.execute("DELETE FROM events WHERE file = ?", (gone,))
+            conn.execute("DELETE FROM files WHERE name = ?", (gone,))
+
+        added = skipped = 0
+        for name in names:
+            path = os.path.join(self.directory, name)
+            offset = known.get(name, 0)
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                continue
+            if size < offset:
+                # Truncated or replaced: index it again from the start
+                conn.execute("DELETE FROM events WHERE file = ?", (name,))
+                offset = 0
+            if size == offset:
+                continue
+            with open(path, "rb") as f:
+                f.seek(offset)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # line still being written; picked up next time
+                    offset += len(raw)
+                    try:
+                        record = json.loads(raw)
+                        self._insert(conn, name, record, raw)
+                    except (ValueError, TypeError, OverflowError, sqlite3.InterfaceError) as e:
+                        # Torn or malformed line: skip it rather than stall the whole index
+                        skipped += 1
+                        if skipped == 1:
+                            self.log(f"Skipping malformed event in {name}: {e}", level="debug")
+                        continue
+                    added += 1
+                    if added % COMMIT_EVERY == 0:
+                        conn.execute("INSERT OR REPLACE INTO files (name, offset) VALUES (?, ?)", (name, offset))
+                        conn.commit()
+            conn.execute("INSERT OR REPLACE INTO files (name, offset) VALUES (?, ?)", (name, offset))
+        conn.commit()
+        if added:
+            self.log(f"Indexed {added} processing event(s).", level="debug")
+        if skipped:
+            self.log(f"Skipped {skipped} malformed processing event(s).", level="warning")
+        return added
+
+    @staticmethod
+    def _insert(conn, name, record, raw):
+        """Insert one event. Raises ValueError/TypeError for a record of the wrong shape."""
+        if not isinstance(record, dict):
+            raise ValueError(f"event is a {type(record).__name__}, not an object")
+        ts = _number(record.get("ts", 0))
+        if ts is None or not math.isfinite(ts):
+            raise ValueError(f"bad timestamp {record.get('ts')!r}")
+        folder = _text(record.get("folder"))
+        artist = _text(record.get("artist"))
+        error_type = record.get("error_type")
+        conn.execute(
+            "INSERT INTO events (file, ts, event, batch, folder, folder_folded, artist, artist_folded, "
+            "error_type, ms, bytes, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                name, ts, _text(record.get("event")), _text(record.get("batch")) or None,
+                folder, folder.casefold(), artist, artist.casefold(),
+                _text(error_type) or None, _number(record.get("ms")), _number(record.get("bytes")),
+                raw.decode("utf-8", errors="replace").strip(),
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # queries
+    # ------------------------------------------------------------------
+    def query(self, folder=None, artist=None, event=None, error_type=None, min_ms=None, since=None, limit=1000):
+        """
+        Return matching events, newest first, as dicts (the original JSON record).
+        `folder` is a case-insensitive substring, `artist` an exact (case-insensitive)
+        name, `since` a Unix timestamp and `min_ms` a minimum duration.
+        """
+        where, params = [], []
+        if folder:
+            where.append("folder_folded LIKE ? ESCAPE '\\'")
+            escaped = folder.casefold().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.append(f"%{escaped}%")
+        if artist:
+            where.append("artist_folded = ?")
+            params.append(artist.casefold())
+        if event:
+            where.append("event = ?")
+            params.append(event)
+        if error_type:
+            where.append("error_type = ?")
+            params.append(error_type)
+        if min_ms is not None:
+            where.append("ms >= ?")
+            params.append(min_ms)
+        if since is not None:
+            where.append("ts >= ?")
+            params.append(since)
+        sql = "SELECT data FROM events"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY ts DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(sql, params).fetchall()
+            except sqlite3.Error as e:
+                self.log(f"[ERROR] Event log query failed: {e}", level="error")
+                return []
+            finally:
+                conn.close()
+        return [json.loads(data) for (data,) in rows]
+
+    def distinct(self, column):
+        """Distinct non-empty values of an indexed column (e.g. 'error_type', 'artist'), sorted."""
+        if column not in ("event", "artist", "error_type"):
+            raise ValueError(f"Not a filter column: {column}")
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    f"SELECT DISTINCT {column} FROM events WHERE {column} IS NOT NULL AND {column} != ''"
+                ).fetchall()
+            finally:
+                conn.close()
+        return sorted((r[0] for r in rows), key=str.casefold)
@@ -0,0 +1,108 @@
+# utils/event_log.py
+import os
+import re
+import json
+import time
+import threading
+import itertools
+
+from utils.constants import EVENT_LOG_DIR, EVENT_LOG_RETENTION_DAYS
+
+# Event types written by Processor and process_thread
+EVENT_TYPES = (
+    "batch_start", "batch_end",
+    "folder_start", "folder_end",
+    "move", "tag", "collision", "error",
+)
+
+
+_batch_counter = itertools.count(1)
+
+_EVENT_FILE_RX = re.compile(r"^events-(\d{4}-\d{2}-\d{2})\.jsonl$")
+
+
+def new_batch_id():
+    """Identifier shared by every event of one processing run."""
+    return time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}-{next(_batch_counter)}"
+
+
+class EventLog:
+    """
+    Append-only JSON-lines log of processing events, one file per day
+    (events-YYYY-MM-DD.jsonl).
+
+    `emit(event, **fields)` adds a UTC timestamp and writes one line under a lock,
+    so it can be called from the processing worker threads. Lines are flushed as
+    they are written, so a crash loses at most the line being written.
+    """
+
+    def __init__(self, directory=EVENT_LOG_DIR, log_func=None):
+        self.directory = directory
+        self.log = log_func or (lambda msg, level="info": None)
+        self._lock = threading.Lock()
+        self._file = None
+        self._day = None
+        self._failed = False
+
+    def _open_for(self, day):
+        if self._file is not None:
+            self._file.close()
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"events-{day}.jsonl")
+        self._file = open(path, "a", encoding="utf-8")
+        self._day = day
+
+    def emit(self, event, **fields):
+        record = {"ts": round(time.time(), 3), "event": event}
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        day = time.strftime("%Y-%m-%d", time.gmtime(record["ts"]))
+        with self._lock:
+            try:
+                if day != self._day:
+                    self._open_for(day)
+                self._file.write(line)
+                self._file.flush()
+                self._failed = False
+            except Exception as e:
+                # Report once per failure streak rather than once per event
+                if not self._failed:
+                    self._failed = True
+                    self.log(f"[ERROR] Failed to write processing event log: {e}", level="error")
+
+    def prune(self, days=EVENT_LOG_RETENTION_DAYS):
+        """
+        Delete daily event files older than `days` (by the date in their name).
+        The file currently being written is never removed. Returns the number deleted.
+        """
+        cutoff = time.strftime("%Y-%m-%d", time.gmtime(time.time() - days * 86400))
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return 0
+        removed = 0
+        for name in names:
+            m = _EVENT_FILE_RX.match(name)
+            if not m or m.group(1) >= cutoff:
+                continue
+            with self._lock:
+                if m.group(1) == self._day:
+                    continue
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                    removed += 1
+                except OSError as e:
+                    self.log(f"[ERROR] Failed to remove old event log {name}: {e}", level="error")
+        if removed:
+            self.log(f"Removed {removed} event log file(s) older than {days} days.", level="debug")
+        return removed
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._day = None
+
+
+EVENTS = EventLog()
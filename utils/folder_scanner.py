@@ -0,0 +1,105 @@
+# utils/folder_scanner.py
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from utils.metadata_parser import merge_metadata
+
+AUDIO_EXTENSIONS = ('.flac', '.mp3', '.m4a', '.wav', '.ogg')
+
+# Sub-folders like "CD1", "Disc 2" or "Set 1" belong to the show folder above them
+DISC_FOLDER_RX = re.compile(r'^(cd|disc|disk|set)\s*[-_ ]?\d+\b', re.IGNORECASE)
+
+DEFAULT_WORKERS = min(16, (os.cpu_count() or 4) * 2)
+
+
+def _scan_dir(path):
+    """List one directory: returns (contains audio, [sub-directory paths])."""
+    has_audio = False
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif not has_audio and entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                        has_audio = True
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return has_audio, subdirs
+
+
+def find_show_folders(root, max_workers=DEFAULT_WORKERS, log_func=None):
+    """
+    Walk `root` with os.scandir on a thread pool and return the show folders under it:
+    directories that directly contain audio files. Disc sub-folders ("CD1", "Disc 2")
+    report their parent instead. Show and disc folders are not descended into.
+    """
+    if log_func is None:
+        def log_func(msg, level="debug"): pass
+
+    shows = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {pool.submit(_scan_dir, root): root}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                path = pending.pop(fut)
+                has_audio, subdirs = fut.result()
+                if has_audio:
+                    if DISC_FOLDER_RX.match(os.path.basename(path)) and path != root:
+                        shows.setdefault(os.path.dirname(path), None)
+                    else:
+                        shows.setdefault(path, None)
+                    # Neither a show folder nor a disc folder is descended into
+                    continue
+                for sub in subdirs:
+                    pending[pool.submit(_scan_dir, sub)] = sub
+
+    # A disc folder's parent may hold audio itself; keep each show once, in path order
+    result = sorted(shows)
+    log_func(f"Found {len(result)} show folder(s) under {root}", level="info")
+    return result
+
+
+def infer_folders(folders, artists_list, venues_list, cities_list, max_workers=DEFAULT_WORKERS, progress=None):
+    """
+    Run merge_metadata for each folder across a thread pool (tag reading and .txt
+    parsing are I/O bound). Returns [(folder, metadata), ...] in the given order.
+    `progress(done, total)` is called from the calling thread as results arrive.
+    """
+    folders = list(folders)
+    results = [None] * len(folders)
+
+    def infer(index):
+        folder = folders[index]
+        try:
+            return index, merge_metadata(os.path.basename(folder), folder, artists_list, venues_list, cities_list)
+        except Exception:
+            return index, {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for done, (index, md) in enumerate(pool.map(infer, range(len(folders))), 1):
+            results[index] = (folders[index], md)
+            if progress:
+                progress(done, len(folders))
+    return results
+
+
+def scan_and_infer(root, artists_list, venues_list, cities_list, max_workers=DEFAULT_WORKERS, log_func=None):
+    """Find every show folder under `root` and infer its metadata. See find_show_folders."""
+    if log_func is None:
+        def log_func(msg, level="debug"): pass
+
+    folders = find_show_folders(root, max_workers=max_workers, log_func=log_func)
+
+    step = max(1, len(folders) // 10)
+
+    def progress(done, total):
+        if done % step == 0 or done == total:
+            log_func(f"Inferred metadata for {done}/{total} folder(s)", level="info")
+
+    return infer_folders(folders, artists_list, venues_list, cities_list, max_workers=max_workers, progress=progress)
@@ -1,17 +1,22 @@
 import tkinter as tk
 from utils.logger import safe_log_to_backend
+from utils.log_sink import LogSink, DEFAULT_MAX_LINES
 
 class GuiLogger:
     """
     GUI-aware logger that buffers messages until the Tk Text widget is ready.
-    Delegates real logging to utils.logger.safe_log_to_backend.
+    Delegates real logging to utils.logger.safe_log_to_backend; GUI output goes
+    through a LogSink, so log() is safe from any thread and cheap in bulk.
     """
     def __init__(self):
         self._log_widget = None
         self._pending_logs = []  # (msg, level, tag)
+        self.sink = LogSink()
 
-    def attach(self, text_widget: tk.Text):
+    def attach(self, text_widget: tk.Text, max_lines: int = DEFAULT_MAX_LINES):
         self._log_widget = text_widget
+        self.sink.max_lines = max_lines
+        self.sink.attach(text_widget)
         self._flush_pending()
 
     def log(self, msg: str, level: str = "info", tag: str = None):
@@ -22,14 +27,7 @@ class GuiLogger:
             return  # Skip debug messages in GUI
 
         if self._log_widget:
-            try:
-                tag_to_use = tag or level  # fallback to level as tag
-                self._log_widget.config(state="normal")
-                self._log_widget.insert(tk.END, msg + "\n", (tag_to_use,))
-                self._log_widget.config(state="disabled")
-                self._log_widget.see(tk.END)
-            except Exception:
-                pass
+            self.sink.write(msg + "\n", (tag or level,))  # fallback to level as tag
         else:
             self._pending_logs.append((msg, level, tag))
 
@@ -37,18 +35,12 @@ class GuiLogger:
         if not self._log_widget:
             return
 
-        self._log_widget.config(state="normal")
         for msg, level, tag in self._pending_logs:
             if level == "debug":
                 continue
-            try:
-                tag_to_use = tag or level
-                self._log_widget.insert(tk.END, msg + "\n", (tag_to_use,))
-            except Exception:
-                pass
-        self._log_widget.config(state="disabled")
-        self._log_widget.see(tk.END)
+            self.sink.write(msg + "\n", (tag or level,))
         self._pending_logs.clear()
+        self.sink.flush()
 
     def buffer(self, msg: str, level: str = "info", tag: str = None):
         if level != "debug":
@@ -0,0 +1,168 @@
+# utils/io_scheduler.py
+import os
+import threading
+from collections import OrderedDict, deque
+
+# Concurrent jobs allowed per device kind: spinning disks are kept sequential,
+# SSDs and network shares get parallelism. Devices that cannot be classified
+# (including every device on Windows) are treated like a spinning disk.
+DEVICE_CONCURRENCY = {
+    "hdd": 1,
+    "ssd": 4,
+    "network": 4,
+    "unknown": 1,
+}
+
+DEFAULT_MAX_WORKERS = 8
+
+_kind_cache = {}
+
+
+def _existing_path(path):
+    """Return `path` or its nearest existing ancestor (destinations may not exist yet)."""
+    path = os.path.abspath(path or ".")
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+def device_id(path):
+    """Return st_dev of `path` (or of its nearest existing ancestor), or None."""
+    try:
+        return os.stat(_existing_path(path)).st_dev
+    except OSError:
+        return None
+
+
+def device_kind(dev):
+    """
+    Classify a device number as "hdd", "ssd", "network" or "unknown".
+    Uses /sys/dev/block/<major>:<minor>/queue/rotational on Linux (falling back to the
+    parent disk for partitions). Devices without a block entry and major number 0
+    (NFS, SMB/CIFS, FUSE) count as network. Platforms without os.major (Windows)
+    always get "unknown".
+    """
+    if dev is None or not hasattr(os, "major"):
+        return "unknown"
+    kind = _kind_cache.get(dev)
+    if kind is not None:
+        return kind
+
+    kind = "unknown"
+    try:
+        major, minor = os.major(dev), os.minor(dev)
+    except (OSError, ValueError, OverflowError):
+        _kind_cache[dev] = kind
+        return kind
+    sys_dev = f"/sys/dev/block/{major}:{minor}"
+    if os.path.exists(sys_dev):
+        real = os.path.realpath(sys_dev)
+        for candidate in (real, os.path.dirname(real)):
+            try:
+                with open(os.path.join(candidate, "queue", "rotational"), "r") as f:
+                    kind = "hdd" if f.read().strip() == "1" else "ssd"
+                break
+            except OSError:
+                continue
+    elif os.path.isdir("/sys/dev/block") and major == 0:
+        kind = "network"
+
+    _kind_cache[dev] = kind
+    return kind
+
+
+def device_limit(dev):
+    return DEVICE_CONCURRENCY.get(device_kind(dev), DEVICE_CONCURRENCY["unknown"])
+
+
+class IOScheduler:
+    """
+    Runs per-item jobs grouped by (source device, destination device).
+
+    Each group gets its own lane of worker threads, as many as the slower of its two
+    devices allows, and works through its items in queue order. A device shared by
+    several groups is guarded by a semaphore sized to its limit, so a spinning disk
+    never sees more than one job at a time. MAX_WORKERS caps the total.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, log_func=None):
+        self.max_workers = max(1, max_workers)
+        self.log = log_func or (lambda msg, level="info": None)
+
+    def plan(self, items, src_func, dst_func=None):
+        """Group items by (src_dev, dst_dev). Returns OrderedDict key -> [(index, item)]."""
+        groups = OrderedDict()
+        for index, item in enumerate(items):
+            src = device_id(src_func(item))
+            dst = device_id(dst_func(item)) if dst_func else src
+            groups.setdefault((src, dst), []).append((index, item))
+        return groups
+
+    def run(self, items, work, src_func, dst_func=None):
+        """
+        Call work(item) for every item and return the results in item order.
+        An exception from work() is logged and its result is None.
+        """
+        items = list(items)
+        results = [None] * len(items)
+        if not items:
+            return results
+
+        groups = self.plan(items, src_func, dst_func)
+        devices = {dev for key in groups for dev in key}
+
+        if all(device_kind(dev) == "unknown" for dev in devices):
+            # Nothing could be classified: one sequential lane in queue order
+            self.log("I/O devices unknown; processing sequentially", level="debug")
+            for index, item in enumerate(items):
+                try:
+                    results[index] = work(item)
+                except Exception as e:
+                    self.log(f"Job failed for {item}: {e}", level="error")
+            return results
+
+        device_sems = {dev: threading.BoundedSemaphore(device_limit(dev)) for dev in devices}
+        total_sem = threading.BoundedSemaphore(self.max_workers)
+
+        for (src, dst), members in groups.items():
+            self.log(
+                f"I/O group {device_kind(src)}({src}) -> {device_kind(dst)}({dst}): {len(members)} item(s)",
+                level="debug",
+            )
+
+        def lane(queue, lock, sems):
+            while True:
+                with lock:
+                    if not queue:
+                        return
+                    index, item = queue.popleft()
+                for sem in sems:
+                    sem.acquire()
+                total_sem.acquire()
+                try:
+                    results[index] = work(item)
+                except Exception as e:
+                    self.log(f"Job failed for {item}: {e}", level="error")
+                finally:
+                    total_sem.release()
+                    for sem in reversed(sems):
+                        sem.release()
+
+        threads = []
+        for (src, dst), members in groups.items():
+            queue = deque(members)
+            lock = threading.Lock()
+            # Acquire device semaphores in a fixed order so lanes cannot deadlock
+            sems = [device_sems[dev] for dev in sorted({src, dst}, key=lambda d: (d is None, d or 0))]
+            width = min(device_limit(src), device_limit(dst), len(members), self.max_workers)
+            for _ in range(width):
+                t = threading.Thread(target=lane, args=(queue, lock, sems), daemon=True)
+                t.start()
+                threads.append(t)
+
+        for t in threads:
+            t.join()
+        return results
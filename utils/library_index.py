@@ -0,0 +1,232 @@
+# utils/library_index.py
+import os
+import re
+import time
+import sqlite3
+import threading
+
+from utils.constants import LIBRARY_INDEX_FILE
+from utils.folder_scanner import AUDIO_EXTENSIONS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    name TEXT NOT NULL,
+    name_folded TEXT NOT NULL,
+    mtime_ns INTEGER,
+    audio_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs(parent);
+CREATE INDEX IF NOT EXISTS dirs_name ON dirs(name_folded);
+"""
+
+# Full-text index over folder names, kept in sync with `dirs` by triggers
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS dirs_fts USING fts5(name, content='dirs', content_rowid='rowid');
+CREATE TRIGGER IF NOT EXISTS dirs_ai AFTER INSERT ON dirs BEGIN
+    INSERT INTO dirs_fts(rowid, name) VALUES (new.rowid, new.name);
+END;
+CREATE TRIGGER IF NOT EXISTS dirs_ad AFTER DELETE ON dirs BEGIN
+    INSERT INTO dirs_fts(dirs_fts, rowid, name) VALUES ('delete', old.rowid, old.name);
+END;
+"""
+
+# Commit the scan transaction every this many changed folders
+COMMIT_EVERY = 500
+
+_TOKEN_RX = re.compile(r"\w+", re.UNICODE)
+
+
+def _norm(path):
+    return os.path.normpath(path)
+
+
+def _subtree_bounds(path):
+    """
+    Key range covering every path strictly below `path` (sep is followed by the next
+    code point). Roots such as "/" or "C:\\" already end in the separator.
+    """
+    base = path if path.endswith(os.sep) else path + os.sep
+    return base, base[:-1] + chr(ord(os.sep) + 1)
+
+
+class LibraryIndex:
+    """
+    SQLite index of every directory under the library roots: name, path, mtime and
+    number of audio files directly inside.
+
+    `start_scan(roots)` refreshes it on a background thread. A directory whose mtime
+    is unchanged is not re-listed: its stored children are reused (and stat'ed, since
+    changes deeper down do not bubble up to the parent's mtime). `search(text)` runs
+    a prefix full-text query (FTS5 when available, else a substring LIKE, which scans
+    every row).
+    """
+
+    def __init__(self, db_path=LIBRARY_INDEX_FILE, log_func=None):
+        self.db_path = db_path
+        self.log = log_func or (lambda msg, level="info": None)
+        self._scan_lock = threading.Lock()
+        self._scan_thread = None
+        self._rescan = None          # roots requested while a scan was running
+        self._conn = None            # reader connection, owned by the thread that searches
+        self.has_fts = False
+        try:
+            conn = self._connect()
+            conn.close()
+        except Exception as e:
+            self.log(f"[ERROR] Failed to open library index: {e}", level="error")
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(str(self.db_path)) or ".", exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        try:
+            conn.executescript(FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            self.has_fts = False  # SQLite built without FTS5
+        return conn
+
+    # ------------------------------------------------------------------
+    # scanning
+    # ------------------------------------------------------------------
+    def start_scan(self, roots):
+        """Refresh the index for `roots` in the background; queues one rerun if busy."""
+        roots = [_norm(r) for r in roots if r and os.path.isdir(r)]
+        if not roots:
+            return
+        with self._scan_lock:
+            if self._scan_thread is not None and self._scan_thread.is_alive():
+                self._rescan = roots
+                return
+            self._scan_thread = threading.Thread(target=self._scan_worker, args=(roots,), daemon=True)
+            self._scan_thread.start()
+
+    def _scan_worker(self, roots):
+        while roots:
+            try:
+                self.scan(roots)
+            except Exception as e:
+                self.log(f"[ERROR] Library index scan failed: {e}", level="error")
+            with self._scan_lock:
+                roots, self._rescan = self._rescan, None
+
+    def scan(self, roots):
+        """Synchronously refresh the index for `roots`."""
+        start = time.monotonic()
+        conn = self._connect()
+        listed = reused = 0
+        try:
+            for root in roots:
+                stack = [(root, os.path.dirname(root))]
+                while stack:
+                    path, parent = stack.pop()
+                    try:
+                        mtime_ns = os.stat(path).st_mtime_ns
+                    except OSError:
+                        self._delete_subtree(conn, path)
+                        continue
+                    row = conn.execute("SELECT mtime_ns FROM dirs WHERE path = ?", (path,)).fetchone()
+                    if row is not None and row[0] == mtime_ns:
+                        children = [r[0] for r in conn.execute("SELECT path FROM dirs WHERE parent = ?", (path,))]
+                        reused += 1
+                    else:
+                        children = self._index_dir(conn, path, parent, mtime_ns)
+                        listed += 1
+                        if listed % COMMIT_EVERY == 0:
+                            conn.commit()
+                    stack.extend((child, path) for child in children)
+            conn.commit()
+        finally:
+            conn.close()
+        self.log(
+            f"Library index updated: {listed} folder(s) listed, {reused} unchanged "
+            f"in {time.monotonic() - start:.1f}s.",
+            level="debug",
+        )
+
+    def _index_dir(self, conn, path, parent, mtime_ns):
+        """List `path`, store its row and drop sub-directories that disappeared."""
+        children = []
+        audio_count = 0
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            children.append(_norm(entry.path))
+                        elif entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                            audio_count += 1
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+
+        name = os.path.basename(path) or path
+        conn.execute(
+            "INSERT INTO dirs (path, parent, name, name_folded, mtime_ns, audio_count) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(path) DO UPDATE SET parent = excluded.parent, mtime_ns = excluded.mtime_ns, "
+            "audio_count = excluded.audio_count",
+            (path, parent, name, name.casefold(), mtime_ns, audio_count),
+        )
+        existing = {r[0] for r in conn.execute("SELECT path FROM dirs WHERE parent = ?", (path,))}
+        for gone in existing.difference(children):
+            self._delete_subtree(conn, gone)
+        return children
+
+    def _delete_subtree(self, conn, path):
+        lo, hi = _subtree_bounds(path)
+        conn.execute("DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)", (path, lo, hi))
+
+    # ------------------------------------------------------------------
+    # searching
+    # ------------------------------------------------------------------
+    def search(self, text, roots=None, limit=50):
+        """
+        Return up to `limit` (name, path, audio_count) rows whose folder name matches
+        every word of `text` as a prefix (as a substring without FTS5), restricted to
+        `roots` when given.
+        """
+        tokens = _TOKEN_RX.findall(text or "")
+        if not tokens:
+            return []
+        if self._conn is None:
+            self._conn = self._connect()
+
+        where, params = [], []
+        if roots:
+            clauses = []
+            for root in roots:
+                root = _norm(root)
+                lo, hi = _subtree_bounds(root)
+                clauses.append("(d.path = ? OR (d.path >= ? AND d.path < ?))")
+                params.extend((root, lo, hi))
+            where.append("(" + " OR ".join(clauses) + ")")
+
+        try:
+            if self.has_fts:
+                match = " ".join('"' + t.replace('"', '""') + '"*' for t in tokens)
+                sql = (
+                    "SELECT d.name, d.path, d.audio_count FROM dirs_fts f JOIN dirs d ON d.rowid = f.rowid "
+                    "WHERE dirs_fts MATCH ?" + "".join(" AND " + w for w in where) +
+                    " ORDER BY f.rank LIMIT ?"
+                )
+                return self._conn.execute(sql, [match, *params, limit]).fetchall()
+            likes = [f"%{t.casefold()}%" for t in tokens]
+            sql = (
+                "SELECT d.name, d.path, d.audio_count FROM dirs d WHERE " +
+                " AND ".join(["d.name_folded LIKE ?"] * len(likes) + where) +
+                " ORDER BY d.name_folded LIMIT ?"
+            )
+            return self._conn.execute(sql, [*likes, *params, limit]).fetchall()
+        except sqlite3.Error as e:
+            self.log(f"[ERROR] Library search failed: {e}", level="error")
+            return []
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
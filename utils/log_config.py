@@ -0,0 +1,65 @@
+# utils/log_config.py
+import logging
+
+# config.ini section holding one level per module, e.g. "match_folder = DEBUG"
+CONFIG_SECTION = "LogLevels"
+
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+# Menu/config name -> logger. Module loggers are children of "tagforge", so their
+# records reach its file and console handlers.
+LOG_MODULES = {
+    "app": "tagforge",
+    "match_folder": "tagforge.match_folder",
+    "metadata_parser": "tagforge.metadata_parser",
+    "scheme_evaluator": "tagforge.scheme_evaluator",
+    "processor": "tagforge.processor",
+    "process_thread": "tagforge.process_thread",
+}
+
+# Hot paths default to INFO, so their per-folder debug messages are never formatted
+DEFAULT_LEVELS = {
+    "app": "DEBUG",
+    "match_folder": "INFO",
+    "metadata_parser": "INFO",
+    "scheme_evaluator": "INFO",
+    "processor": "INFO",
+    "process_thread": "INFO",
+}
+
+
+def module_logger(name):
+    """Logger for one of the LOG_MODULES entries."""
+    return logging.getLogger(LOG_MODULES[name])
+
+
+def get_level(name):
+    return logging.getLevelName(module_logger(name).getEffectiveLevel())
+
+
+def set_level(name, level, cfg=None, config_file=None):
+    """Set a module's level now; with `cfg`/`config_file`, also persist it to config.ini."""
+    level = level.upper()
+    if level not in LEVELS:
+        raise ValueError(f"Unknown log level: {level}")
+    module_logger(name).setLevel(level)
+    if cfg is not None:
+        if not cfg.has_section(CONFIG_SECTION):
+            cfg.add_section(CONFIG_SECTION)
+        cfg.set(CONFIG_SECTION, name, level)
+        if config_file is not None:
+            with open(config_file, "w", encoding="utf-8") as f:
+                cfg.write(f)
+
+
+def apply_levels(cfg=None, log_func=None):
+    """Set every module's level from config.ini, falling back to DEFAULT_LEVELS."""
+    for name in LOG_MODULES:
+        level = DEFAULT_LEVELS[name]
+        if cfg is not None:
+            level = cfg.get(CONFIG_SECTION, name, fallback=level).strip().upper()
+        if level not in LEVELS:
+            if log_func:
+                log_func(f"Ignoring unknown log level '{level}' for {name}", level="warning")
+            level = DEFAULT_LEVELS[name]
+        module_logger(name).setLevel(level)
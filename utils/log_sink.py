@@ -0,0 +1,107 @@
+# utils/log_sink.py
+import threading
+from collections import deque
+
+# Lines kept in the log widget; older ones are trimmed from the top
+DEFAULT_MAX_LINES = 5000
+# Messages held between flushes before the oldest are dropped
+MAX_PENDING = 5000
+# How often the Tk thread drains pending messages into the widget
+FLUSH_MS = 50
+
+_SINKS = {}  # Tk path name of the widget -> LogSink
+
+
+class LogSink:
+    """
+    Thread-safe ring buffer between log producers and a Tk Text widget.
+
+    Producers (any thread) only append to the buffer. Every FLUSH_MS the Tk thread
+    drains it with a single insert and a single see(), then trims the widget to
+    `max_lines`. If producers outrun the flush, the oldest pending messages are
+    dropped and a note says how many.
+    """
+
+    def __init__(self, max_lines=DEFAULT_MAX_LINES, max_pending=MAX_PENDING, flush_ms=FLUSH_MS):
+        self.max_lines = max_lines
+        self.flush_ms = flush_ms
+        self.widget = None
+        self._lock = threading.Lock()
+        self._pending = deque(maxlen=max_pending)  # each entry: [(text, tags), ...]
+        self._dropped = 0
+
+    def attach(self, widget):
+        self.widget = widget
+        _SINKS[str(widget)] = self
+        self.flush()
+        widget.after(self.flush_ms, self._tick)
+
+    def write(self, text, tags=None):
+        self.write_parts([(text, tags)])
+
+    def write_parts(self, parts):
+        """Queue several (text, tags) pieces that must appear together, e.g. one multi-coloured line."""
+        with self._lock:
+            if len(self._pending) == self._pending.maxlen:
+                self._dropped += 1
+            self._pending.append(parts)
+
+    def _tick(self):
+        try:
+            self.flush()
+            self.widget.after(self.flush_ms, self._tick)
+        except Exception:
+            # Widget destroyed: stop flushing
+            _SINKS.pop(str(self.widget), None)
+
+    def flush(self):
+        """Drain pending messages into the widget. Tk thread only."""
+        if self.widget is None:
+            return
+        with self._lock:
+            if not self._pending and not self._dropped:
+                return
+            entries = list(self._pending)
+            self._pending.clear()
+            dropped, self._dropped = self._dropped, 0
+
+        args = []
+        if dropped:
+            args += [f"[... {dropped} log message(s) dropped ...]\n", ("warning",)]
+        for parts in entries:
+            for text, tags in parts:
+                args += [text, tags or ()]
+
+        widget = self.widget
+        state = widget.cget("state")
+        widget.config(state="normal")
+        widget.insert("end", *args)
+        lines = int(widget.index("end-1c").split(".")[0])
+        if self.max_lines and lines > self.max_lines:
+            widget.delete("1.0", f"{lines - self.max_lines + 1}.0")
+        widget.config(state=state)
+        widget.see("end")
+
+
+def sink_for(widget):
+    """The LogSink attached to `widget`, or None."""
+    if widget is None:
+        return None
+    return _SINKS.get(str(widget))
+
+
+def write_log(widget, text, tags=None):
+    """
+    Append `text` to a log Text widget: through its LogSink when it has one (safe
+    from any thread), otherwise directly (Tk thread only).
+    """
+    sink = sink_for(widget)
+    if sink is not None:
+        sink.write(text, tags)
+        return
+    if widget:
+        try:
+            widget.insert("end", text, tags or ())
+            widget.see("end")
+        except Exception:
+            pass
@@ -1,9 +1,15 @@
 import os
 import re
+import copy
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime, timedelta
 import tkinter as tk
+from utils.log_sink import write_log
+from utils.event_log import EVENTS
 
 LOG_DIR = "logs"
 MASTER_LOG_FILE = os.path.join(LOG_DIR, "master_log.log")
@@ -16,6 +22,40 @@ os.makedirs(LOG_DIR, exist_ok=True)
 logger = logging.getLogger("tagforge")
 logger.setLevel(logging.DEBUG)
 
+
+class _InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler for a listener in the same process. The message is merged with its
+    args (and any traceback rendered) before queueing, so a caller that mutates its
+    args afterwards cannot change what gets logged; the level/time prefixes and
+    file writes still happen on the listener thread.
+    """
+
+    _exc_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+# File and console output run on this listener's thread; callers only enqueue
+_listener = None
+
+
+def stop_logging():
+    """Write out every queued record and stop the listener thread. Safe to call twice."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 # Prevent duplicate handlers if this module is reloaded
 if not logger.hasHandlers():
 
@@ -29,7 +69,6 @@ if not logger.hasHandlers():
         encoding='utf-8'
     )
     master_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-    logger.addHandler(master_log_handler)
 
     gui_log_handler = RotatingFileHandler(
         GUI_LOG_FILE,
@@ -39,12 +78,18 @@ if not logger.hasHandlers():
     )
     gui_log_handler.setLevel(logging.INFO)
     gui_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-    logger.addHandler(gui_log_handler)
 
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(_InProcessQueueHandler(log_queue))
+    _listener = QueueListener(
+        log_queue, master_log_handler, gui_log_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(stop_logging)
 
 
 def cleanup_old_logs():
@@ -61,6 +106,9 @@ def cleanup_old_logs():
             except Exception as e:
                 logger.error(f"Failed to remove log file {fpath}: {e}")
 
+    # Structured event files live in their own directory with their own retention
+    EVENTS.prune()
+
 
 def sanitize_message_for_console(msg):
     """
@@ -137,14 +185,10 @@ def log_message(log_widget, msg, *, level="info"):
     # Log to backend (without manual prefix in msg!)
     safe_log_to_backend(msg, level)
 
-    # Insert message with prefix to GUI log widget, if any
-    if log_widget:
-        try:
-            log_widget.insert("end", f"[{level.upper()}] {msg}\n")
-            log_widget.see("end")
-        except Exception:
-            pass
+    # Queue message with prefix for the GUI log widget, if any (batched by its LogSink)
+    write_log(log_widget, f"[{level.upper()}] {msg}\n")
 
 
-# Initialize cleanup on import
-cleanup_old_logs()
+def start_log_cleanup():
+    """Run cleanup_old_logs on a background thread (it lists and stats every log file)."""
+    threading.Thread(target=cleanup_old_logs, name="log-cleanup", daemon=True).start()
@@ -0,0 +1,115 @@
+# utils/match_automaton.py
+from collections import deque
+
+
+class MatchAutomaton:
+    """
+    Aho-Corasick automaton over a set of (casefolded) keys.
+
+    `find_keys(text)` returns every key that occurs as a substring of `text` in one
+    pass over the text, instead of testing each key with `key in text`. Built from
+    plain lists/dicts, so to_state() can be stored in the asset snapshot cache.
+    """
+
+    def __init__(self, keys):
+        self.keys = tuple(dict.fromkeys(k for k in keys if k))
+        self.key_index = {k: i for i, k in enumerate(self.keys)}
+
+        goto = [{}]   # state -> {char: next state}
+        out = [-1]    # state -> index of the key ending here, or -1
+        for idx, key in enumerate(self.keys):
+            state = 0
+            for ch in key:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto.append({})
+                    out.append(-1)
+                    goto[state][ch] = nxt
+                state = nxt
+            out[state] = idx
+
+        fail = [0] * len(goto)
+        # Nearest state along the fail chain that ends a key (-1 if none)
+        out_link = [-1] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0) if state else 0
+                fail[nxt] = target if target != nxt else 0
+                out_link[nxt] = fail[nxt] if out[fail[nxt]] != -1 else out_link[fail[nxt]]
+                queue.append(nxt)
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        self._out_link = out_link
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.key_index
+
+    def find_keys(self, text):
+        """Return the set of keys occurring in `text` (which should already be casefolded)."""
+        goto, fail, out, out_link = self._goto, self._fail, self._out, self._out_link
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            hit = state if out[state] != -1 else out_link[state]
+            while hit > 0:
+                found.add(self.keys[out[hit]])
+                hit = out_link[hit]
+        return found
+
+    def to_state(self):
+        """Plain tuples/dicts describing the automaton, for the asset snapshot."""
+        return {
+            "keys": self.keys,
+            "goto": tuple(self._goto),
+            "fail": tuple(self._fail),
+            "out": tuple(self._out),
+            "out_link": tuple(self._out_link),
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """Rebuild an automaton from to_state() output. Raises ValueError if it is malformed."""
+        try:
+            keys = tuple(state["keys"])
+            goto, fail, out, out_link = (list(state[k]) for k in ("goto", "fail", "out", "out_link"))
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid automaton state: {e}") from None
+        n = len(goto)
+        if not n or not (len(fail) == len(out) == len(out_link) == n):
+            raise ValueError("Invalid automaton state: table sizes differ")
+        if not all(isinstance(k, str) for k in keys):
+            raise ValueError("Invalid automaton state: keys must be strings")
+        for table in goto:
+            if not isinstance(table, dict) or not all(
+                isinstance(ch, str) and isinstance(t, int) and 0 <= t < n for ch, t in table.items()
+            ):
+                raise ValueError("Invalid automaton state: bad transition table")
+        if not all(isinstance(t, int) and 0 <= t < n for t in fail):
+            raise ValueError("Invalid automaton state: bad fail links")
+        if not all(isinstance(i, int) and -1 <= i < len(keys) for i in out):
+            raise ValueError("Invalid automaton state: bad outputs")
+        if not all(isinstance(t, int) and -1 <= t < n for t in out_link):
+            raise ValueError("Invalid automaton state: bad output links")
+
+        self = cls.__new__(cls)
+        self.keys = keys
+        self.key_index = {k: i for i, k in enumerate(keys)}
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        self._out_link = out_link
+        return self
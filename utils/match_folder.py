@@ -2,8 +2,9 @@ import re
 import logging
 from datetime import datetime
 from utils.constants import DEFAULTS
+from utils.alias_table import ALIASES
 
-logger = logging.getLogger(__name__)
+logger = logging.getLogger("tagforge.match_folder")
 
 # --- Constants ---
 
@@ -65,21 +66,51 @@ def capitalize_city_preserve_state(city):
     else:
         return capitalize_words_except_apostrophe(city)
 
+def folded_pairs(normalized_list):
+    """
+    Return (casefolded, original) pairs for a value list.
+    AssetSnapshot lists carry these prebuilt per version; plain lists are folded on the fly.
+    """
+    folded = getattr(normalized_list, "folded", None)
+    if folded is not None:
+        return folded
+    return [(val.casefold(), val) for val in normalized_list]
+
 def find_normalized_value_exact(value, normalized_list):
     if not value or not normalized_list:
         return None
-    val_lower = value.lower()
-    for norm_val in normalized_list:
-        if norm_val.lower() == val_lower:
-            logger.debug(f"Exact normalized match: {norm_val}")
+    casefold_map = getattr(normalized_list, "casefold_map", None)
+    if casefold_map is not None:
+        norm_val = casefold_map.get(value.casefold())
+        if norm_val:
+            logger.debug("Exact normalized match: %s", norm_val)
+        return norm_val
+    val_folded = value.casefold()
+    for folded, norm_val in folded_pairs(normalized_list):
+        if folded == val_folded:
+            logger.debug("Exact normalized match: %s", norm_val)
             return norm_val
     return None
 
 def find_best_match_in_name(name, normalized_list):
     if not name or not normalized_list:
         return None
-    name_lower = name.lower()
-    candidates = [val for val in normalized_list if val.lower() in name_lower]
+    name_folded = name.casefold()
+    automaton = getattr(normalized_list, "automaton", None)
+    if automaton is not None:
+        # One pass over the name instead of one substring test per list entry
+        casefold_map = normalized_list.casefold_map
+        positions = normalized_list.positions
+        keys = automaton.find_keys(name_folded)
+        keys.update(k for k in normalized_list.extra_keys if k in name_folded)
+        keys = [k for k in keys if k in casefold_map]
+        if not keys:
+            return None
+        # Longest match wins; ties go to the earliest (most recently used) entry,
+        # the same as max() over the list below
+        best = max(keys, key=lambda k: (len(casefold_map[k]), -positions[k]))
+        return casefold_map[best]
+    candidates = [val for folded, val in folded_pairs(normalized_list) if folded in name_folded]
     return max(candidates, key=len) if candidates else None
 
 def extract_id(text):
@@ -145,11 +176,11 @@ patterns = [
 
 # --- Main Parsing Function ---
 
-def match_folder(name, normalized_artists=None, normalized_venues=None, normalized_cities=None, log=None):
+def match_folder(name, normalized_artists=None, normalized_venues=None, normalized_cities=None, log=None, aliases=ALIASES):
     if log is None:
         def log(msg): pass
 
-    logger.debug(f"Parsing folder name: {name}")
+    logger.debug("Parsing folder name: %s", name)
     name = re.sub(r",(\S)", r", \1", name)
 
     info = dict.fromkeys(
@@ -160,44 +191,44 @@ def match_folder(name, normalized_artists=None, normalized_venues=None, normaliz
         m = rx.match(name)
         if m:
             matched = True
-            logger.debug(f"Regex matched pattern: {rx.pattern}")
+            logger.debug("Regex matched pattern: %s", rx.pattern)
             for g in groups:
                 val = (m.group(g) or "").strip()
                 info[g] = val
-                logger.debug(f"  Extracted {g}: {val}")
+                logger.debug("  Extracted %s: %s", g, val)
             break
 
     if not matched:
         logger.debug("No regex pattern matched.")
 
     info["date"] = info["date"] or extract_date(name)
-    logger.debug(f"  Extracted date (fallback): {info['date']}")
+    logger.debug("  Extracted date (fallback): %s", info['date'])
 
     if normalized_artists:
         artist_match = find_best_match_in_name(name, normalized_artists)
         if artist_match:
             info["artist"] = artist_match
-            logger.debug(f"  Matched artist from list: {artist_match}")
+            logger.debug("  Matched artist from list: %s", artist_match)
 
     if normalized_cities:
         city_match = find_best_match_in_name(name, normalized_cities)
         if city_match:
             info["city"] = city_match
-            logger.debug(f"  Matched city from list: {city_match}")
+            logger.debug("  Matched city from list: %s", city_match)
 
     name_wo_city = name
     if info["city"]:
         name_wo_city = re.sub(re.escape(info["city"]), '', name_wo_city, flags=re.IGNORECASE).strip()
-        logger.debug(f"  Folder name without city: {name_wo_city}")
+        logger.debug("  Folder name without city: %s", name_wo_city)
 
     if normalized_venues:
         venue_match = find_best_match_in_name(name_wo_city, normalized_venues)
         if venue_match:
             info["venue"] = venue_match
-            logger.debug(f"  Matched venue from list: {venue_match}")
+            logger.debug("  Matched venue from list: %s", venue_match)
 
     bracket_tokens = re.findall(r"\[([^\]]+)\]", name)
-    logger.debug(f"  Found bracket tokens: {bracket_tokens}")
+    logger.debug("  Found bracket tokens: %s", bracket_tokens)
 
     # --- Special format mapping: exact bracket token matches only ---
     SPECIAL_FORMAT_MAP = {
@@ -208,7 +239,7 @@ def match_folder(name, normalized_artists=None, normalized_venues=None, normaliz
     for special_token, mapped_format in SPECIAL_FORMAT_MAP.items():
         if any(t.upper() == special_token for t in bracket_tokens):
             info["format"] = mapped_format
-            logger.debug(f"  Found special format token '{special_token}', setting format to '{mapped_format}'")
+            logger.debug("  Found special format token '%s', setting format to '%s'", special_token, mapped_format)
             break
 
     # --- Fallback format detection if still empty ---
@@ -219,7 +250,7 @@ def match_folder(name, normalized_artists=None, normalized_venues=None, normaliz
         for fmt in sorted_formats:
             if any(token.startswith(fmt.upper()) for token in tokens):
                 info["format"] = fmt
-                logger.debug(f"  Found format in name (fallback): {fmt}")
+                logger.debug("  Found format in name (fallback): %s", fmt)
                 break
 
     # Default format if none found
@@ -232,7 +263,7 @@ def match_folder(name, normalized_artists=None, normalized_venues=None, normaliz
         for src in KNOWN_SOURCES:
             if any(t.upper() == src.upper() for t in bracket_tokens):
                 info["source"] = src
-                logger.debug(f"  Found source token: {src}")
+                logger.debug("  Found source token: %s", src)
                 break
 
     # Default source if none found
@@ -245,7 +276,7 @@ def match_folder(name, normalized_artists=None, normalized_venues=None, normaliz
     for add in KNOWN_ADDITIONAL:
         if any(t.upper() == add.upper() for t in bracket_tokens):
             additional_token = add
-            logger.debug(f"  Found additional token: {additional_token}")
+            logger.debug("  Found additional token: %s", additional_token)
             break
 
     info["id"] = info["id"] or extract_id(name)
@@ -267,7 +298,15 @@ def match_folder(name, normalized_artists=None, normalized_venues=None, normaliz
         remaining_tokens.insert(0, additional_token)
     
     info["additional"] = info["add"] = " ".join(remaining_tokens).strip()
-    logger.debug(f"  Final additional: {info['additional']}")
+    logger.debug("  Final additional: %s", info['additional'])
+
+    # Map aliases ("GD", "The Grateful Dead") to their canonical spelling
+    if aliases is not None:
+        for field in ("artist", "venue", "city"):
+            canonical = aliases.canonical(field, info[field])
+            if canonical != info[field]:
+                logger.debug("  Canonicalized %s: %s -> %s", field, info[field], canonical)
+                info[field] = canonical
 
-    logger.debug(f"Finished parsing folder name with info: {info}")
+    logger.debug("Finished parsing folder name with info: %s", info)
     return info
@@ -1,11 +1,15 @@
 import os
 import re
+import logging
 from datetime import datetime
 import mutagen
 from utils.constants import DEFAULTS
 from utils.match_folder import match_folder
 from utils.txt_parser import TxtMetadataParser
 
+# Per-folder debug dumps below; level set from config.ini (see utils.log_config)
+logger = logging.getLogger("tagforge.metadata_parser")
+
 
 def try_parse_date(text):
     if not text:
@@ -135,16 +139,13 @@ def merge_metadata(folder_name, folder_path, artists_list, venues_list, cities_l
     Parse and merge metadata from file tags, folder name, and TXT metadata files.
     Returns a dict with keys: artist, venue, city, date, source, format, genre, add, additional.
     """
-
     # Parse tags from files
     file_tags = parse_tags_from_folder(folder_path)
-    if log_func:
-        log_func(f"[DEBUG] Parsed file tags from folder: {file_tags}", level="debug")
+    logger.debug("Parsed file tags from folder: %s", file_tags)
 
     album_val = file_tags.get("album", "").strip()
     album_parsed = parse_album_flexible(album_val, venues_list, cities_list)
-    if log_func:
-        log_func(f"[DEBUG] Parsed album flexibly: {album_parsed}", level="debug")
+    logger.debug("Parsed album flexibly: %s", album_parsed)
 
     md = {
         "artist": file_tags.get("artist") or file_tags.get("albumartist") or "",
@@ -165,8 +166,7 @@ def merge_metadata(folder_name, folder_path, artists_list, venues_list, cities_l
         normalized_cities=cities_list,
         log=log_func
     )
-    if log_func:
-        log_func(f"[DEBUG] Folder name parsed metadata: {folder_md}", level="debug")
+    logger.debug("Folder name parsed metadata: %s", folder_md)
 
     for key in ['artist', 'venue', 'city', 'date', 'source', 'format', 'genre', 'add', 'additional']:
         if key in ("source", "format"):
@@ -184,8 +184,7 @@ def merge_metadata(folder_name, folder_path, artists_list, venues_list, cities_l
         cities_list=cities_list
     )
     txt_md = parser.parse(folder_path, log_func=log_func)
-    if log_func:
-        log_func(f"[DEBUG] TXT metadata parsed: {txt_md}", level="debug")
+    logger.debug("TXT metadata parsed: %s", txt_md)
 
     for key in ('artist', 'venue', 'city', 'date', 'source', 'format'):
         if key in ("source", "format"):
@@ -228,7 +227,6 @@ def merge_metadata(folder_name, folder_path, artists_list, venues_list, cities_l
             candidate = match.group(1).upper()
             if candidate in DEFAULTS["source"]:
                 md["source"] = candidate
-                if log_func:
-                    log_func(f"[DEBUG] Set source from folder name token: {md['source']}", level="debug")
+                logger.debug("Set source from folder name token: %s", md["source"])
 
     return md
@@ -1,7 +1,15 @@
 import os
+import time
+import logging
 from utils.logger import log_message
 from utils.scheme_evaluator import load_schemes_from_ini, evaluate_schemes
 from utils.cache_manager import update_used_cache, save_used_cache
+from utils.io_scheduler import IOScheduler
+from utils.event_log import EVENTS, new_batch_id
+from utils.alias_table import ALIASES
+
+# Per-batch and per-folder debug output; level set from config.ini (see utils.log_config)
+logger = logging.getLogger("tagforge.process_thread")
 
 def remove_empty_parents(path, stop_at, log_func=None):
     path = os.path.abspath(path)
@@ -29,7 +37,7 @@ def remove_empty_parents(path, stop_at, log_func=None):
         path = os.path.dirname(path)
 
 def process_thread(gui_instance):
-    log_message(gui_instance.log, "Starting process_thread", level="debug")
+    logger.debug("Starting process_thread")
 
     # Initialize processor if not present
     if not hasattr(gui_instance, "processor"):
@@ -37,12 +45,12 @@ def process_thread(gui_instance):
         gui_instance.processor = Processor()
 
     def evaluate_all_schemes(md):
-        log_message(gui_instance.log, "Loading fresh schemes in evaluate_all_schemes", level="debug")
+        logger.debug("Loading fresh schemes in evaluate_all_schemes")
         current_folder_scheme, current_saving_scheme = load_schemes_from_ini(
             log=lambda m, level="info": log_message(gui_instance.log, m, level=level)
         )
-        log_message(gui_instance.log, f"Fresh schemes loaded - Folder: {current_folder_scheme}", level="debug")
-        log_message(gui_instance.log, f"Fresh schemes loaded - Saving: {current_saving_scheme}", level="debug")
+        logger.debug("Fresh schemes loaded - Folder: %s", current_folder_scheme)
+        logger.debug("Fresh schemes loaded - Saving: %s", current_saving_scheme)
 
         folder_name = evaluate_schemes(
             md, current_folder_scheme, current_saving_scheme,
@@ -66,10 +74,14 @@ def process_thread(gui_instance):
         log_message(gui_instance.log, "No folders queued for processing.", level="warn")
         return
 
-    processed_folders = []
-
     base_input_folder = gui_instance.root_var.get() or "M:/Test-Folder"
 
+    # Same alias table as Processor, so histories and usage stats see canonical names
+    aliases = getattr(gui_instance.processor, "aliases", ALIASES)
+
+    def canonical(key, value):
+        return aliases.canonical(key, value) if aliases is not None else value
+
     # Capture current form values into histories BEFORE processing
     for key, var_name in [
         ("artist", "artist"),
@@ -82,81 +94,160 @@ def process_thread(gui_instance):
     ]:
         var = getattr(gui_instance, var_name, None)
         if var:
-            val = var.get().strip()
+            val = canonical(key, var.get().strip())
             if val:
                 gui_instance.histories[key].add(val)
 
-    for folder in saved[:]:
+    # Read the form once; folders are processed on worker threads
+    gui_values = {
+        "artist": gui_instance.artist.get(),
+        "venue": gui_instance.venue.get(),
+        "city": gui_instance.city.get(),
+        "source": gui_instance.source.get(),
+        "format": gui_instance.fmt.get(),
+        "add": gui_instance.add.get(),
+        "genre": gui_instance.genre.get(),
+        "year": gui_instance.year.get(),
+        "mo": gui_instance.mo.get(),
+        "da": gui_instance.da.get(),
+    }
+
+    def get_fallback_value(meta_val, gui_val, last_used_val=""):
+        if meta_val and meta_val.strip():
+            return meta_val.strip()
+        if gui_val and gui_val.strip():
+            return gui_val.strip()
+        if last_used_val and last_used_val.strip():
+            return last_used_val.strip()
+        return ""
+
+    usage_stats = getattr(gui_instance, "usage_stats", None)
+
+    events = getattr(gui_instance.processor, "events", EVENTS)
+    batch_id = new_batch_id()
+    batch_start = time.perf_counter()
+    if events is not None:
+        events.emit("batch_start", batch=batch_id, folders=len(saved), root=base_input_folder)
+
+    def process_one(folder):
+        """
+        Process one queued folder on a scheduler lane. Touches no shared state of its
+        own: everything the batch needs afterwards is returned and merged in queue
+        order once all lanes are done.
+        """
         meta = saved_meta.get(folder, {})
+        job = {"fallback": None, "processed": [], "moves": [], "last_used": {}, "failed": False}
 
         fallback_date = meta.get("date")
         if not fallback_date or not fallback_date.strip():
-            y = gui_instance.year.get()
-            mo = gui_instance.mo.get().zfill(2) if gui_instance.mo.get() else "01"
-            da = gui_instance.da.get().zfill(2) if gui_instance.da.get() else "01"
+            y = gui_values["year"]
+            mo = gui_values["mo"].zfill(2) if gui_values["mo"] else "01"
+            da = gui_values["da"].zfill(2) if gui_values["da"] else "01"
             if y and y.isdigit():
                 fallback_date = f"{y}-{mo}-{da}"
             else:
                 fallback_date = ""
 
-        def get_fallback_value(meta_val, gui_val, last_used_val=""):
-            if meta_val and meta_val.strip():
-                return meta_val.strip()
-            if gui_val and gui_val.strip():
-                return gui_val.strip()
-            if last_used_val and last_used_val.strip():
-                return last_used_val.strip()
-            return ""
-
         fallback = {
-            "artist": get_fallback_value(meta.get("artist"), gui_instance.artist.get(), getattr(gui_instance, "last_artist", "")),
-            "venue": get_fallback_value(meta.get("venue"), gui_instance.venue.get()),
-            "city": get_fallback_value(meta.get("city"), gui_instance.city.get()),
-            "source": get_fallback_value(meta.get("source"), gui_instance.source.get(), getattr(gui_instance, "last_source", "")),
-            "format": get_fallback_value(meta.get("format"), gui_instance.fmt.get(), getattr(gui_instance, "last_format", "")),
-            "add": get_fallback_value(meta.get("additional") or meta.get("add"), gui_instance.add.get(), getattr(gui_instance, "last_add", "")),
-            "genre": get_fallback_value(meta.get("genre"), gui_instance.genre.get(), getattr(gui_instance, "last_genre", "")),
+            "artist": get_fallback_value(meta.get("artist"), gui_values["artist"], getattr(gui_instance, "last_artist", "")),
+            "venue": get_fallback_value(meta.get("venue"), gui_values["venue"]),
+            "city": get_fallback_value(meta.get("city"), gui_values["city"]),
+            "source": get_fallback_value(meta.get("source"), gui_values["source"], getattr(gui_instance, "last_source", "")),
+            "format": get_fallback_value(meta.get("format"), gui_values["format"], getattr(gui_instance, "last_format", "")),
+            "add": get_fallback_value(meta.get("additional") or meta.get("add"), gui_values["add"], getattr(gui_instance, "last_add", "")),
+            "genre": get_fallback_value(meta.get("genre"), gui_values["genre"], getattr(gui_instance, "last_genre", "")),
             "date": fallback_date,
             "currentfoldername": os.path.basename(os.path.normpath(folder)),
             "filename": os.path.basename(os.path.normpath(folder)),
         }
+        for key in ("artist", "venue", "city"):
+            fallback[key] = canonical(key, fallback[key])
+
+        logger.debug("Metadata with currentfoldername for processing: %s", fallback)
+
+        job["fallback"] = fallback
+        try:
+            job["processed"] = gui_instance.processor.process_folders(
+                [folder], fallback, moves=job["moves"], batch_id=batch_id, last_used=job["last_used"],
+            )
+
+            remove_empty_parents(folder, base_input_folder, log_func=lambda m, level="info": log_message(gui_instance.log, m, level=level))
+        except Exception as e:
+            log_message(gui_instance.log, f"Error processing folder '{folder}': {e}", level="error")
+            job["failed"] = True
+            if events is not None:
+                events.emit(
+                    "error", batch=batch_id, folder=folder, artist=fallback.get("artist", ""), stage="process",
+                    error_type=type(e).__name__, message=str(e),
+                )
+        return job
 
-        log_message(gui_instance.log, f"Metadata with currentfoldername for processing: {fallback}", level="debug")
+    # Work is grouped by source/destination device: one sequential lane per spinning
+    # disk, parallel lanes for SSDs and network shares. Output folders are created
+    # next to the source folder, so the destination device is that of its parent.
+    folders = list(saved)
+    scheduler = IOScheduler(log_func=lambda m, level="info": log_message(gui_instance.log, m, level=level))
+    try:
+        jobs = scheduler.run(folders, process_one, src_func=lambda f: f, dst_func=os.path.dirname)
+    except Exception as e:
+        log_message(gui_instance.log, f"Processing batch failed: {e}", level="error")
+        jobs = []
 
-        # Add processed values to histories
+    # Merge the per-folder results on this thread, in queue order, so "last used"
+    # means the last queued folder rather than whichever lane finished last
+    processed_folders = []
+    moves = []  # (source folder, output folder) per processed folder, for the tree update
+    failed = []
+    fallback = {}
+    last_used = {}
+    for folder, job in zip(folders, jobs):
+        if job is None or job["fallback"] is None:
+            failed.append(folder)
+            continue
+        fallback = job["fallback"]
+        processed_folders.extend(job["processed"])
+        moves.extend(job["moves"])
+        last_used.update(job["last_used"])
+        if job["failed"]:
+            failed.append(folder)
+
+        # Add processed values to histories and record them for suggestion ranking
         for key in ["artist", "venue", "city", "source", "format", "add", "genre"]:
             value = fallback.get(key)
             if value and value.strip():
                 gui_instance.histories[key].add(value.strip())
+                if usage_stats is not None:
+                    usage_stats.record(key, value)
 
-        try:
-            result = gui_instance.processor.process_folders([folder], fallback)
-            processed_folders.extend(result)
-
-            remove_empty_parents(folder, base_input_folder, log_func=lambda m, level="info": log_message(gui_instance.log, m, level=level))
+        if not job["failed"] and fallback.get("artist") and fallback.get("genre"):
+            update_used_cache(
+                gui_instance.used_cache,
+                fallback["artist"],
+                fallback["genre"],
+                log_func=lambda m, level="debug": log_message(gui_instance.log, m, level=level),
+            )
 
-            if fallback.get("artist") and fallback.get("genre"):
-                update_used_cache(
-                    gui_instance.used_cache,
-                    fallback["artist"],
-                    fallback["genre"],
-                    log_func=lambda m, level="debug": log_message(gui_instance.log, m, level=level),
-                )
-        except Exception as e:
-            log_message(gui_instance.log, f"Error processing folder '{folder}': {e}", level="error")
+    if events is not None:
+        events.emit(
+            "batch_end", batch=batch_id, folders=len(saved), processed=len(processed_folders), failed=len(failed),
+            ms=round((time.perf_counter() - batch_start) * 1000, 1),
+        )
 
-    for folder in processed_folders:
-        if folder in saved:
-            saved.remove(folder)
-        if folder in saved_meta:
-            del saved_meta[folder]
+    # Drop finished folders in one O(n) pass; the queue view is rebuilt in gui_updates
+    queue.remove_many(processed_folders, update_ui=False)
 
     # Update last_* attributes for fallback use in UI
+    processor = gui_instance.processor
+    if last_used:
+        processor.last_source = last_used.get("source", "")
+        processor.last_format = last_used.get("format", "")
+        processor.last_genre = last_used.get("genre", "")
+        processor.last_add = last_used.get("add", "")
     gui_instance.last_artist = fallback.get("artist", "")  # <-- added to keep last_artist updated
-    gui_instance.last_source = gui_instance.processor.last_source
-    gui_instance.last_format = gui_instance.processor.last_format
-    gui_instance.last_genre = gui_instance.processor.last_genre
-    gui_instance.last_add = gui_instance.processor.last_add
+    gui_instance.last_source = processor.last_source
+    gui_instance.last_format = processor.last_format
+    gui_instance.last_genre = processor.last_genre
+    gui_instance.last_add = processor.last_add
 
     gui_instance._save_history()
 
@@ -164,11 +255,19 @@ def process_thread(gui_instance):
         # Assuming these methods exist, else replace or remove:
         if hasattr(gui_instance, "refresh_queue_ui"):
             gui_instance.refresh_queue_ui()
-        # Remove _refresh() if not defined
-        if hasattr(gui_instance, "_refresh"):
+        queue.compact_journal()
+        # Update only the tree nodes this batch touched
+        if hasattr(gui_instance, "_refresh_after_batch"):
+            gui_instance._refresh_after_batch(moves)
+        elif hasattr(gui_instance, "_refresh"):
             gui_instance._refresh()
         gui_instance._update_combobox_values()
+        asset_store = getattr(gui_instance, "asset_store", None)
+        if asset_store is not None:
+            asset_store.schedule_compaction(gui_instance.root)
         gui_instance._update_used_cache()
+        if getattr(gui_instance, "usage_stats", None) is not None:
+            gui_instance.usage_stats.save()
         try:
             save_used_cache(
                 gui_instance.used_cache,
@@ -1,6 +1,9 @@
 import os
 import re
+import time
+import logging
 import shutil
+import threading
 from datetime import datetime
 from mutagen.flac import FLAC
 from mutagen.mp3 import MP3
@@ -8,6 +11,11 @@ from mutagen.easyid3 import EasyID3
 
 from utils.constants import ARTISTS_FILE, VENUES_FILE, CITIES_FILE
 from utils.scheme_evaluator import SchemeEvaluator
+from utils.alias_table import ALIASES
+from utils.event_log import EVENTS
+
+# Processor's debug output; level set from config.ini (see utils.log_config)
+logger = logging.getLogger("tagforge.processor")
 
 
 class Processor:
@@ -27,6 +35,9 @@ class Processor:
         last_format="",
         last_genre="",
         last_add="",  # Added this parameter
+        asset_store=None,
+        aliases=ALIASES,
+        events=EVENTS,
     ):
         self._evaluate_schemes = evaluate_schemes_func
         self._match_folder = match_folder_func
@@ -35,6 +46,13 @@ class Processor:
         self.artists_list = artists_list
         self.venues_list = venues_list
         self.cities_list = cities_list
+        # Optional AssetStore; when set, asset lists come from its snapshots and
+        # updates go to its journal instead of rewriting the .txt files
+        self.asset_store = asset_store
+        # AliasTable mapping alternate spellings to one canonical value per field
+        self.aliases = aliases
+        # EventLog receiving one structured event per operation (see utils.event_log)
+        self.events = events
 
         self.artist_cache = artist_cache
         self.genre_cache = genre_cache
@@ -51,11 +69,17 @@ class Processor:
         self.saving_scheme = None
         self.scheme_evaluator = None
 
+        # process_folders may run on several worker threads at once: _state_lock
+        # guards the shared caches, histories and asset lists, and jobs moving into
+        # the same output folder take turns on that folder's lock
+        self._state_lock = threading.Lock()
+        self._dest_locks = {}
+
     def update_schemes(self, folder_scheme, saving_scheme):
         """Update folder and saving schemes and recompile the evaluator."""
-        self.log("Updating schemes...", level="debug")
-        self.log(f"Old folder scheme: {self.folder_scheme}", level="debug")
-        self.log(f"Old saving scheme: {self.saving_scheme}", level="debug")
+        logger.debug("Updating schemes...")
+        logger.debug("Old folder scheme: %s", self.folder_scheme)
+        logger.debug("Old saving scheme: %s", self.saving_scheme)
         self.folder_scheme = folder_scheme
         self.saving_scheme = saving_scheme
         self.scheme_evaluator = SchemeEvaluator(folder_scheme, saving_scheme, log_func=self.log)
@@ -105,19 +129,59 @@ class Processor:
             self.log(f"  Failed writing {file_path}: {e}")
 
 
-    def process_folders(self, folders, gui_fallbacks):
-        """Process a list of source folders, move & tag files accordingly."""
+    def _touch_asset(self, field, file_path, new_value):
+        """Promote `new_value` to the top of an asset list via the store, or the .txt file."""
+        if self.asset_store is None:
+            self._update_txt_file(file_path, new_value)
+            return
+        if self.asset_store.touch(field, new_value):
+            self.log(f"  Updated {os.path.basename(file_path)} with: {new_value.strip()}")
+
+    def _destination_lock(self, out_folder):
+        """
+        Lock serializing every job that moves files into `out_folder`, so the
+        collision check and the move cannot interleave with another job picking
+        the same free name (which would silently overwrite its file).
+        """
+        key = os.path.normcase(os.path.abspath(out_folder))
+        with self._state_lock:
+            lock = self._dest_locks.get(key)
+            if lock is None:
+                lock = self._dest_locks[key] = threading.Lock()
+            return lock
+
+    def _emit(self, event, **fields):
+        if self.events is not None:
+            self.events.emit(event, **fields)
+
+    def process_folders(self, folders, gui_fallbacks, moves=None, batch_id=None, last_used=None):
+        """
+        Process a list of source folders, move & tag files accordingly.
+        If `moves` is a list, (source folder, output folder) is appended to it for
+        every folder processed successfully. Every step is also recorded as a
+        structured event in self.events, tagged with `batch_id`.
+
+        The last used source/format/genre/add values go to self.last_*, or to the
+        `last_used` dict when given, so concurrent callers can keep them per job.
+        """
         processed = []
 
         for folder in folders:
             folder_name = os.path.basename(folder)
             self.log(f"\nProcessing folder: {folder}")
+            folder_start = time.perf_counter()
+            self._emit("folder_start", batch=batch_id, folder=folder)
+
+            with self._state_lock:
+                if self.asset_store is not None:
+                    self.artists_list, self.venues_list, self.cities_list = self.asset_store.lists()
+                artists, venues, cities = self.artists_list, self.venues_list, self.cities_list
 
             md = self._match_folder(
                 folder_name,
-                normalized_artists=self.artists_list,
-                normalized_venues=self.venues_list,
-                normalized_cities=self.cities_list,
+                normalized_artists=artists,
+                normalized_venues=venues,
+                normalized_cities=cities,
                 log=self.log,
             )
 
@@ -134,32 +198,42 @@ class Processor:
             genre = gui_fallbacks.get("genre") if "genre" in gui_fallbacks else md.get("genre", "")
             add = gui_fallbacks.get("add") if "add" in gui_fallbacks else (md.get("additional", "") or md.get("add", ""))
 
-            # Update dropdown histories
-            for key, val in [("source", source), ("format", fmt), ("genre", genre), ("add", add)]:
-                if val:
-                    self.histories.setdefault(key, set()).add(val)
+            # Canonicalize so aliases don't create separate history, cache and folder entries
+            if self.aliases is not None:
+                artist = self.aliases.canonical("artist", artist)
+                venue = self.aliases.canonical("venue", venue)
+                city = self.aliases.canonical("city", city)
 
-            # Update artist and genre caches
-            if artist:
-                self.artist_cache.add(artist)
-            if genre:
-                for g in self._split_genres(genre):
-                    self.genre_cache.add(g)
+            with self._state_lock:
+                # Update dropdown histories
+                for key, val in [("source", source), ("format", fmt), ("genre", genre), ("add", add)]:
+                    if val:
+                        self.histories.setdefault(key, set()).add(val)
 
-            # Update used cache linking artist to genre
-            if artist and genre:
-                self.used_cache.setdefault("artists", {})[artist] = genre
+                # Update artist and genre caches
+                if artist:
+                    self.artist_cache.add(artist)
+                if genre:
+                    for g in self._split_genres(genre):
+                        self.genre_cache.add(g)
 
-            # Update last used fields
-            self.last_source = source
-            self.last_format = fmt
-            self.last_genre = genre
-            self.last_add = add  # Added this line
+                # Update used cache linking artist to genre
+                if artist and genre:
+                    self.used_cache.setdefault("artists", {})[artist] = genre
+
+                # Update .txt asset lists
+                self._touch_asset("artists", ARTISTS_FILE, artist)
+                self._touch_asset("venues", VENUES_FILE, venue)
+                self._touch_asset("cities", CITIES_FILE, city)
 
-            # Update .txt asset lists
-            self._update_txt_file(ARTISTS_FILE, artist)
-            self._update_txt_file(VENUES_FILE, venue)
-            self._update_txt_file(CITIES_FILE, city)
+            # Update last used fields
+            if last_used is not None:
+                last_used.update(source=source, format=fmt, genre=genre, add=add)
+            else:
+                self.last_source = source
+                self.last_format = fmt
+                self.last_genre = genre
+                self.last_add = add  # Added this line
 
             # Compose metadata dict for scheme evaluation
             meta = {
@@ -177,7 +251,7 @@ class Processor:
                 "currentfoldername": gui_fallbacks.get("currentfoldername", ""),
             }
 
-            self.log(f"Metadata for scheme evaluation: {meta}")
+            logger.debug("Metadata for scheme evaluation: %s", meta)
 
             self.log("Evaluating output folder path with current schemes.")
 
@@ -200,50 +274,85 @@ class Processor:
                 os.makedirs(out_folder, exist_ok=True)
             except Exception as e:
                 self.log(f"Failed evaluating output folder path: {e}")
+                self._emit(
+                    "error", batch=batch_id, folder=folder, artist=artist, stage="evaluate",
+                    error_type=type(e).__name__, message=str(e),
+                )
+                self._emit(
+                    "folder_end", batch=batch_id, folder=folder, artist=artist, ok=False,
+                    files=0, bytes=0, ms=round((time.perf_counter() - folder_start) * 1000, 1),
+                )
                 continue
 
             success = True
-            for root_dir, _, files in os.walk(folder):
-                for file in files:
-                    src_fp = os.path.join(root_dir, file)
-                    dest_fp = os.path.join(out_folder, file)
-
-                    # Handle filename collisions
-                    if os.path.exists(dest_fp):
-                        base, ext = os.path.splitext(file)
-                        counter = 1
-                        while True:
-                            new_name = f"{base}({counter}){ext}"
-                            dest_fp = os.path.join(out_folder, new_name)
-                            if not os.path.exists(dest_fp):
-                                break
-                            counter += 1
-                        self.log(f"  Renaming due to collision: {file} → {os.path.basename(dest_fp)}")
-
-                    try:
-                        shutil.move(src_fp, dest_fp)
-                        ext = os.path.splitext(file)[1].lower()
-                        if ext in (".flac", ".mp3"):
-                            genres_list = self._split_genres(genre)
-                            self.retag_file(dest_fp, artist, meta["album"], date, venue, city, genres_list, source, fmt)
-                    except Exception as e:
-                        self.log(f"  Failed moving/tagging {file}: {e}")
-                        success = False
-
-            root_source_folder = "M:/Test-Folder"  # or get this from config/parameter
-            self._cleanup_folder(folder, "Removed empty source folder", stop_at=root_source_folder)
-            self._cleanup_folder(out_folder, "Removed empty output folder")  # usually you may want to clean output too if empty
-
+            moved_files = moved_bytes = 0
+            with self._destination_lock(out_folder):
+                # Another job's cleanup may have removed the folder while it was empty
+                os.makedirs(out_folder, exist_ok=True)
+                for root_dir, _, files in os.walk(folder):
+                    for file in files:
+                        src_fp = os.path.join(root_dir, file)
+                        dest_fp = os.path.join(out_folder, file)
+
+                        # Handle filename collisions
+                        if os.path.exists(dest_fp):
+                            base, ext = os.path.splitext(file)
+                            counter = 1
+                            while True:
+                                new_name = f"{base}({counter}){ext}"
+                                dest_fp = os.path.join(out_folder, new_name)
+                                if not os.path.exists(dest_fp):
+                                    break
+                                counter += 1
+                            self.log(f"  Renaming due to collision: {file} → {os.path.basename(dest_fp)}")
+                            self._emit("collision", batch=batch_id, folder=folder, artist=artist, file=file, dest=dest_fp)
+
+                        try:
+                            size = os.path.getsize(src_fp)
+                            move_start = time.perf_counter()
+                            shutil.move(src_fp, dest_fp)
+                            moved_files += 1
+                            moved_bytes += size
+                            self._emit(
+                                "move", batch=batch_id, folder=folder, artist=artist, file=file, dest=dest_fp,
+                                bytes=size, ms=round((time.perf_counter() - move_start) * 1000, 1),
+                            )
+                            ext = os.path.splitext(file)[1].lower()
+                            if ext in (".flac", ".mp3"):
+                                genres_list = self._split_genres(genre)
+                                self.retag_file(
+                                    dest_fp, artist, meta["album"], date, venue, city, genres_list, source, fmt,
+                                    folder=folder, batch_id=batch_id,
+                                )
+                        except Exception as e:
+                            self.log(f"  Failed moving/tagging {file}: {e}")
+                            self._emit(
+                                "error", batch=batch_id, folder=folder, artist=artist, file=file, stage="move",
+                                error_type=type(e).__name__, message=str(e),
+                            )
+                            success = False
+
+                root_source_folder = "M:/Test-Folder"  # or get this from config/parameter
+                self._cleanup_folder(folder, "Removed empty source folder", stop_at=root_source_folder)
+                self._cleanup_folder(out_folder, "Removed empty output folder")  # usually you may want to clean output too if empty
+
+            self._emit(
+                "folder_end", batch=batch_id, folder=folder, artist=artist, out_folder=out_folder, ok=success,
+                files=moved_files, bytes=moved_bytes, ms=round((time.perf_counter() - folder_start) * 1000, 1),
+            )
             if success:
                 self.log(f"Finished processing folder: {out_folder}")
                 processed.append(folder)
+                if moves is not None:
+                    moves.append((folder, out_folder))
             else:
                 self.log(f"Finished processing with errors: {folder}")
 
         return processed
 
-    def retag_file(self, fp, artist, album, date, venue, city, genres, src, fmt):
+    def retag_file(self, fp, artist, album, date, venue, city, genres, src, fmt, folder=None, batch_id=None):
         """Tags an audio file (FLAC or MP3) with provided metadata."""
+        tag_start = time.perf_counter()
         try:
             ext = os.path.splitext(fp)[1].lower()
             if ext == ".flac":
@@ -291,8 +400,16 @@ class Processor:
 
             audio.save()
             self.log(f"  Tagged: {os.path.basename(fp)}")
+            self._emit(
+                "tag", batch=batch_id, folder=folder, artist=artist, file=os.path.basename(fp),
+                ms=round((time.perf_counter() - tag_start) * 1000, 1),
+            )
         except Exception as e:
             self.log(f"  Tagging failed for {os.path.basename(fp)}: {e}")
+            self._emit(
+                "error", batch=batch_id, folder=folder, artist=artist, file=os.path.basename(fp), stage="tag",
+                error_type=type(e).__name__, message=str(e),
+            )
             
     def _cleanup_folder(self, folder, msg, stop_at=None):
         """
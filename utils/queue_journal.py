@@ -0,0 +1,112 @@
+# utils/queue_journal.py
+import os
+import json
+import threading
+
+from utils.constants import QUEUE_JOURNAL_FILE
+
+
+class QueueJournal:
+    """
+    Append-only JSON-lines journal of the processing queue, so it survives restarts.
+
+    Each queue change is one line:
+        {"op": "add", "path": ..., "proposed": ..., "meta": {...}}
+        {"op": "remove", "paths": [...]}
+    `load()` replays the lines into the live queue (metadata and proposed names are
+    stored, so nothing is re-inferred); `compact()` rewrites the file with only the
+    live entries once removed ones make up most of it.
+    """
+
+    # Compact when the journal holds this many more records than live entries
+    COMPACT_SLACK = 200
+
+    def __init__(self, path=QUEUE_JOURNAL_FILE, log_func=None):
+        self.path = path
+        self.log = log_func or (lambda msg, level="info": None)
+        self._lock = threading.Lock()
+        self._records = 0   # lines currently in the file
+
+    def load(self):
+        """Replay the journal. Returns [(path, proposed_name, metadata), ...] in queue order."""
+        entries = {}
+        records = 0
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue  # torn write from a crash, skip it
+                    records += 1
+                    op = rec.get("op")
+                    if op == "add" and rec.get("path"):
+                        entries.setdefault(rec["path"], (rec.get("proposed", ""), rec.get("meta") or {}))
+                    elif op == "remove":
+                        for path in rec.get("paths", ()):
+                            entries.pop(path, None)
+        except Exception as e:
+            self.log(f"Failed reading queue journal {self.path}: {e}", level="error")
+        with self._lock:
+            self._records = records
+        return [(path, proposed, meta) for path, (proposed, meta) in entries.items()]
+
+    def _append(self, records):
+        if not records:
+            return
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("".join(json.dumps(rec, ensure_ascii=False, default=str) + "\n" for rec in records))
+                self._records += len(records)
+            except Exception as e:
+                self.log(f"Failed appending to queue journal: {e}", level="error")
+
+    def record_add(self, items):
+        """Journal newly queued (path, proposed_name, metadata) items."""
+        self._append([{"op": "add", "path": path, "proposed": proposed, "meta": meta} for path, proposed, meta in items])
+
+    def record_remove(self, paths):
+        paths = list(paths)
+        if paths:
+            self._append([{"op": "remove", "paths": paths}])
+
+    def record_clear(self):
+        """Forget the whole queue; the file is simply removed."""
+        with self._lock:
+            try:
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                self._records = 0
+            except Exception as e:
+                self.log(f"Failed clearing queue journal: {e}", level="error")
+
+    def needs_compaction(self, live_count):
+        return self._records > live_count + self.COMPACT_SLACK
+
+    def compact(self, items):
+        """Rewrite the journal with only the live (path, proposed_name, metadata) items."""
+        items = list(items)
+        with self._lock:
+            try:
+                if not items:
+                    if os.path.exists(self.path):
+                        os.remove(self.path)
+                    self._records = 0
+                    return True
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    for path, proposed, meta in items:
+                        rec = {"op": "add", "path": path, "proposed": proposed, "meta": meta}
+                        f.write(json.dumps(rec, ensure_ascii=False, default=str) + "\n")
+                os.replace(tmp_path, self.path)
+                self._records = len(items)
+            except Exception as e:
+                self.log(f"Failed compacting queue journal: {e}", level="error")
+                return False
+        self.log(f"Compacted queue journal to {len(items)} entries.", level="debug")
+        return True
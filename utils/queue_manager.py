@@ -1,8 +1,80 @@
 import tkinter as tk
 from tkinter import ttk
 
+from utils.log_sink import write_log
+
+_MISSING = object()
+
+
+class OrderedFolderQueue:
+    """
+    Insertion-ordered set of normalized folder paths.
+
+    Backed by a dict, so membership, append and removal are O(1) while iteration
+    keeps queue order. Supports the list operations callers used on the old list
+    (`in`, `len`, iteration, `append`, `remove`, `clear`).
+    """
+
+    def __init__(self, items=()):
+        self._items = dict.fromkeys(items)
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __bool__(self):
+        return bool(self._items)
+
+    def __repr__(self):
+        return f"OrderedFolderQueue({list(self._items)!r})"
+
+    def append(self, item):
+        """Add `item` at the end. Returns False if it was already queued."""
+        if item in self._items:
+            return False
+        self._items[item] = None
+        return True
+
+    def extend(self, items):
+        """Append each new item; returns the ones actually added, in order."""
+        return [item for item in items if self.append(item)]
+
+    def remove(self, item):
+        """Remove `item`; raises ValueError if absent, like list.remove."""
+        try:
+            del self._items[item]
+        except KeyError:
+            raise ValueError(f"{item!r} is not queued") from None
+
+    def discard(self, item):
+        """Remove `item` if present. Returns True if it was queued."""
+        return self._items.pop(item, _MISSING) is not _MISSING
+
+    def discard_many(self, items):
+        """Remove every queued item of `items`; returns the ones actually removed."""
+        return [item for item in items if self.discard(item)]
+
+    def clear(self):
+        self._items.clear()
+
+
 class QueueManager:
-    def __init__(self, treeview_widget: ttk.Treeview, log_widget: tk.Text | None = None):
+    # Batches larger than this are logged as one summary line instead of per folder
+    LOG_EACH_LIMIT = 20
+    # Rows reconciled per after() tick in refresh_ui
+    CHUNK_ROWS = 250
+    # Queues longer than this only materialize a window of rows, grown a page at a
+    # time as the view is scrolled to the bottom
+    VIRTUAL_THRESHOLD = 2000
+    VIRTUAL_PAGE = 500
+    MORE_IID = "__queue_more__"
+
+    def __init__(self, treeview_widget: ttk.Treeview, log_widget: tk.Text | None = None, journal=None):
         """
         Manage a folder queue with metadata, reflected in a ttk.Treeview with two columns.
 
@@ -11,12 +83,23 @@ class QueueManager:
                              - first column: folder path display name
                              - second column: proposed folder name
             log_widget: Optional Tkinter Text widget for logging messages.
+            journal: Optional QueueJournal; queue changes are appended to it and
+                     restore() reloads the queue from it.
         """
-        self.saved = []            # List of normalized folder paths in queue
+        self.saved = OrderedFolderQueue()  # Normalized folder paths in queue order
         self.saved_meta = {}       # Dict mapping folder path -> metadata dict
+        self.saved_proposed = {}   # Folder path -> latest proposed name, shown or not
         self.tree = treeview_widget
         self.log = log_widget
         self.evaluate_schemes_func = None  # Function to evaluate schemes
+        self.journal = journal
+
+        self._shown = {}           # Folder path -> proposed name currently shown in the Treeview
+        self._reconcile = None     # Generator of the refresh in progress
+        self._refresh_job = None   # after() id of its next chunk
+        self._window = self.VIRTUAL_PAGE  # Rows materialized in virtual-list mode
+        self._scroll_hooked = False
+        self._orig_yscroll = ()
 
     def set_scheme_evaluator(self, evaluate_func):
         """
@@ -36,17 +119,48 @@ class QueueManager:
             proposed_name: The proposed output folder name (string).
             metadata: Dictionary of metadata associated with the folder.
         """
-        norm_path = self._normalize_path(folder_path)
-        if not norm_path:
-            return
+        self.add_many([(folder_path, proposed_name, metadata)])
+
+    def add_many(self, items, persist: bool = True):
+        """
+        Add several folders at once. Each membership check is O(1), so queueing n
+        folders is O(n); large batches are logged as a single summary line.
+
+        Args:
+            items: Iterable of (folder_path, proposed_name, metadata) tuples.
+            persist: Journal the additions. False when replaying the journal itself
+                     (those additions are not logged either).
 
-        if norm_path not in self.saved:
-            self.saved.append(norm_path)
+        Returns:
+            List of normalized paths that were newly queued.
+        """
+        added = []
+        for folder_path, proposed_name, metadata in items:
+            norm_path = self._normalize_path(folder_path)
+            if not norm_path or not self.saved.append(norm_path):
+                continue
             # Store metadata without the proposed_name since it can change
             self.saved_meta[norm_path] = metadata
-            # Insert folder_path and proposed_name in correct order to match columns
-            self.tree.insert("", "end", iid=norm_path, values=(norm_path, proposed_name))
-            self._log(f"Queued folder: {norm_path} | Proposed Name: {proposed_name}")
+            self.saved_proposed[norm_path] = proposed_name
+            # In virtual mode rows past the materialized window are only counted
+            if not self._window_full():
+                # Insert folder_path and proposed_name in correct order to match columns
+                self.tree.insert("", "end", iid=norm_path, values=(norm_path, proposed_name))
+                self._shown[norm_path] = proposed_name
+            added.append((norm_path, proposed_name))
+
+        if added:
+            self._update_more_row()
+        if not persist:
+            return [norm_path for norm_path, _ in added]
+        if self.journal is not None and added:
+            self.journal.record_add((p, proposed, self.saved_meta[p]) for p, proposed in added)
+        if len(added) <= self.LOG_EACH_LIMIT:
+            for norm_path, proposed_name in added:
+                self._log(f"Queued folder: {norm_path} | Proposed Name: {proposed_name}")
+        else:
+            self._log(f"Queued {len(added)} folders.")
+        return [norm_path for norm_path, _ in added]
 
     def remove_selected(self):
         """
@@ -55,13 +169,7 @@ class QueueManager:
         selected_items = self.tree.selection()
         if not selected_items:
             return
-
-        for iid in selected_items:
-            self.tree.delete(iid)
-            if iid in self.saved:
-                self.saved.remove(iid)
-                self.saved_meta.pop(iid, None)
-            self._log(f"Removed from queue: {iid}")
+        self.remove_many(selected_items)
 
     def remove_folder(self, folder_path: str):
         """
@@ -70,23 +178,92 @@ class QueueManager:
         Args:
             folder_path: Folder path to remove.
         """
-        norm_path = self._normalize_path(folder_path)
-        if norm_path in self.saved:
-            self.saved.remove(norm_path)
+        self.remove_many([folder_path])
+
+    def remove_many(self, folder_paths, update_ui: bool = True):
+        """
+        Remove several folders at once in O(n).
+
+        Args:
+            folder_paths: Iterable of folder paths to remove.
+            update_ui: Also delete the rows from the Treeview. Pass False from worker
+                       threads and refresh the UI afterwards on the Tk thread.
+
+        Returns:
+            List of normalized paths that were removed.
+        """
+        removed = self.saved.discard_many(self._normalize_path(p) for p in folder_paths)
+        for norm_path in removed:
             self.saved_meta.pop(norm_path, None)
-            self.tree.delete(norm_path)
-            self._log(f"Removed from queue: {norm_path}")
+            self.saved_proposed.pop(norm_path, None)
+        if self.journal is not None and removed:
+            self.journal.record_remove(removed)
+
+        if update_ui and removed:
+            rows = [norm_path for norm_path in removed if self._shown.pop(norm_path, None) is not None]
+            if rows:
+                try:
+                    self.tree.delete(*rows)
+                except tk.TclError:
+                    for norm_path in rows:
+                        if self.tree.exists(norm_path):
+                            self.tree.delete(norm_path)
+            self._update_more_row()
+
+            if len(removed) <= self.LOG_EACH_LIMIT:
+                for norm_path in removed:
+                    self._log(f"Removed from queue: {norm_path}")
+            else:
+                self._log(f"Removed {len(removed)} folders from queue.")
+            self.compact_journal()
+        return removed
 
     def clear(self):
         """
         Clear entire queue and UI.
         """
+        self._cancel_refresh()
         self.saved.clear()
         self.saved_meta.clear()
-        for iid in self.tree.get_children():
-            self.tree.delete(iid)
+        self.saved_proposed.clear()
+        self._shown.clear()
+        self._window = self.VIRTUAL_PAGE
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        if self.journal is not None:
+            self.journal.record_clear()
         self._log("Queue cleared.")
 
+    def restore(self):
+        """
+        Reload the queue saved in the journal by a previous session, with its stored
+        metadata and proposed names (no folder is re-parsed).
+
+        Returns:
+            Number of folders restored.
+        """
+        if self.journal is None:
+            return 0
+        restored = self.add_many(self.journal.load(), persist=False)
+        if restored:
+            self._log(f"Restored {len(restored)} queued folder(s) from the last session.")
+        self.compact_journal()
+        return len(restored)
+
+    def compact_journal(self, force: bool = False):
+        """
+        Rewrite the journal with just the live queue once removed entries dominate it
+        (or always with force=True). Proposed names come from saved_proposed, not the
+        view, so rows not materialized in virtual mode keep theirs. Call from the Tk thread.
+        """
+        if self.journal is None:
+            return
+        if force or self.journal.needs_compaction(len(self.saved)):
+            self.journal.compact(
+                (path, self.saved_proposed.get(path, ""), self.saved_meta.get(path, {})) for path in self.saved
+            )
+
     def refresh_proposed_names(self):
         """
         Regenerate all proposed names using current schemes and update UI.
@@ -94,41 +271,147 @@ class QueueManager:
         """
         if not self.evaluate_schemes_func:
             return
-            
-        # Update each item in the queue
-        for folder_path in self.saved:
-            metadata = self.saved_meta.get(folder_path, {})
+        self.refresh_ui(announce=True)
+
+    def refresh_ui(self, announce: bool = False):
+        """
+        Reconcile the Treeview with the current queue state.
+
+        Rows for removed folders are deleted, new folders are inserted and only
+        proposed-name cells whose value changed are rewritten. The work runs in
+        chunks of CHUNK_ROWS rows scheduled with after(), so the UI stays
+        responsive; a new call supersedes a reconciliation still in progress.
+
+        Args:
+            announce: Log a summary of how many proposed names changed.
+        """
+        self._cancel_refresh()
+        self._reconcile = self._reconcile_steps(announce)
+        self._run_refresh_chunk()
+
+    def _cancel_refresh(self):
+        if self._refresh_job is not None:
             try:
-                # Generate new proposed name using current schemes
-                new_proposed = self.evaluate_schemes_func(metadata)
-                
-                # Update the treeview item
-                self.tree.item(folder_path, values=(folder_path, new_proposed))
-                
-                self._log(f"Updated queue item: {folder_path} | New Proposed Name: {new_proposed}")
-                
-            except Exception as e:
-                self._log(f"Error updating proposed name for {folder_path}: {e}")
-
-    def refresh_ui(self):
-        """
-        Refresh the Treeview UI to reflect current queue state.
-        """
-        for iid in self.tree.get_children():
-            self.tree.delete(iid)
-        for folder in self.saved:
-            metadata = self.saved_meta.get(folder, {})
-            proposed = ""
-            
-            # Try to generate current proposed name if evaluator is available
-            if self.evaluate_schemes_func:
-                try:
-                    proposed = self.evaluate_schemes_func(metadata)
-                except Exception as e:
-                    self._log(f"Error generating proposed name for {folder}: {e}")
-                    proposed = "Error generating name"
-            
-            self.tree.insert("", "end", iid=folder, values=(folder, proposed))
+                self.tree.after_cancel(self._refresh_job)
+            except Exception:
+                pass
+            self._refresh_job = None
+        self._reconcile = None
+
+    def _run_refresh_chunk(self):
+        self._refresh_job = None
+        steps = self._reconcile
+        if steps is None:
+            return
+        try:
+            next(steps)
+        except StopIteration:
+            self._reconcile = None
+            return
+        except Exception as e:
+            self._reconcile = None
+            self._log(f"Error refreshing queue view: {e}")
+            return
+        self._refresh_job = self.tree.after(1, self._run_refresh_chunk)
+
+    def _reconcile_steps(self, announce):
+        """Generator doing one chunk of reconciliation per step."""
+        wanted = list(self.saved)
+        if self._is_virtual():
+            self._hook_scroll()
+            wanted = wanted[:self._window]
+        wanted_set = set(wanted)
+
+        stale = [iid for iid in self.tree.get_children() if iid not in wanted_set and iid != self.MORE_IID]
+        if stale:
+            self.tree.delete(*stale)
+        for iid in stale:
+            self._shown.pop(iid, None)
+        yield
+
+        changed = 0
+        placed = []  # folders already reconciled, in queue order
+        for index, folder in enumerate(wanted, 1):
+            if index % self.CHUNK_ROWS == 0:
+                yield
+            if folder not in self.saved:
+                continue  # removed while the refresh was in progress
+            shown = self._shown.get(folder)
+            proposed = self._proposed_name(folder, self.saved_proposed.get(folder, shown))
+            if shown is None or not self.tree.exists(folder):
+                # Insert right after the previous reconciled row still in the tree. Its
+                # live index is used because rows may have been added or removed
+                # between chunks, which shifts every precomputed position.
+                while placed and not self.tree.exists(placed[-1]):
+                    placed.pop()
+                position = self.tree.index(placed[-1]) + 1 if placed else 0
+                self.tree.insert("", position, iid=folder, values=(folder, proposed))
+            elif proposed != shown:
+                self.tree.item(folder, values=(folder, proposed))
+                changed += 1
+            self._shown[folder] = proposed
+            self.saved_proposed[folder] = proposed
+            placed.append(folder)
+
+        self._update_more_row()
+        if announce:
+            self._log(f"Updated proposed names for {changed} queued folder(s).")
+
+    def _proposed_name(self, folder, current=None):
+        """Evaluate the current schemes for `folder`, keeping `current` if there is no evaluator."""
+        if not self.evaluate_schemes_func:
+            return current or ""
+        try:
+            return self.evaluate_schemes_func(self.saved_meta.get(folder, {}))
+        except Exception as e:
+            self._log(f"Error generating proposed name for {folder}: {e}")
+            return "Error generating name"
+
+    # ------------------------------------------------------------------
+    # virtual-list mode
+    # ------------------------------------------------------------------
+    def _is_virtual(self):
+        return len(self.saved) > self.VIRTUAL_THRESHOLD
+
+    def _window_full(self):
+        return self._is_virtual() and len(self._shown) >= self._window
+
+    def _update_more_row(self):
+        """Show, update or drop the placeholder row counting unmaterialized folders."""
+        remaining = len(self.saved) - len(self._shown)
+        exists = self.tree.exists(self.MORE_IID)
+        if remaining > 0 and self._is_virtual():
+            text = f"… {remaining} more queued folder(s), scroll down to load"
+            if exists:
+                self.tree.item(self.MORE_IID, values=(text, ""))
+                self.tree.move(self.MORE_IID, "", "end")
+            else:
+                self.tree.insert("", "end", iid=self.MORE_IID, values=(text, ""))
+            self._hook_scroll()
+        elif exists:
+            self.tree.delete(self.MORE_IID)
+
+    def _hook_scroll(self):
+        """Wrap the Treeview's yscrollcommand to load the next page at the bottom (once)."""
+        if self._scroll_hooked:
+            return
+        self._scroll_hooked = True
+        try:
+            original = self.tree.cget("yscrollcommand")
+            self._orig_yscroll = tuple(self.tree.tk.splitlist(original)) if original else ()
+            self.tree.configure(yscrollcommand=self._on_yscroll)
+        except tk.TclError:
+            pass
+
+    def _on_yscroll(self, first, last):
+        if self._orig_yscroll:
+            try:
+                self.tree.tk.call(*self._orig_yscroll, first, last)
+            except tk.TclError:
+                pass
+        if float(last) >= 1.0 and self._is_virtual() and len(self._shown) < len(self.saved) and self._refresh_job is None:
+            self._window = len(self._shown) + self.VIRTUAL_PAGE
+            self._refresh_job = self.tree.after_idle(self.refresh_ui)
 
     def refresh_ui_threadsafe(self):
         """
@@ -169,9 +452,4 @@ class QueueManager:
         return path.replace("\\", "/")
 
     def _log(self, msg: str):
-        if self.log:
-            try:
-                self.log.insert(tk.END, msg + "\n")
-                self.log.see(tk.END)
-            except Exception:
-                pass
\ No newline at end of file
+        write_log(self.log, msg + "\n")
\ No newline at end of file
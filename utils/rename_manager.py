@@ -3,6 +3,201 @@ from tkinter import ttk, filedialog
 import mutagen
 import re
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Files tagged in parallel when saving; tag writes are I/O bound (often on a network share)
+TAG_WRITE_WORKERS = 4
+# How often the Tk thread picks up finished tag writes
+SAVE_POLL_MS = 50
+# Widget rows created up front for the rename grid; more are added only if the window grows
+RENAME_POOL_ROWS = 15
+
+
+def write_track_tags(path, title, track_num, disc, total_discs):
+    """Write title/track/disc tags to one file. Returns True if saved, False if it has no tags."""
+    audio = mutagen.File(path, easy=True)
+    if not (audio and audio.tags):
+        return False
+    audio["title"] = title
+    audio["tracknumber"] = str(track_num)
+    # discnumber with total discs, e.g. "1/3"
+    audio["discnumber"] = f"{disc}/{total_discs}"
+    audio.save()
+    return True
+
+
+class RenameGrid(tk.Frame):
+    """
+    Editable (track no., original name, updated name) table over a plain list model.
+
+    Only a fixed pool of row widgets exists, enough to fill the visible area; scrolling
+    re-binds them to other model rows, so opening and scrolling cost O(visible rows)
+    whatever the track count. Edits are written straight back to `titles`.
+    """
+
+    def __init__(self, parent, pool_rows=RENAME_POOL_ROWS):
+        super().__init__(parent)
+        self.track_numbers = []
+        self.originals = []
+        self.titles = []
+        self.top = 0              # model index shown in the first pool row
+        self._visible = pool_rows
+        self._rendering = False
+        self._focus_index = None  # model row whose entry has focus
+        self._rows = []           # (number label, original label, StringVar, entry)
+
+        tk.Label(self, text="Track No.", font=("Segoe UI", 10, "bold")).grid(row=0, column=0, padx=15, pady=5)
+        tk.Label(self, text="Original Name", font=("Segoe UI", 10, "bold")).grid(row=0, column=1, padx=15, pady=5)
+        tk.Label(self, text="Updated Name", font=("Segoe UI", 10, "bold")).grid(row=0, column=2, padx=15, pady=5)
+
+        self.body = tk.Frame(self)
+        self.body.grid(row=1, column=0, columnspan=3, sticky="nsew")
+        self.body.grid_columnconfigure(1, weight=1)
+        self.body.grid_columnconfigure(2, weight=1)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=3, sticky="ns")
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(1, weight=1)
+        self.grid_columnconfigure(2, weight=1)
+
+        for _ in range(pool_rows):
+            self._add_row()
+        self.body.bind("<Configure>", self._on_resize)
+        self._bind_wheel(self.body)
+
+    # ------------------------------------------------------------------
+    # model
+    # ------------------------------------------------------------------
+    def set_data(self, track_numbers, originals):
+        self.track_numbers = list(track_numbers)
+        self.originals = list(originals)
+        self.titles = list(originals)
+        self.top = 0
+        self._render()
+
+    def set_titles(self, titles, start=0):
+        """Overwrite titles from `start` on (extra values are ignored) and redraw."""
+        for offset, title in enumerate(titles):
+            if start + offset >= len(self.titles):
+                break
+            self.titles[start + offset] = title
+        self._render()
+
+    def focused_index(self):
+        return self._focus_index
+
+    # ------------------------------------------------------------------
+    # widget pool
+    # ------------------------------------------------------------------
+    def _add_row(self):
+        slot = len(self._rows)
+        number = tk.Label(self.body, anchor="e", width=6)
+        original = tk.Label(self.body, anchor="w")
+        var = tk.StringVar()
+        entry = tk.Entry(self.body, font=("Segoe UI", 10), textvariable=var)
+        number.grid(row=slot, column=0, padx=5, pady=2, sticky="e")
+        original.grid(row=slot, column=1, padx=5, pady=2, sticky="we")
+        entry.grid(row=slot, column=2, padx=5, pady=2, sticky="we")
+        var.trace_add("write", lambda *_: self._on_edit(slot))
+        entry.bind("<FocusIn>", lambda e: self._on_focus(slot))
+        entry.bind("<Up>", lambda e: self._move_focus(slot, -1))
+        entry.bind("<Down>", lambda e: self._move_focus(slot, 1))
+        entry.bind("<Return>", lambda e: self._move_focus(slot, 1))
+        entry.bind("<Prior>", lambda e: self._move_focus(slot, -self._visible))
+        entry.bind("<Next>", lambda e: self._move_focus(slot, self._visible))
+        for widget in (number, original, entry):
+            self._bind_wheel(widget)
+        self._rows.append((number, original, var, entry))
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1) or "break")
+        widget.bind("<Button-4>", lambda e: self.scroll(-1) or "break")
+        widget.bind("<Button-5>", lambda e: self.scroll(1) or "break")
+
+    def _on_resize(self, event):
+        row_height = self._rows[0][3].winfo_reqheight() + 4
+        fits = max(1, event.height // row_height)
+        while len(self._rows) < fits:
+            self._add_row()
+        if fits != self._visible:
+            self._visible = fits
+            self.top = min(self.top, self._max_top())
+            self._render()
+
+    def _max_top(self):
+        return max(0, len(self.titles) - self._visible)
+
+    def _render(self):
+        self._rendering = True
+        try:
+            for slot, (number, original, var, entry) in enumerate(self._rows):
+                index = self.top + slot
+                if slot >= self._visible or index >= len(self.titles):
+                    number.grid_remove()
+                    original.grid_remove()
+                    entry.grid_remove()
+                    continue
+                number.grid()
+                original.grid()
+                entry.grid()
+                number.config(text=self.track_numbers[index])
+                original.config(text=self.originals[index])
+                if var.get() != self.titles[index]:
+                    var.set(self.titles[index])
+        finally:
+            self._rendering = False
+        total = len(self.titles)
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + self._visible) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    # ------------------------------------------------------------------
+    # editing / navigation
+    # ------------------------------------------------------------------
+    def _on_edit(self, slot):
+        if self._rendering:
+            return
+        index = self.top + slot
+        if index < len(self.titles):
+            self.titles[index] = self._rows[slot][2].get()
+
+    def _on_focus(self, slot):
+        self._focus_index = self.top + slot
+
+    def _move_focus(self, slot, delta):
+        index = max(0, min(len(self.titles) - 1, self.top + slot + delta))
+        self.see(index)
+        entry = self._rows[index - self.top][3]
+        entry.focus_set()
+        entry.icursor(tk.END)
+        return "break"
+
+    def see(self, index):
+        if index < self.top:
+            self.top = index
+        elif index >= self.top + self._visible:
+            self.top = index - self._visible + 1
+        else:
+            return
+        self._render()
+
+    def scroll(self, rows):
+        top = max(0, min(self._max_top(), self.top + rows))
+        if top != self.top:
+            self.top = top
+            self._render()
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self.top = max(0, min(self._max_top(), int(round(float(args[1]) * len(self.titles)))))
+            self._render()
+        elif args[0] == "scroll":
+            step = self._visible if args[2] == "pages" else 1
+            self.scroll(int(args[1]) * step)
+
 
 class RenameManager:
     def __init__(self, parent, audio_player, audio_list, audio_files, log_insert):
@@ -13,10 +208,11 @@ class RenameManager:
         self.log_insert = log_insert
         self.rename_window = None
         self.track_titles_txt = []
-        self.track_title_entries = []
-        self.track_frame = None
-        self.canvas = None
+        self.track_grid = None
         self.total_discs = 1
+        self.save_button = None
+        self.save_status = None
+        self._saving = False
 
     def _open_rename_window(self):
         """Open or focus the rename window."""
@@ -33,53 +229,36 @@ class RenameManager:
         self.rename_window.after(100, lambda: self.rename_window.attributes("-topmost", 1))
 
         rename_frame = tk.Frame(self.rename_window, padx=10, pady=10)
-        rename_frame.grid(row=0, column=0, sticky="nsew")
+        rename_frame.grid(row=0, column=0, columnspan=3, sticky="nsew")
 
         title_label = tk.Label(rename_frame, text="Rename Track Titles", font=("Segoe UI", 14, "bold"))
         title_label.grid(row=0, column=0, columnspan=3, pady=10)
 
-        self.track_frame = tk.Frame(rename_frame)
-        self.track_frame.grid(row=1, column=0, columnspan=3, padx=10, pady=10, sticky="nsew")
-
-        tk.Label(self.track_frame, text="Track No.", font=("Segoe UI", 10, "bold")).grid(row=0, column=0, padx=15, pady=5)
-        tk.Label(self.track_frame, text="Original Name", font=("Segoe UI", 10, "bold")).grid(row=0, column=1, padx=15, pady=5)
-        tk.Label(self.track_frame, text="Updated Name", font=("Segoe UI", 10, "bold")).grid(row=0, column=2, padx=15, pady=5)
-
-        self.canvas = tk.Canvas(self.track_frame)
-        scrollbar = ttk.Scrollbar(self.track_frame, orient="vertical", command=self.canvas.yview)
-        self.canvas.configure(yscrollcommand=scrollbar.set)
-
-        track_list_frame = tk.Frame(self.canvas)
-        self.canvas.create_window((0, 0), window=track_list_frame, anchor="nw")
-        self.canvas.grid(row=1, column=0, columnspan=3, padx=10, pady=10, sticky="nsew")
-        scrollbar.grid(row=1, column=3, sticky="ns")
-
-        self.track_title_entries = []
-
-        track_names = [self.audio_list.item(child)["values"][1] for child in self.audio_list.get_children()]
         track_numbers = [self.audio_list.item(child)["values"][0] for child in self.audio_list.get_children()]
+        track_names = [self.audio_list.item(child)["values"][1] for child in self.audio_list.get_children()]
 
         if not track_names:
             self.log_insert("[ERROR] No tracks available to rename.")
             return
 
-        for i, (track_no, track) in enumerate(zip(track_numbers, track_names)):
-            tk.Label(track_list_frame, text=track_no).grid(row=i, column=0, padx=5, pady=5, sticky="e")
-            tk.Label(track_list_frame, text=track, anchor="w").grid(row=i, column=1, padx=5, pady=5, sticky="w")
+        self.track_grid = RenameGrid(rename_frame)
+        self.track_grid.grid(row=1, column=0, columnspan=3, padx=10, pady=10, sticky="nsew")
+        self.track_grid.set_data(track_numbers, track_names)
+        rename_frame.grid_rowconfigure(1, weight=1)
+        rename_frame.grid_columnconfigure(0, weight=1)
 
-            updated_entry = tk.Entry(track_list_frame, font=("Segoe UI", 10))
-            updated_entry.grid(row=i, column=2, padx=5, pady=5, sticky="w")
-            updated_entry.insert(0, track)
-            self.track_title_entries.append(updated_entry)
+        paste_button = ttk.Button(
+            rename_frame, text="Paste Column", command=self.paste_column
+        )
+        paste_button.grid(row=2, column=0, columnspan=3, pady=(0, 5))
 
         import_button = ttk.Button(self.rename_window, text="Import .txt File", command=self.import_txt_file)
         import_button.grid(row=2, column=0, columnspan=3, pady=10)
 
-        save_button = ttk.Button(self.rename_window, text="Save Changes", command=self.save_changes)
-        save_button.grid(row=3, column=0, columnspan=3, pady=10)
-
-        track_list_frame.update_idletasks()
-        self.canvas.config(scrollregion=self.canvas.bbox("all"))
+        self.save_button = ttk.Button(self.rename_window, text="Save Changes", command=self.save_changes)
+        self.save_button.grid(row=3, column=0, columnspan=3, pady=10)
+        self.save_status = tk.Label(self.rename_window, text="")
+        self.save_status.grid(row=4, column=0, columnspan=3)
 
         self.rename_window.grid_rowconfigure(0, weight=1)
         self.rename_window.grid_rowconfigure(1, weight=1)
@@ -123,47 +302,103 @@ class RenameManager:
             self.rename_window.focus_force()
 
     def save_changes(self):
-        updated_titles = [entry.get() for entry in self.track_title_entries]
+        """
+        Collect every changed title first, write the tags on a worker pool and update
+        the Treeview once when all writes are done, so the window stays responsive.
+        """
+        if self._saving:
+            return
+        updated_titles = list(self.track_grid.titles) if self.track_grid else []
 
         if len(updated_titles) != len(self.audio_files):
             self.log_insert(f"[ERROR] Track count mismatch: {len(updated_titles)} updated titles vs {len(self.audio_files)} audio files.")
             return
 
         total_discs = getattr(self, 'total_discs', 1)  # default 1 if not set
+        rows = self.audio_list.get_children()
 
+        changes = []
         for idx, updated_title in enumerate(updated_titles):
-            old_title = self.audio_list.item(self.audio_list.get_children()[idx])["values"][1]
-
-            if old_title != updated_title:
-                if idx < len(self.track_titles_txt):
-                    disc, track_num, _, _ = self.track_titles_txt[idx]
-                else:
-                    disc, track_num = 1, idx + 1
-
-                track_number_gui = f"{disc}.{track_num}"
-
-                self.audio_list.item(self.audio_list.get_children()[idx], values=(track_number_gui, updated_title))
-                self.log_insert(f"[INFO] Renamed track in GUI: '{old_title}' → '{updated_title}'")
+            values = list(self.audio_list.item(rows[idx])["values"])
+            old_title = values[1]
+            if old_title == updated_title:
+                continue
+            if idx < len(self.track_titles_txt):
+                disc, track_num, _, _ = self.track_titles_txt[idx]
+            else:
+                disc, track_num = 1, idx + 1
+            changes.append({
+                "row": rows[idx],
+                "values": values,
+                "path": self.audio_files[idx],
+                "old_title": old_title,
+                "title": updated_title,
+                "disc": disc,
+                "track_num": track_num,
+            })
+
+        if not changes:
+            self._close_rename_window()
+            return
 
-                try:
-                    audio_file_path = self.audio_files[idx]
-                    audio = mutagen.File(audio_file_path, easy=True)
+        self._saving = True
+        if self.save_button is not None:
+            self.save_button.config(state=tk.DISABLED)
+        results = queue.Queue()
+
+        def work():
+            with ThreadPoolExecutor(max_workers=TAG_WRITE_WORKERS) as pool:
+                futures = [
+                    pool.submit(write_track_tags, c["path"], c["title"], c["track_num"], c["disc"], total_discs)
+                    for c in changes
+                ]
+                for change, future in zip(changes, futures):
+                    try:
+                        results.put((change, future.result(), None))
+                    except Exception as e:
+                        results.put((change, False, e))
 
-                    if audio and audio.tags:
-                        audio["title"] = updated_title
-                        audio["tracknumber"] = str(track_num)
-                        # discnumber with total discs, e.g. "1/3"
-                        audio["discnumber"] = f"{disc}/{total_discs}"
-                        audio.save()
-                        self.log_insert(f"[INFO] Updated metadata for {audio_file_path}.")
+        threading.Thread(target=work, daemon=True).start()
+        self.parent.after(SAVE_POLL_MS, lambda: self._poll_save(changes, results, 0))
 
-                        file_name = os.path.basename(audio_file_path)
-                        self.audio_list.item(self.audio_list.get_children()[idx], values=(track_number_gui, updated_title, file_name))
-                    else:
-                        self.log_insert(f"[WARN] No tags found in {audio_file_path}, skipping metadata update.")
-                except Exception as e:
-                    self.log_insert(f"[ERROR] Failed to update metadata for {self.audio_files[idx]}: {e}")
+    def _poll_save(self, changes, results, done):
+        try:
+            while True:
+                change, saved, error = results.get_nowait()
+                done += 1
+                path = change["path"]
+                change["saved"] = saved
+                if error is not None:
+                    self.log_insert(f"[ERROR] Failed to update metadata for {path}: {error}")
+                elif saved:
+                    self.log_insert(f"[INFO] Updated metadata for {path}.")
+                else:
+                    self.log_insert(f"[WARN] No tags found in {path}, skipping metadata update.")
+        except queue.Empty:
+            pass
+
+        if self.save_status is not None and self.save_status.winfo_exists():
+            self.save_status.config(text=f"Saving tags: {done}/{len(changes)}")
+        if done < len(changes):
+            self.parent.after(SAVE_POLL_MS, lambda: self._poll_save(changes, results, done))
+            return
 
+        # Single pass over the Treeview once every file has been written
+        try:
+            for change in changes:
+                if not self.audio_list.exists(change["row"]):
+                    continue  # row was removed (list reloaded) while saving
+                values = change["values"]
+                values[0] = f"{change['disc']}.{change['track_num']}"
+                values[1] = change["title"]
+                if change.get("saved"):
+                    values[2:3] = [os.path.basename(change["path"])]
+                self.audio_list.item(change["row"], values=values)
+                self.log_insert(f"[INFO] Renamed track in GUI: '{change['old_title']}' → '{change['title']}'")
+        finally:
+            self._saving = False
+            if self.save_button is not None and self.save_button.winfo_exists():
+                self.save_button.config(state=tk.NORMAL)
         self._close_rename_window()
 
     def _load_txt_tracklist(self, txt_path):
@@ -206,18 +441,25 @@ class RenameManager:
         if not self.rename_window or not self.rename_window.winfo_exists():
             return
 
-        if not self.track_title_entries:
+        if not self.track_grid or not self.track_grid.titles:
             return
 
         if self.track_titles_txt:
-            for idx, (_, _, _, track_name) in enumerate(self.track_titles_txt):
-                if idx < len(self.track_title_entries):
-                    try:
-                        self.track_title_entries[idx].delete(0, tk.END)
-                        self.track_title_entries[idx].insert(0, track_name)
-                    except tk.TclError:
-                        continue
+            self.track_grid.set_titles([track_name for _, _, _, track_name in self.track_titles_txt])
 
-            if self.canvas and self.canvas.winfo_exists():
-                self.canvas.update_idletasks()
-                self.canvas.config(scrollregion=self.canvas.bbox("all"))
+    def paste_column(self):
+        """Fill the Updated Name column from clipboard lines, starting at the focused row (or the first)."""
+        if not self.track_grid:
+            return
+        try:
+            text = self.rename_window.clipboard_get()
+        except tk.TclError:
+            self.log_insert("[WARN] Clipboard is empty.")
+            return
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        if not lines:
+            return
+        start = self.track_grid.focused_index() or 0
+        self.track_grid.set_titles(lines, start=start)
+        pasted = min(len(lines), len(self.track_grid.titles) - start)
+        self.log_insert(f"[INFO] Pasted {pasted} title(s) into the rename list.")
@@ -1,11 +1,15 @@
 import re
 import os
+import logging
 import configparser
 import pathlib
 from pathlib import Path
 
 CONFIG_PATH = Path("config/config.ini")
 
+# Debug output of evaluate(); level set from config.ini (see utils.log_config)
+logger = logging.getLogger("tagforge.scheme_evaluator")
+
 class SchemeEvaluator:
     def __init__(self, folder_scheme, saving_scheme, log_func=None):
         self.folder_scheme = folder_scheme
@@ -31,7 +35,7 @@ class SchemeEvaluator:
         else:
             md_extended.setdefault("currentfoldername", "")
 
-        self.log(f"Evaluating folder scheme with metadata: {md_extended}", level="debug")
+        logger.debug("Evaluating folder scheme with metadata: %s", md_extended)
 
         def replace_token(match):
             token = match.group(1).lower()
@@ -72,7 +76,7 @@ class SchemeEvaluator:
         # Insert the evaluated folder scheme as 'foldername' token in metadata
         md_extended["foldername"] = folder_eval
 
-        self.log(f"Folder scheme evaluated to: {folder_eval}", level="debug")
+        logger.debug("Folder scheme evaluated to: %s", folder_eval)
 
         # --- Evaluate saving scheme with extended metadata ---
         def replace_token_saving(match):
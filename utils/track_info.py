@@ -0,0 +1,86 @@
+# utils/track_info.py
+import os
+import threading
+from collections import OrderedDict
+
+import mutagen
+
+PLAYABLE_EXTENSIONS = ('.mp3', '.flac', '.wav', '.ogg')
+
+# Folders / files remembered before the least recently used ones are dropped
+MAX_CACHED_FOLDERS = 200
+MAX_CACHED_FILES = 20000
+
+
+def read_track_info(path):
+    """Read title, length (seconds) and bitrate (bits/s) of one audio file; missing values are empty/0."""
+    info = {"title": "", "length": 0.0, "bitrate": 0}
+    audio = mutagen.File(path, easy=True)
+    if audio is None:
+        return info
+    # easy=True maps ID3 frames (TIT2) to "title" as well, so MP3s get titles too
+    titles = audio.get("title") if audio.tags is not None else None
+    if titles:
+        info["title"] = str(titles[0])
+    stream = getattr(audio, "info", None)
+    if stream is not None:
+        info["length"] = float(getattr(stream, "length", 0.0) or 0.0)
+        info["bitrate"] = int(getattr(stream, "bitrate", 0) or 0)
+    return info
+
+
+def _signature(st):
+    return st.st_mtime_ns, st.st_size
+
+
+class TrackInfoCache:
+    """
+    In-memory cache of folder listings and per-file track info.
+
+    A folder's audio listing is reused while the folder's mtime is unchanged, and a
+    file's info while its (mtime, size) is unchanged, so revisiting a show only costs
+    a stat per file. Both maps are LRU-bounded. Safe to use from worker threads.
+    """
+
+    def __init__(self, max_folders=MAX_CACHED_FOLDERS, max_files=MAX_CACHED_FILES):
+        self.max_folders = max_folders
+        self.max_files = max_files
+        self._lock = threading.Lock()
+        self._folders = OrderedDict()  # folder -> (mtime_ns, [file names])
+        self._files = OrderedDict()    # path -> (signature, info)
+
+    @staticmethod
+    def _remember(table, key, value, limit):
+        table[key] = value
+        table.move_to_end(key)
+        while len(table) > limit:
+            table.popitem(last=False)
+
+    def list_audio_files(self, folder):
+        """Sorted names of the playable files in `folder`. Raises OSError if it cannot be listed."""
+        mtime = os.stat(folder).st_mtime_ns
+        with self._lock:
+            cached = self._folders.get(folder)
+            if cached is not None and cached[0] == mtime:
+                self._folders.move_to_end(folder)
+                return list(cached[1])
+        names = sorted(f for f in os.listdir(folder) if f.lower().endswith(PLAYABLE_EXTENSIONS))
+        with self._lock:
+            self._remember(self._folders, folder, (mtime, names), self.max_folders)
+        return list(names)
+
+    def get(self, path):
+        """Track info for `path`, read from disk only if the file changed since it was cached."""
+        signature = _signature(os.stat(path))
+        with self._lock:
+            cached = self._files.get(path)
+            if cached is not None and cached[0] == signature:
+                self._files.move_to_end(path)
+                return cached[1]
+        info = read_track_info(path)
+        with self._lock:
+            self._remember(self._files, path, (signature, info), self.max_files)
+        return info
+
+
+TRACK_INFO_CACHE = TrackInfoCache()
@@ -1,11 +1,18 @@
 import os
 import re
+from utils.match_folder import folded_pairs
+from utils.alias_table import ALIASES
 
 class TxtMetadataParser:
-    def __init__(self, artists_list=None, venues_list=None, cities_list=None):
+    def __init__(self, artists_list=None, venues_list=None, cities_list=None, aliases=ALIASES):
         self.artists_list = artists_list or []
         self.venues_list = venues_list or []
         self.cities_list = cities_list or []
+        self.aliases = aliases
+        # Casefolded (key, value) pairs; prebuilt per version when given AssetSnapshots
+        self._artist_pairs = folded_pairs(self.artists_list)
+        self._venue_pairs = folded_pairs(self.venues_list)
+        self._city_pairs = folded_pairs(self.cities_list)
 
     def parse(self, folder_path, audio_basename=None, log_func=None):
         if log_func is None:
@@ -82,8 +89,9 @@ class TxtMetadataParser:
             # Fallback: try to find known artists if none found
             if not artist and self.artists_list:
                 for line in lines:
-                    for a in self.artists_list:
-                        if a.lower() in line.lower():
+                    line_folded = line.casefold()
+                    for folded, a in self._artist_pairs:
+                        if folded in line_folded:
                             artist = a
                             break
                     if artist:
@@ -92,8 +100,9 @@ class TxtMetadataParser:
             # Fallback: try to find known venues if none found
             if not venue and self.venues_list:
                 for line in lines:
-                    for v in self.venues_list:
-                        if v.lower() in line.lower():
+                    line_folded = line.casefold()
+                    for folded, v in self._venue_pairs:
+                        if folded in line_folded:
                             venue = v
                             break
                     if venue:
@@ -102,8 +111,9 @@ class TxtMetadataParser:
             # Fallback: try to find known cities if none found
             if not city and self.cities_list:
                 for line in lines:
-                    for c in self.cities_list:
-                        if c.lower() in line.lower():
+                    line_folded = line.casefold()
+                    for folded, c in self._city_pairs:
+                        if folded in line_folded:
                             city = c
                             break
                     if city:
@@ -126,6 +136,12 @@ class TxtMetadataParser:
                 elif "mp3" in ab:
                     fmt = "MP3"
 
+            # Map aliases to their canonical spelling
+            if self.aliases is not None:
+                artist = self.aliases.canonical("artist", artist)
+                venue = self.aliases.canonical("venue", venue)
+                city = self.aliases.canonical("city", city)
+
             # Build metadata dictionary only if values are present
             if artist:
                 metadata['artist'] = artist
@@ -0,0 +1,187 @@
+# utils/usage_stats.py
+import os
+import json
+import math
+import time
+import threading
+from bisect import bisect_left
+
+from utils.constants import USAGE_STATS_FILE
+
+# A use this many days old counts half as much as a use right now
+HALF_LIFE_DAYS = 30.0
+_HALF_LIFE_SECONDS = HALF_LIFE_DAYS * 86400.0
+
+
+def _log2_add(a, b):
+    """log2(2**a + 2**b) without overflowing."""
+    if a == -math.inf:
+        return b
+    hi, lo = (a, b) if a >= b else (b, a)
+    return hi + math.log2(1.0 + 2.0 ** (lo - hi))
+
+
+class UsageStats:
+    """
+    Per-field selection counts, last-used timestamps and a decayed frecency score.
+
+    Each use adds 2**(t / half_life) to a value's score. Because every score decays
+    at the same rate, the relative order never changes with time alone, so scores
+    are stored (in log2 space) and updated incrementally on each use instead of being
+    recomputed. Each field keeps its used values pre-sorted by score; a per-field
+    version lets widgets rebuild their ordering only when something was recorded.
+    """
+
+    def __init__(self, path=USAGE_STATS_FILE, log_func=None):
+        self.path = path
+        self.log = log_func or (lambda msg, level="info": None)
+        self._lock = threading.RLock()
+        self._entries = {}   # field -> {casefolded value: {"value", "count", "last_used", "score"}}
+        self._order = {}     # field -> casefolded values, best score first
+        self._neg_scores = {}  # field -> negated scores parallel to _order (ascending, for bisect)
+        self._versions = {}
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # persistence
+    # ------------------------------------------------------------------
+    def load(self):
+        if not os.path.exists(self.path):
+            return self
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            self.log(f"[ERROR] Failed to load usage stats: {e}", level="error")
+            return self
+        with self._lock:
+            for field, values in data.items():
+                entries = self._entries.setdefault(field, {})
+                for value, rec in values.items():
+                    entries[value.casefold()] = {
+                        "value": value,
+                        "count": int(rec.get("count", 0)),
+                        "last_used": float(rec.get("last_used", 0.0)),
+                        "score": float(rec.get("score", -math.inf)),
+                    }
+                self._rebuild_order(field)
+        return self
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                field: {
+                    rec["value"]: {"count": rec["count"], "last_used": rec["last_used"], "score": rec["score"]}
+                    for rec in entries.values()
+                }
+                for field, entries in self._entries.items()
+            }
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            self.log("Usage stats saved.", level="debug")
+        except Exception as e:
+            self.log(f"[ERROR] Failed to save usage stats: {e}", level="error")
+
+    # ------------------------------------------------------------------
+    # recording
+    # ------------------------------------------------------------------
+    def record(self, field, value, when=None):
+        """Record one selection of `value` for `field` and update its score in place."""
+        value = (value or "").strip()
+        if not value:
+            return
+        when = time.time() if when is None else when
+        key = value.casefold()
+        with self._lock:
+            entries = self._entries.setdefault(field, {})
+            rec = entries.get(key)
+            if rec is None:
+                rec = entries[key] = {"value": value, "count": 0, "last_used": 0.0, "score": -math.inf}
+            else:
+                self._remove_from_order(field, key, rec["score"])
+            rec["value"] = value
+            rec["count"] += 1
+            rec["last_used"] = max(rec["last_used"], when)
+            rec["score"] = _log2_add(rec["score"], when / _HALF_LIFE_SECONDS)
+            self._insert_into_order(field, key, rec["score"])
+            self._versions[field] = self._versions.get(field, 0) + 1
+            self._dirty = True
+
+    def _rebuild_order(self, field):
+        entries = self._entries.get(field, {})
+        order = sorted(entries, key=lambda k: -entries[k]["score"])
+        self._order[field] = order
+        self._neg_scores[field] = [-entries[k]["score"] for k in order]
+        self._versions[field] = self._versions.get(field, 0) + 1
+
+    def _remove_from_order(self, field, key, score):
+        order = self._order.setdefault(field, [])
+        neg_scores = self._neg_scores.setdefault(field, [])
+        i = bisect_left(neg_scores, -score)
+        while i < len(order) and order[i] != key:
+            i += 1
+        if i < len(order):
+            del order[i]
+            del neg_scores[i]
+
+    def _insert_into_order(self, field, key, score):
+        order = self._order.setdefault(field, [])
+        neg_scores = self._neg_scores.setdefault(field, [])
+        i = bisect_left(neg_scores, -score)
+        order.insert(i, key)
+        neg_scores.insert(i, -score)
+
+    # ------------------------------------------------------------------
+    # queries
+    # ------------------------------------------------------------------
+    def version(self, field):
+        return self._versions.get(field, 0)
+
+    def score(self, field, value):
+        rec = self._entries.get(field, {}).get((value or "").casefold())
+        return rec["score"] if rec else -math.inf
+
+    def count(self, field, value):
+        rec = self._entries.get(field, {}).get((value or "").casefold())
+        return rec["count"] if rec else 0
+
+    def order(self, field, values):
+        """
+        Return `values` with used entries first (best score first), then the rest in
+        their given order. Cost is O(n) over `values`; call it when version() changes.
+        """
+        with self._lock:
+            ranked_keys = self._order.get(field, [])
+            if not ranked_keys:
+                return list(values)
+            by_key = {}
+            for v in values:
+                by_key.setdefault(v.casefold(), v)
+            ranked = [by_key[k] for k in ranked_keys if k in by_key]
+            ranked_set = set(ranked)
+            return ranked + [v for v in values if v not in ranked_set]
+
+    def prefix_hits(self, field, prefix, lookup, limit):
+        """
+        Return up to `limit` used values of `field` starting with `prefix`, best score
+        first, by walking the pre-sorted order (nothing is sorted per call).
+        `lookup(casefolded value)` maps a candidate to the caller's entry, or None to
+        skip values the caller does not list.
+        """
+        prefix = (prefix or "").casefold()
+        hits = []
+        with self._lock:
+            for key in self._order.get(field, ()):
+                if not key.startswith(prefix):
+                    continue
+                value = lookup(key)
+                if value is not None:
+                    hits.append(value)
+                    if len(hits) >= limit:
+                        break
+        return hits